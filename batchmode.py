@@ -1,10 +1,36 @@
 import os
 import re
-from PyQt6.QtCore import QObject, pyqtSignal, QThread
+from array import array
+from PyQt6.QtCore import QObject, pyqtSignal, QThread, QTimer
 from yt_dlp import YoutubeDL
 from settings import AppSettings
 from urllib.parse import urlparse, parse_qs
 
+# Queue placeholder for playlist items that are resolved to URLs on demand
+PLAYLIST_ITEM_PREFIX = 'PLAYLIST_ITEM_'
+_PLAYLIST_ITEM_PREFIX_LEN = len(PLAYLIST_ITEM_PREFIX)
+_WATCH_URL_PREFIX = 'https://www.youtube.com/watch?v='
+
+
+def _collect_entry_urls(entries) -> list:
+    """Build watch URLs from flat-extracted playlist entries."""
+    entry_urls = []
+    append = entry_urls.append
+    watch = _WATCH_URL_PREFIX
+    for e in entries:
+        if isinstance(e, dict):
+            get = e.get
+            url = get('url')
+            if url:
+                append(url)
+            else:
+                vid = get('id')
+                if vid:
+                    append(f"{watch}{vid}")
+        elif isinstance(e, str):
+            append(e)
+    return entry_urls
+
 
 class PlaylistInfoExtractor(QThread):
     """Extract basic playlist information quickly."""
@@ -23,6 +49,11 @@ class PlaylistInfoExtractor(QThread):
                 'extract_flat': True,
                 'quiet': True,
                 'no_warnings': True,
+                'skip_download': True,
+                # Only ids/urls are needed; skip per-video manifest fetches
+                'youtube_include_dash_manifest': False,
+                'youtube_include_hls_manifest': False,
+                'compat_opts': ['no-youtube-unavailable-videos'],
                 'socket_timeout': 20,
                 'extractor_args': {
                     'youtube': {
@@ -43,16 +74,8 @@ class PlaylistInfoExtractor(QThread):
                 return
 
             # Build entry URLs list
-            entry_urls = []
             try:
-                for e in full_info.get('entries', []) or []:
-                    if isinstance(e, dict):
-                        if e.get('url'):
-                            entry_urls.append(e['url'])
-                        elif e.get('id'):
-                            entry_urls.append(f"https://www.youtube.com/watch?v={e['id']}")
-                    elif isinstance(e, str):
-                        entry_urls.append(e)
+                entry_urls = _collect_entry_urls(full_info.get('entries', []) or [])
             except Exception:
                 entry_urls = []
 
@@ -127,25 +150,34 @@ class BatchModeManager(QObject):
         self.current_playlist_info = None
         self.playlist_current_index = 0
         self.playlist_max_items = None
+        # URL-building invariants, precomputed per playlist
+        self._url_cache_source = None
+        self._playlist_entries = []
+        self._entry_has_query = []
+        self._playlist_list_param = ''
+        # Per-item dict templates, rebuilt only when settings/playlist change
+        self._item_template_regular = None
+        self._item_template_playlist = None
+
+        # Signal coalescing for bulk adds
+        self._queue_update_pending = False
+        self._last_warning_bucket = None
 
     def is_playlist_url(self, url):
         """Check if URL is a playlist, including YouTube Mix (list=RD...)."""
+        if not isinstance(url, str):
+            return False
         try:
             parsed = urlparse(url)
-            host = parsed.netloc.lower()
-            path = parsed.path.lower()
-            qs = parse_qs(parsed.query)
-            list_id = None
-            if qs.get('list'):
-                list_id = qs.get('list')[0] if qs.get('list') else None
-            if 'youtube.com' in host and '/playlist' in path and list_id:
-                return True
-            if 'youtube.com' in host and '/watch' in path and list_id:
-                # Treat playlists and Mix as playlists
-                return True
-            return False
-        except Exception:
+        except ValueError:
             return False
+        host = parsed.netloc.lower()
+        path = parsed.path.lower()
+        list_id = parse_qs(parsed.query).get('list')
+        if 'youtube.com' in host and list_id and list_id[0]:
+            # Treat playlists and Mix as playlists
+            return '/playlist' in path or '/watch' in path
+        return False
 
     def handle_playlist_url(self, url, queue_limit=None):
         """Process playlist URL - get basic info only"""
@@ -171,23 +203,33 @@ class BatchModeManager(QObject):
 
         return True
 
+    def _prepare_playlist_url_cache(self, playlist_info):
+        """Precompute per-playlist values used by get_playlist_video_url."""
+        entries = playlist_info.get('entries') or []
+        self._playlist_entries = entries
+        self._entry_has_query = [isinstance(e, str) and '?' in e for e in entries]
+        # Prefer the explicit list_id captured from URL; fall back to extractor id
+        list_id = playlist_info.get('list_id') or playlist_info.get('id') or ''
+        self._playlist_list_param = f"list={list_id}&index=" if list_id else ''
+        self._url_cache_source = playlist_info
+
     def on_playlist_info_extracted(self, playlist_info, queue_limit):
         """Handle successful playlist info extraction"""
         self.current_playlist_info = playlist_info
         self.playlist_current_index = 0
+        self._prepare_playlist_url_cache(playlist_info)
+        self._invalidate_item_templates()
+        self._reset_limit_notifications()
         self.playlist_detected.emit(playlist_info)
 
         # Auto-enable batch mode if not enabled
         if not self.is_batch_mode:
             self.enable_batch_mode()
 
-        # Generate videos on-demand
-        self.batch_queue = []
-
         # Add placeholder entries
         try:
             total = int(playlist_info.get('video_count', 0))
-        except Exception:
+        except (TypeError, ValueError):
             total = len(playlist_info.get('entries', [])) if isinstance(playlist_info.get('entries'), list) else 0
         # Apply limits
         max_items = total
@@ -195,9 +237,9 @@ class BatchModeManager(QObject):
             max_items = min(max_items, queue_limit)
         if isinstance(self.playlist_max_items, int) and self.playlist_max_items > 0:
             max_items = min(max_items, self.playlist_max_items)
-        for i in range(max_items):
-            # Store index instead of URL - we'll generate URLs on demand
-            self.batch_queue.append(f"PLAYLIST_ITEM_{i + 1}")
+        # Store 1-based item numbers instead of URLs - we'll generate URLs on demand.
+        # A compact int array keeps reorders a cheap memmove for large playlists.
+        self.batch_queue = array('I', range(1, max_items + 1))
 
         title = playlist_info['title']
         count = max_items
@@ -217,35 +259,26 @@ class BatchModeManager(QObject):
         if not self.current_playlist_info:
             return None
 
-        # Prefer exact entry URL if available
-        try:
-            entries = self.current_playlist_info.get('entries') or []
-            if 0 <= index < len(entries):
-                entry_url = entries[index]
-            else:
-                entry_url = None
-        except Exception:
-            entry_url = None
+        # current_playlist_info may be replaced externally; rebuild lazily
+        if self._url_cache_source is not self.current_playlist_info:
+            self._prepare_playlist_url_cache(self.current_playlist_info)
 
-        # Prefer the explicit list_id captured from URL; fall back to extractor id
-        list_id = (
-            self.current_playlist_info.get('list_id')
-            or self.current_playlist_info.get('id')
-            or ''
-        )
+        # Prefer exact entry URL if available
+        entries = self._playlist_entries
+        list_param = self._playlist_list_param
+        entry_url = entries[index] if 0 <= index < len(entries) else None
         if entry_url:
-            # Append list context if available
-            sep = '&' if '?' in entry_url else '?'
-            if list_id:
-                return f"{entry_url}{sep}list={list_id}&index={index + 1}"
+            if list_param:
+                sep = '&' if self._entry_has_query[index] else '?'
+                return f"{entry_url}{sep}{list_param}{index + 1}"
             return entry_url
 
         # Fallback to playlist URL with index hint
         playlist_url = self.current_playlist_info.get('url', '')
         if playlist_url:
             sep = '&' if '?' in playlist_url else '?'
-            if list_id:
-                return f"{playlist_url}{sep}list={list_id}&index={index + 1}"
+            if list_param:
+                return f"{playlist_url}{sep}{list_param}{index + 1}"
             return f"{playlist_url}{sep}index={index + 1}"
         return None
 
@@ -261,6 +294,8 @@ class BatchModeManager(QObject):
             'container_override': (container_override or None),
             'audio_override': (audio_override or None),
         }
+        self._invalidate_item_templates()
+        self._reset_limit_notifications()
         self.batch_queue = []
         self.current_batch_index = 0
         self.successful_downloads = 0
@@ -289,6 +324,7 @@ class BatchModeManager(QObject):
             self.batch_settings['container_override'] = container_override
         if audio_override is not None:
             self.batch_settings['audio_override'] = audio_override
+        self._invalidate_item_templates()
 
     def disable_batch_mode(self):
         """Disable batch mode and clear queue"""
@@ -299,6 +335,8 @@ class BatchModeManager(QObject):
         self.failed_downloads = 0
         self.current_playlist_info = None
         self.playlist_current_index = 0
+        self._invalidate_item_templates()
+        self._reset_limit_notifications()
         self.batch_status_changed.emit(False)
 
     def add_to_batch(self, url, queue_limit=None):
@@ -317,27 +355,62 @@ class BatchModeManager(QObject):
         if self.is_playlist_url(url):
             return self.handle_playlist_url(url, queue_limit)
 
+        # Mixing regular URLs into a playlist queue needs the string form
+        self._materialize_queue()
+
         # Check if URL is already in queue
         if url in self.batch_queue:
             return False
 
         self.batch_queue.append(url)
-        self.queue_updated.emit()
-        
-        # Emit warning if approaching limit (at 80% of limit)
-        if queue_limit is not None and len(self.batch_queue) >= int(queue_limit * 0.8):
-            self.queue_limit_warning.emit(len(self.batch_queue), queue_limit)
-            
+        self._schedule_queue_updated()
+
+        # Emit warning if approaching limit (at 80% of limit), once per 10% step
+        size = len(self.batch_queue)
+        if queue_limit is not None and size >= int(queue_limit * 0.8):
+            bucket = size * 10 // queue_limit if queue_limit > 0 else 0
+            if bucket != self._last_warning_bucket:
+                self._last_warning_bucket = bucket
+                self.queue_limit_warning.emit(size, queue_limit)
+
         return True
 
+    def add_to_batch_many(self, urls, queue_limit=None):
+        """Add several URLs to the batch queue; returns how many were queued"""
+        added = 0
+        for url in urls:
+            # Once the queue is full the rest would be rejected too; alert once per burst
+            if queue_limit is not None and len(self.batch_queue) >= queue_limit:
+                self.queue_limit_reached.emit(len(self.batch_queue))
+                break
+            if self.add_to_batch(url, queue_limit):
+                added += 1
+        return added
+
+    def _reset_limit_notifications(self):
+        self._last_warning_bucket = None
+
+    def _schedule_queue_updated(self):
+        """Collapse queue_updated emissions into one per event-loop iteration."""
+        if self._queue_update_pending:
+            return
+        self._queue_update_pending = True
+        QTimer.singleShot(0, self._flush_queue_updated)
+
+    def _flush_queue_updated(self):
+        self._queue_update_pending = False
+        self.queue_updated.emit()
+
+    def _materialize_queue(self):
+        """Convert a compact playlist queue into a list of placeholder strings."""
+        if isinstance(self.batch_queue, array):
+            self.batch_queue = [f"{PLAYLIST_ITEM_PREFIX}{n}" for n in self.batch_queue]
+
     def _sanitize_folder_name(self, name: str) -> str:
-        try:
-            # Replace invalid path characters with underscore; trim length
-            name = re.sub(r'[\\/:*?"<>|]+', '_', name or 'Playlist')
-            name = name.strip().strip('.')
-            return name[:100] if len(name) > 100 else name
-        except Exception:
-            return 'Playlist'
+        # Replace invalid path characters with underscore; trim length
+        name = re.sub(r'[\\/:*?"<>|]+', '_', name or 'Playlist')
+        name = name.strip().strip('.')
+        return name[:100]
 
     def _resolve_playlist_download_path(self, base_download_path: str) -> str:
         """Return subfolder path for playlist items if setting is enabled."""
@@ -361,39 +434,50 @@ class BatchModeManager(QObject):
         except Exception:
             return base_download_path
 
-    def _build_batch_item_data(self, queue_item, is_playlist_item: bool, item_index: int):
-        """Helper to build the data for the next batch item."""
-        url = None
-        resolution = self.batch_settings['resolution']
-        download_subs = self.batch_settings['download_subs']
+    def _invalidate_item_templates(self):
+        """Drop cached item templates so they are rebuilt from current settings."""
+        self._item_template_regular = None
+        self._item_template_playlist = None
+
+    def _get_item_template(self, is_playlist_item: bool) -> dict:
+        """Return the settings-derived part of a batch item, building it once."""
+        if is_playlist_item and self._item_template_playlist is not None:
+            return self._item_template_playlist
+        if not is_playlist_item and self._item_template_regular is not None:
+            return self._item_template_regular
+
         download_path = self.batch_settings['download_path'] or ''
-        container_override = self.batch_settings.get('container_override')
-        audio_override = self.batch_settings.get('audio_override')
+        # Decide download path (optionally route playlist items into a subfolder)
+        if is_playlist_item and download_path:
+            download_path = self._resolve_playlist_download_path(download_path)
+        template = {
+            'url': None,
+            'resolution': self.batch_settings['resolution'],
+            'download_subs': self.batch_settings['download_subs'],
+            'download_path': download_path,
+            'container_override': self.batch_settings.get('container_override'),
+            'audio_override': self.batch_settings.get('audio_override'),
+        }
+        if is_playlist_item:
+            self._item_template_playlist = template
+        else:
+            self._item_template_regular = template
+        return template
 
+    def _build_batch_item_data(self, queue_item, is_playlist_item: bool, item_index: int):
+        """Helper to build the data for the next batch item."""
         if is_playlist_item:
             # Generate the actual URL for this playlist item
-            actual_url = self.get_playlist_video_url(item_index)
-            if not actual_url:
+            url = self.get_playlist_video_url(item_index)
+            if not url:
                 # Skip this item if we can't generate URL
                 return None
-            url = actual_url
             self.playlist_current_index = item_index + 1
         else:
             # Regular URL
             url = queue_item
 
-        # Decide download path (optionally route playlist items into a subfolder)
-        if is_playlist_item and download_path:
-            download_path = self._resolve_playlist_download_path(download_path)
-
-        return {
-            'url': url,
-            'resolution': resolution,
-            'download_subs': download_subs,
-            'download_path': download_path,
-            'container_override': container_override,
-            'audio_override': audio_override,
-        }
+        return {**self._get_item_template(is_playlist_item), 'url': url}
 
     def get_next_batch_item(self):
         """Get the next item in the batch queue"""
@@ -405,12 +489,15 @@ class BatchModeManager(QObject):
 
         # Check if this is a playlist item
         is_playlist_item = False
-        if isinstance(queue_item, str) and queue_item.startswith('PLAYLIST_ITEM_'):
+        if isinstance(queue_item, int):
+            item_index = queue_item
+            is_playlist_item = True
+        elif isinstance(queue_item, str) and queue_item.startswith(PLAYLIST_ITEM_PREFIX):
             # Extract index from placeholder
             try:
-                item_index = int(queue_item.split('_')[-1])
+                item_index = int(queue_item[_PLAYLIST_ITEM_PREFIX_LEN:])
                 is_playlist_item = True
-            except (ValueError, IndexError):
+            except ValueError:
                 item_index = 0
         else:
             item_index = 0
@@ -479,33 +566,31 @@ class BatchModeManager(QObject):
         self.failed_downloads = 0
         self.current_playlist_info = None
         self.playlist_current_index = 0
+        self._invalidate_item_templates()
+        self._reset_limit_notifications()
         self.queue_updated.emit()
 
     def trim_queue_to_limit(self, limit: int):
         """Trim the batch queue to at most 'limit' items; adjust indices accordingly."""
-        try:
-            if limit is None or limit < 0:
-                return
-            # Persist this as a maximum for future extractions
-            self.playlist_max_items = int(limit)
-            if len(self.batch_queue) > limit:
-                self.batch_queue = self.batch_queue[:limit]
-                if self.current_batch_index > len(self.batch_queue):
-                    self.current_batch_index = len(self.batch_queue)
-                if self.playlist_current_index > len(self.batch_queue):
-                    self.playlist_current_index = len(self.batch_queue)
-                self.queue_updated.emit()
-        except Exception:
-            pass
+        if not isinstance(limit, int) or limit < 0:
+            return
+        # Persist this as a maximum for future extractions
+        self.playlist_max_items = limit
+        if len(self.batch_queue) > limit:
+            self.batch_queue = self.batch_queue[:limit]
+            if self.current_batch_index > len(self.batch_queue):
+                self.current_batch_index = len(self.batch_queue)
+            if self.playlist_current_index > len(self.batch_queue):
+                self.playlist_current_index = len(self.batch_queue)
+            # A smaller queue can approach the limit again; let the warning fire anew
+            self._reset_limit_notifications()
+            self.queue_updated.emit()
 
     def enforce_playlist_limit(self, limit: int):
         """Set a persistent maximum items cap for the current playlist and apply it to the queue."""
-        try:
-            if isinstance(limit, int) and limit > 0:
-                self.playlist_max_items = int(limit)
-                self.trim_queue_to_limit(limit)
-        except Exception:
-            pass
+        if isinstance(limit, int) and limit > 0:
+            self.playlist_max_items = limit
+            self.trim_queue_to_limit(limit)
 
     def remove_from_queue(self, index: int):
         """Remove an item from the queue by index and adjust indices."""
@@ -513,6 +598,7 @@ class BatchModeManager(QObject):
             del self.batch_queue[index]
             if index < self.current_batch_index:
                 self.current_batch_index -= 1
+            self._reset_limit_notifications()
             self.queue_updated.emit()
 
     def move_in_queue(self, from_index: int, to_index: int) -> bool:
@@ -542,12 +628,16 @@ class BatchModeManager(QObject):
                 'index': i,
                 'status': 'completed' if i < self.current_batch_index else 'pending'
             }
-            if isinstance(queue_item, str) and queue_item.startswith('PLAYLIST_ITEM_'):
+            is_placeholder = isinstance(queue_item, int)
+            if is_placeholder:
+                item_index = queue_item
+            elif isinstance(queue_item, str) and queue_item.startswith(PLAYLIST_ITEM_PREFIX):
+                is_placeholder = True
                 try:
-                    parts = queue_item.split('_')
-                    item_index = int(parts[2]) if len(parts) >= 3 else (i + 1)
-                except Exception:
+                    item_index = int(queue_item[_PLAYLIST_ITEM_PREFIX_LEN:])
+                except ValueError:
                     item_index = i + 1
+            if is_placeholder:
                 item['title'] = f"Playlist Video #{item_index}"
                 if self.current_playlist_info:
                     item['title'] = f"{self.current_playlist_info['title']} - Video #{item_index}"
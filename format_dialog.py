@@ -1,8 +1,353 @@
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QHBoxLayout, QPushButton, QComboBox, QLineEdit, QCheckBox, QTabWidget, QWidget, QGraphicsOpacityEffect, QProgressBar
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QTimer, QThread, pyqtSignal
+import os
+import time
+import hashlib
+import threading
+import functools
+from collections import defaultdict, OrderedDict
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QTableView, QHBoxLayout, QPushButton, QComboBox, QLineEdit, QCheckBox, QTabWidget, QWidget, QGraphicsOpacityEffect, QProgressBar
+from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
 from yt_dlp import YoutubeDL
 from settings import AppSettings
 
+# Short-lived in-process cache of extracted formats so reopening the chooser
+# (or the download right after it) skips a multi-second yt-dlp probe. Only the
+# fields the dialog renders are kept: yt-dlp format dicts also carry cookies
+# and auth headers, which must not outlive the probe.
+_INFO_CACHE_TTL = 600
+_INFO_CACHE = {}  # key -> (expires_at, formats)
+_INFO_CACHE_LOCK = threading.Lock()  # loaders from overlapping dialogs share the cache
+_CACHED_FORMAT_FIELDS = (
+	'format_id', 'ext', 'width', 'height', 'fps', 'vcodec', 'acodec',
+	'filesize', 'filesize_approx', 'tbr', 'format_note',
+)
+
+
+def _cookie_identity(cookiefile: str | None) -> str:
+	"""Stable identity of a cookie file's contents.
+	JSON cookies are converted to a fresh temp file on every open, so the path alone never repeats.
+	"""
+	if not cookiefile:
+		return ''
+	try:
+		with open(cookiefile, 'rb') as fh:
+			return hashlib.sha256(fh.read()).hexdigest()
+	except OSError:
+		return ''
+
+
+# Reused YoutubeDL instances, one per cookie identity: yt-dlp loads its cookie
+# jar once, so swapping params['cookiefile'] on a live instance is not enough.
+# Kept to the most recent few so old cookie jars are released.
+_YDL_MAX_INSTANCES = 2
+_YDL_INSTANCES = OrderedDict()  # cookie identity -> (YoutubeDL, per-instance lock)
+_YDL_LOCK = threading.Lock()
+
+
+def _get_ydl(cookiefile: str | None):
+	identity = _cookie_identity(cookiefile)
+	with _YDL_LOCK:
+		entry = _YDL_INSTANCES.get(identity)
+		if entry is not None:
+			_YDL_INSTANCES.move_to_end(identity)
+			return entry
+		opts = {
+			'quiet': True,
+			'no_warnings': True,
+			'skip_download': True,
+			'extract_flat': False,
+			'socket_timeout': 30,
+		}
+		if cookiefile:
+			opts['cookiefile'] = cookiefile
+		entry = (YoutubeDL(opts), threading.Lock())
+		_YDL_INSTANCES[identity] = entry
+		while len(_YDL_INSTANCES) > _YDL_MAX_INSTANCES:
+			_YDL_INSTANCES.popitem(last=False)
+		return entry
+
+
+def _extract_info(url: str, cookiefile: str | None):
+	"""Run extract_info on a shared YoutubeDL; only probes using the same instance wait on each other."""
+	ydl, lock = _get_ydl(cookiefile)
+	with lock:
+		return ydl.extract_info(url, download=False)
+
+
+def _info_cache_key(url: str, cookiefile: str | None) -> str:
+	return hashlib.sha1(f"{url}|{_cookie_identity(cookiefile)}".encode()).hexdigest()
+
+
+def _cached_formats(key: str):
+	with _INFO_CACHE_LOCK:
+		hit = _INFO_CACHE.get(key)
+		if hit and hit[0] > time.monotonic():
+			return hit[1]
+		_INFO_CACHE.pop(key, None)
+	return None
+
+
+def _store_formats(key: str, formats: list):
+	slim = [{k: f[k] for k in _CACHED_FORMAT_FIELDS if k in f} for f in formats]
+	with _INFO_CACHE_LOCK:
+		now = time.monotonic()
+		# Drop expired entries so the cache only holds recent probes
+		for k in [k for k, (expires, _) in _INFO_CACHE.items() if expires <= now]:
+			del _INFO_CACHE[k]
+		_INFO_CACHE[key] = (now + _INFO_CACHE_TTL, slim)
+	return slim
+
+
+def _human_size(size):
+	# Sizes recur across Simple/Advanced rows; normalize to int so they share cache entries
+	return _human_size_int(int(size))
+
+
+@functools.lru_cache(maxsize=1024)
+def _human_size_int(size: int):
+	units = ['B', 'KB', 'MB', 'GB']
+	val = float(size)
+	for u in units:
+		if val < 1024.0 or u == units[-1]:
+			if u == 'B':
+				return f"{int(val)} {u}"
+			return f"{val:.1f} {u}"
+		val /= 1024.0
+	return f"{val:.1f} TB"
+
+
+def _bucket_formats(formats: list):
+	"""Group video formats by height/ext and pick the first audio-only format.
+	Returns (heights, best_audio) where heights maps '1080p' -> {ext: size_text},
+	ordered from the tallest resolution down.
+	"""
+	by_height = defaultdict(dict)
+	best_audio = None
+	try:
+		for f in formats:
+			size = f.get('filesize') or f.get('filesize_approx') or 0
+			size_text = _human_size(size) if size else "~"
+			ext = (f.get('ext') or '').lower()
+			height = f.get('height') or 0
+			vcodec = f.get('vcodec')
+			acodec = f.get('acodec')
+			if vcodec and vcodec != 'none' and height:
+				by_height[int(height)][ext] = size_text
+			elif (not vcodec or vcodec == 'none') and acodec and acodec != 'none':
+				if not best_audio:
+					best_audio = (ext or 'm4a', size_text)
+	except Exception:
+		pass
+	# Sort on the integer heights directly; no string parsing in the sort key
+	heights = {f"{h}p": by_height[h] for h in sorted(by_height, reverse=True)}
+	return heights, best_audio
+
+
+# Codec tag by the vcodec prefix before the first '.', e.g. 'avc1.640028' -> 'avc1'
+_CODEC_MAP = {
+	'av01': 'AV1', 'av1': 'AV1',
+	'vp09': 'VP9', 'vp9': 'VP9',
+	'avc1': 'H.264', 'h264': 'H.264',
+	'hev1': 'HEVC', 'hvc1': 'HEVC',
+}
+
+_TAG_HDR = 1
+_TAG_HFR = 2
+
+
+@functools.lru_cache(maxsize=64)
+def _tags_text(codec_tag: str | None, flags: int) -> str:
+	"""Render the Tags column from a codec tag and _TAG_* bit flags."""
+	tags = [codec_tag] if codec_tag else []
+	if flags & _TAG_HDR:
+		tags.append('HDR')
+	if flags & _TAG_HFR:
+		tags.append('60fps')
+	return " ".join(tags)
+
+
+def _build_advanced_rows(formats: list):
+	"""Build Advanced tab row tuples plus one lowercase search string per format."""
+	rows = []
+	search = []
+	codec_map_get = _CODEC_MAP.get
+	for f in formats:
+		ext = (f.get('ext') or '').lower()
+		vcodec = (f.get('vcodec') or '').lower()
+		acodec = (f.get('acodec') or '').lower()
+		fps = str(f.get('fps') or '')
+		height = f.get('height') or 0
+		width = f.get('width') or 0
+		res = f"{width}x{height}" if height and width else ("audio" if (not vcodec or vcodec=='none') and acodec else "")
+		note = (f.get('format_note') or '').lower()
+		size_val = f.get('filesize') or f.get('filesize_approx') or 0
+		size_text = _human_size(size_val) if size_val else "~"
+		# Build concise tags: codec + flag bits, rendered through a small cache
+		codec_tag = codec_map_get(vcodec.split('.', 1)[0])
+		flags = 0
+		if 'hdr' in note:
+			flags |= _TAG_HDR
+		if fps.isdigit() and int(fps) >= 60:
+			flags |= _TAG_HFR
+		tags = _tags_text(codec_tag, flags)
+		codec_combo = (vcodec or '')
+		if acodec and acodec != 'none':
+			codec_combo = f"{codec_combo}+{acodec}"
+		rows.append((res, fps, ext, codec_combo, size_text, tags))
+		search.append(f"{ext} {res} {fps} {vcodec} {acodec} {size_text} {note} {tags}".lower())
+	return rows, search
+
+
+def _resolve_cookiefile_sync(provided: str | None, parent_cookie_file: str | None, settings_snapshot: dict) -> str | None:
+	"""Attempt to get a usable Netscape-format cookie file for yt-dlp.
+	Order: provided cookiefile -> parent's current_cookie_file -> settings cookie txt -> convert JSON paths/strings via cookie_manager.
+	Runs on the loader thread, so it only reads the plain values captured by the dialog.
+	"""
+	try:
+		# 0) Explicit cookiefile provided by caller (controller)
+		try:
+			if provided and os.path.exists(provided):
+				return provided
+		except Exception:
+			pass
+		# 1) Controller-provided active cookie file
+		if parent_cookie_file:
+			return parent_cookie_file if os.path.exists(parent_cookie_file) else None
+		# 2) Settings manual cookie txt path
+		try:
+			cf = settings_snapshot.get('cookie_txt')
+			if cf and os.path.exists(cf) and cf.lower().endswith('.txt'):
+				return cf
+		except Exception:
+			pass
+		# 3) JSON cookie file path -> convert
+		try:
+			jpath = settings_snapshot.get('json_cookie')
+			if jpath:
+				from cookie_manager import CookieManager
+				cm = CookieManager()
+				temp_txt = cm.convert_json_to_yt_dlp_format(jpath)
+				return temp_txt if (temp_txt and os.path.exists(temp_txt)) else None
+		except Exception:
+			pass
+		# 4) Pasted JSON string in settings -> convert
+		try:
+			json_str = settings_snapshot.get('pasted_json') or ""
+			if json_str.strip().startswith('{') or json_str.strip().startswith('['):
+				from cookie_manager import CookieManager
+				cm = CookieManager()
+				temp_txt = cm.convert_json_string_to_yt_dlp_format(json_str)
+				return temp_txt if (temp_txt and os.path.exists(temp_txt)) else None
+		except Exception:
+			pass
+	except Exception:
+		pass
+	return None
+
+
+def _prepare_format_result(formats: list) -> dict:
+	heights, best_audio = _bucket_formats(formats)
+	adv_rows, search = _build_advanced_rows(formats)
+	return {
+		'formats': formats,
+		'heights': heights,
+		'best_audio': best_audio,
+		'adv_rows': adv_rows,
+		'search': search,
+	}
+
+
+class _FormatsModel(QAbstractTableModel):
+	"""Read-only table model backing the Advanced tab."""
+	HEADERS = ("Res", "FPS", "Ext", "Codec", "Size", "Tags")
+
+	def __init__(self, parent=None):
+		super().__init__(parent)
+		self._rows: list[tuple] = []
+		self._search: list[str] = []
+
+	def set_rows(self, rows: list[tuple], search: list[str] | None = None):
+		self.beginResetModel()
+		self._rows = list(rows)
+		self._search = list(search) if search is not None else [" ".join(r).lower() for r in self._rows]
+		self.endResetModel()
+
+	def row_at(self, row: int) -> tuple | None:
+		return self._rows[row] if 0 <= row < len(self._rows) else None
+
+	def search_text(self, row: int) -> str:
+		return self._search[row]
+
+	def rowCount(self, parent=QModelIndex()):
+		return 0 if parent.isValid() else len(self._rows)
+
+	def columnCount(self, parent=QModelIndex()):
+		return 0 if parent.isValid() else len(self.HEADERS)
+
+	def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+		if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+			return None
+		return self._rows[index.row()][index.column()]
+
+	def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+		if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+			return self.HEADERS[section]
+		return super().headerData(section, orientation, role)
+
+
+class _FormatsFilterProxy(QSortFilterProxyModel):
+	"""Substring filter over the model's precomputed lowercase search strings."""
+
+	def __init__(self, parent=None):
+		super().__init__(parent)
+		self._needle = ""
+
+	def set_needle(self, text: str):
+		self._needle = (text or "").lower()
+		self.invalidateFilter()
+
+	def filterAcceptsRow(self, source_row, source_parent):
+		return not self._needle or self._needle in self.sourceModel().search_text(source_row)
+
+
+class _FormatLoaderSignals(QObject):
+	result_ready = pyqtSignal(object)  # dict; 'object' keeps key order and tuples intact
+	failed = pyqtSignal(str)
+
+
+class _FormatLoaderRunnable(QRunnable):
+	"""Resolve cookies and fetch/classify formats on the shared thread pool."""
+
+	def __init__(self, url: str, settings_snapshot: dict, parent_cookie_file: str | None = None, cookiefile: str | None = None):
+		super().__init__()
+		self.signals = _FormatLoaderSignals()
+		self._url = url or ""
+		# Plain values only: settings and the parent widget are not touched off the GUI thread
+		self._settings_snapshot = dict(settings_snapshot or {})
+		self._parent_cookie_file = parent_cookie_file
+		self._provided_cookiefile = cookiefile
+		self._cookiefile = None
+
+	def run(self):
+		try:
+			self._cookiefile = _resolve_cookiefile_sync(
+				self._provided_cookiefile, self._parent_cookie_file, self._settings_snapshot
+			)
+			if not self._url:
+				self.signals.result_ready.emit(_prepare_format_result([]))
+				return
+			key = _info_cache_key(self._url, self._cookiefile)
+			formats = _cached_formats(key)
+			if formats is None:
+				info = _extract_info(self._url, self._cookiefile)
+				formats = (info.get('formats') or []) if isinstance(info, dict) else []
+				formats = _store_formats(key, formats)
+			# Classify on this thread so the GUI thread only applies results
+			result = _prepare_format_result(formats)
+			result['cookiefile'] = self._cookiefile
+			self.signals.result_ready.emit(result)
+		except Exception as e:
+			self.signals.failed.emit(str(e))
+
 
 class FormatChooserDialog(QDialog):
 	"""Simple pre-download format chooser dialog."""
@@ -10,6 +355,8 @@ class FormatChooserDialog(QDialog):
 		super().__init__(parent)
 		self.url = url
 		self.settings = AppSettings()
+		# Read settings once; later code (and the loader thread) uses this plain dict
+		self._settings_snapshot = self._take_settings_snapshot()
 		self.setWindowTitle("Choose Format")
 		self.resize(720, 560)
 		try:
@@ -19,7 +366,7 @@ class FormatChooserDialog(QDialog):
 		self.setStyleSheet("""
 			QDialog { background: #ffffff; }
 			QLabel { color: #1e293b; }
-			QTableWidget { background: #ffffff; color: #1e293b; gridline-color: #e2e8f0; }
+			QTableView { background: #ffffff; color: #1e293b; gridline-color: #e2e8f0; }
 			QHeaderView::section { background: #f1f5f9; color: #111827; padding: 6px; border: 1px solid #e2e8f0; }
 			QComboBox { background: #ffffff; color: #111827; border: 1px solid #e2e8f0; padding: 6px 8px; border-radius: 6px; }
 			QPushButton { background: qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #6366f1, stop:1 #4338ca); color: #ffffff; border: none; padding: 8px 14px; border-radius: 8px; font-weight: 600; }
@@ -33,21 +380,26 @@ class FormatChooserDialog(QDialog):
 		self.selected_container = None
 		self.proceed_with_defaults = False
 		self._formats = []
+		self._adv_rows = []  # (res, fps, ext, codec, size, tags) per format
+		self._adv_search = []  # lowercase search string per format
+		self._advanced_built = False  # Advanced model populated for current formats
 		self.selected_audio_format = None
 		self._tab_anim = None
+		self._tab_anims = {}  # tab widget -> reusable fade-in animation
 		self._audio_row_index = None
 		self.available_rows = []  # (label, resolution_key, container, size_text)
+		self._available_res_keys = set()  # resolution keys present in available_rows
 		self._loader = None
 		# Prefer explicitly provided cookiefile from controller to ensure chooser matches download auth state
 		self._provided_cookiefile = cookiefile
-		self._cookie_file_for_ydl = self._resolve_cookiefile()
+		# Resolved on the loader thread to keep file I/O out of dialog construction
+		self._cookie_file_for_ydl = None
 		# Loading indicator state
 		self._loading_row = None
 		self._loading_label = None
 		self._loading_bar = None
 		self._countdown_label = None
-		self._countdown_timer = None
-		self._countdown_secs = 0
+		self._safety_timer = None
 		# No auto-close timer: dialog stays until user chooses
 		self._build_ui()
 		self._load_formats_async()
@@ -61,40 +413,6 @@ class FormatChooserDialog(QDialog):
 			# Force the selection change event to fire
 			self._on_simple_selection_changed()
 
-	class _FormatLoader(QThread):
-		result_ready = pyqtSignal(list)
-		failed = pyqtSignal(str)
-
-		def __init__(self, url: str, cookiefile: str | None = None):
-			super().__init__()
-			self._url = url or ""
-			self._cookiefile = cookiefile
-
-		def run(self):
-			try:
-				if not self._url:
-					self.result_ready.emit([])
-					return
-				opts = {
-					'quiet': True,
-					'no_warnings': True,
-					'skip_download': True,
-					'extract_flat': False,
-					'socket_timeout': 30,
-				}
-				# Apply cookies if provided
-				try:
-					if self._cookiefile:
-						opts['cookiefile'] = self._cookiefile
-				except Exception:
-					pass
-				with YoutubeDL(opts) as ydl:
-					info = ydl.extract_info(self._url, download=False)
-				formats = (info.get('formats') or []) if isinstance(info, dict) else []
-				self.result_ready.emit(formats)
-			except Exception as e:
-				self.failed.emit(str(e))
-
 	def _build_ui(self):
 		layout = QVBoxLayout(self)
 		info = QLabel("Select a resolution and container. Estimates are approximate.")
@@ -137,7 +455,7 @@ class FormatChooserDialog(QDialog):
 		container_label = QLabel("Container:")
 		self.container_combo = QComboBox()
 		self.container_combo.addItems(["mp4", "webm"])  # common safe options
-		self.container_combo.setCurrentText(self.settings.get_preferred_video_format())
+		self.container_combo.setCurrentText(self._settings_snapshot['video_fmt'])
 		self.container_combo.currentTextChanged.connect(self._on_container_combo_changed)
 		self.container_combo.setMinimumWidth(140)
 		container_row.addWidget(container_label)
@@ -150,7 +468,7 @@ class FormatChooserDialog(QDialog):
 		self.audio_combo = QComboBox()
 		self.audio_combo.addItems(["m4a", "mp3", "opus"])  # common audio choices
 		try:
-			self.audio_combo.setCurrentText(self.settings.get_preferred_audio_format())
+			self.audio_combo.setCurrentText(self._settings_snapshot['audio_fmt'] or "m4a")
 		except Exception:
 			self.audio_combo.setCurrentText("m4a")
 		self.audio_combo.setMinimumWidth(140)
@@ -189,14 +507,22 @@ class FormatChooserDialog(QDialog):
 		adv_filter_row = QHBoxLayout()
 		self.adv_filter = QLineEdit()
 		self.adv_filter.setPlaceholderText("Filter (e.g., 1080p, av1, 60fps, webm)")
-		self.adv_filter.textChanged.connect(self._refresh_advanced_table)
 		self.adv_filter.setMinimumHeight(30)
 		adv_filter_row.addWidget(QLabel("Search:"))
 		adv_filter_row.addWidget(self.adv_filter)
 		advanced_layout.addLayout(adv_filter_row)
 
-		self.adv_table = QTableWidget(0, 6)
-		self.adv_table.setHorizontalHeaderLabels(["Res", "FPS", "Ext", "Codec", "Size", "Tags"])
+		self.adv_table = QTableView()
+		self._adv_model = _FormatsModel(self)
+		self._adv_proxy = _FormatsFilterProxy(self)
+		self._adv_proxy.setSourceModel(self._adv_model)
+		self.adv_table.setModel(self._adv_proxy)
+		# Coalesce bursts of typing into a single filter pass
+		self._filter_debounce = QTimer(self)
+		self._filter_debounce.setSingleShot(True)
+		self._filter_debounce.setInterval(200)
+		self._filter_debounce.timeout.connect(self._apply_advanced_filter)
+		self.adv_filter.textChanged.connect(lambda _t: self._filter_debounce.start())
 		self.adv_table.horizontalHeader().setStretchLastSection(True)
 		try:
 			self.adv_table.setColumnWidth(0, 120)  # Res
@@ -210,7 +536,7 @@ class FormatChooserDialog(QDialog):
 		self.adv_table.setSelectionBehavior(self.adv_table.SelectionBehavior.SelectRows)
 		self.adv_table.setSelectionMode(self.adv_table.SelectionMode.SingleSelection)
 		self.adv_table.setAlternatingRowColors(True)
-		self.adv_table.itemSelectionChanged.connect(self._on_advanced_selection_changed)
+		self.adv_table.selectionModel().selectionChanged.connect(lambda *_: self._on_advanced_selection_changed())
 		advanced_layout.addWidget(self.adv_table)
 
 		self.tabs.addTab(self.advanced_tab, "Advanced")
@@ -235,57 +561,80 @@ class FormatChooserDialog(QDialog):
 		self._populate_rows_from_formats([])
 		# Start background loader
 		try:
-			# Show loading indicator with countdown (30s)
+			# Show loading indicator with a static estimate; the bar is indeterminate
 			if self._loading_row:
 				self._loading_row.show()
-				self._countdown_secs = 30
 				try:
-					self._countdown_label.setText(f"(~{self._countdown_secs}s)")
+					self._countdown_label.setText("(~30s)")
 				except Exception:
 					pass
-				# Kick off a 1s timer to update countdown
-				if not self._countdown_timer:
-					self._countdown_timer = QTimer(self)
-					self._countdown_timer.timeout.connect(self._tick_countdown)
-				self._countdown_timer.start(1000)
-
-			self._loader = self._FormatLoader(self.url, cookiefile=self._cookie_file_for_ydl)
-			self._loader.result_ready.connect(self._on_formats_loaded)
-			self._loader.failed.connect(self._on_formats_failed)
-			self._loader.start()
+
+			self._loader = _FormatLoaderRunnable(
+				self.url,
+				self._settings_snapshot,
+				parent_cookie_file=getattr(self.parent(), 'current_cookie_file', None),
+				cookiefile=self._provided_cookiefile,
+			)
+			self._loader.signals.result_ready.connect(self._on_formats_loaded)
+			self._loader.signals.failed.connect(self._on_formats_failed)
+			QThreadPool.globalInstance().start(self._loader)
 		except Exception:
 			pass
 
-		# Safety timeout to hide indicator even if yt-dlp stalls beyond socket timeout
+		# Safety timeout to hide indicator even if yt-dlp stalls beyond socket timeout.
+		# Owned by the dialog so it can be stopped on accept and dies with it.
 		try:
-			QTimer.singleShot(31000, self._stop_loading_indicator)
+			if not self._safety_timer:
+				self._safety_timer = QTimer(self)
+				self._safety_timer.setSingleShot(True)
+				self._safety_timer.timeout.connect(self._stop_loading_indicator)
+			self._safety_timer.start(30000)
 		except Exception:
 			pass
 
-	def _on_formats_loaded(self, formats: list):
-		self._formats = formats or []
-		self._stop_loading_indicator()
-		# Rebuild table: clear then populate based on formats
+	def _take_settings_snapshot(self) -> dict:
+		"""Capture the settings this dialog reads, including those the loader thread needs."""
+		snapshot = {'video_fmt': 'mp4', 'audio_fmt': 'm4a', 'cookie_txt': '', 'json_cookie': '', 'pasted_json': ''}
 		try:
-			self.table.setRowCount(0)
+			snapshot['video_fmt'] = self.settings.get_preferred_video_format()
+			snapshot['audio_fmt'] = self.settings.get_preferred_audio_format()
+			snapshot['cookie_txt'] = self.settings.get_cookie_file_path() or ''
+			snapshot['json_cookie'] = self.settings.get_json_cookie_file_path() or ''
+			pdata = getattr(self.settings, 'get_pasted_json_data', None)
+			if callable(pdata):
+				snapshot['pasted_json'] = pdata() or ''
 		except Exception:
 			pass
-		self._populate_rows_from_formats(self._formats)
+		return snapshot
+
+	def _on_formats_loaded(self, result: dict):
+		# Everything per-format was computed on the loader thread
+		if result.get('cookiefile'):
+			self._cookie_file_for_ydl = result['cookiefile']
+		self._formats = result.get('formats') or []
+		self._adv_rows = result.get('adv_rows') or []
+		self._adv_search = result.get('search') or []
+		self._stop_loading_indicator()
+		self._apply_format_buckets(result.get('heights') or {}, result.get('best_audio'))
+		# Advanced model is filled lazily; only now if it is already on screen
+		self._advanced_built = False
+		if self.tabs.currentIndex() == 1:
+			self._ensure_advanced_built()
 
 	def _on_formats_failed(self, err: str):
 		# Hide loading UI and keep defaults shown
 		self._stop_loading_indicator()
 		try:
 			self._formats = []
+			self._adv_rows = []
+			self._adv_search = []
+			self._advanced_built = False
 		except Exception:
 			pass
 
 	def _stop_loading_indicator(self):
-		try:
-			if self._countdown_timer and self._countdown_timer.isActive():
-				self._countdown_timer.stop()
-		except Exception:
-			pass
+		if self._safety_timer and self._safety_timer.isActive():
+			self._safety_timer.stop()
 		try:
 			if self._countdown_label:
 				self._countdown_label.setText("")
@@ -297,57 +646,30 @@ class FormatChooserDialog(QDialog):
 		except Exception:
 			pass
 
-	def _tick_countdown(self):
-		try:
-			self._countdown_secs = max(0, int(self._countdown_secs) - 1)
-			if self._countdown_label:
-				self._countdown_label.setText(f"(~{self._countdown_secs}s)")
-			if self._countdown_secs <= 0:
-				self._stop_loading_indicator()
-		except Exception:
-			self._stop_loading_indicator()
-
 	def _populate_rows_from_formats(self, formats: list):
+		heights, best_audio = _bucket_formats(formats)
+		self._apply_format_buckets(heights, best_audio)
+
+	def _apply_format_buckets(self, heights: dict, best_audio):
 		# Build default list first; then enhance with formats when present
 		self.available_rows = []
+		self._available_res_keys = set()
 		default_res_list = ["1080p", "720p", "480p", "360p", "Audio"]
-		heights = {}
-		best_audio = None
-		try:
-			for f in formats:
-				size = f.get('filesize') or f.get('filesize_approx') or 0
-				size_text = self._format_size(size) if size else "~"
-				ext = (f.get('ext') or '').lower()
-				height = f.get('height') or 0
-				vcodec = f.get('vcodec')
-				acodec = f.get('acodec')
-				if vcodec and vcodec != 'none' and height:
-					key = f"{int(height)}p"
-					if key not in heights:
-						heights[key] = {}
-					heights[key][ext] = size_text
-				elif (not vcodec or vcodec == 'none') and acodec and acodec != 'none':
-					if not best_audio:
-						best_audio = (ext or 'm4a', size_text)
-		except Exception:
-			pass
-		# Add rows for found heights (descending)
-		try:
-			for res in sorted(heights.keys(), key=lambda r: int(r[:-1]), reverse=True):
-				cont = self.container_combo.currentText()
-				size_text = heights[res].get(cont, next(iter(heights[res].values()), "~"))
-				self._add_row(f"Video {res}", res, cont, size_text)
-		except Exception:
-			pass
+		# Read combo values once rather than per row
+		cur_container = self.container_combo.currentText()
+		cur_audio = self.audio_combo.currentText().lower()
+		self._audio_row_index = None
+		# Add rows for found heights (already in descending order)
+		for res, sizes in heights.items():
+			size_text = sizes.get(cur_container, next(iter(sizes.values()), "~"))
+			self._add_row(f"Video {res}", res, cur_container, size_text)
 		# Ensure default entries exist
 		for res in default_res_list:
-			if res != 'Audio' and not any(r[1] == res for r in getattr(self, 'available_rows', [])):
-				self._add_row(f"Video {res}", res, self.container_combo.currentText(), "~")
-		if best_audio:
-			self._add_row("Audio (best)", "Audio", self.audio_combo.currentText().lower(), best_audio[1])
-		else:
-			self._add_row("Audio (best)", "Audio", self.audio_combo.currentText().lower(), "~")
-		
+			if res != 'Audio' and res not in self._available_res_keys:
+				self._add_row(f"Video {res}", res, cur_container, "~")
+		self._add_row("Audio (best)", "Audio", cur_audio, best_audio[1] if best_audio else "~")
+		self._populate_bulk(self.available_rows)
+
 		# Ensure proper selection and update the UI
 		if self.table.rowCount() > 0:
 			self.table.selectRow(0)
@@ -357,100 +679,44 @@ class FormatChooserDialog(QDialog):
 	def _extract_formats(self):
 		# Deprecated: kept for compatibility; not used directly after async change
 		try:
-			opts = {'quiet': True, 'no_warnings': True, 'skip_download': True, 'extract_flat': False, 'socket_timeout': 30}
-			if getattr(self, '_cookie_file_for_ydl', None):
-				opts['cookiefile'] = self._cookie_file_for_ydl
-			with YoutubeDL(opts) as ydl:
-				info = ydl.extract_info(self.url, download=False)
-				return info.get('formats') or []
+			info = _extract_info(self.url, getattr(self, '_cookie_file_for_ydl', None) or None)
+			return info.get('formats') or []
 		except Exception:
 			return []
 
-	def _resolve_cookiefile(self) -> str | None:
-		"""Attempt to get a usable Netscape-format cookie file for yt-dlp.
-		Order: provided cookiefile -> parent's current_cookie_file -> settings cookie txt -> convert JSON paths/strings via cookie_manager.
-		"""
-		try:
-			# 0) Explicit cookiefile provided by caller (controller)
-			try:
-				if getattr(self, '_provided_cookiefile', None):
-					import os
-					if os.path.exists(self._provided_cookiefile):
-						return self._provided_cookiefile
-			except Exception:
-				pass
-			parent = self.parent()
-			# 1) Controller-provided active cookie file
-			try:
-				if parent and hasattr(parent, 'current_cookie_file'):
-					cf = getattr(parent, 'current_cookie_file')
-					if cf:
-						import os
-						return cf if os.path.exists(cf) else None
-			except Exception:
-				pass
-			# 2) Settings manual cookie txt path
-			try:
-				cf = self.settings.get_cookie_file_path()
-				if cf:
-					import os
-					if os.path.exists(cf) and cf.lower().endswith('.txt'):
-						return cf
-			except Exception:
-				pass
-			# 3) JSON cookie file path -> convert
-			try:
-				jpath = self.settings.get_json_cookie_file_path()
-				if jpath:
-					from cookie_manager import CookieManager
-					cm = CookieManager()
-					temp_txt = cm.convert_json_to_yt_dlp_format(jpath)
-					import os
-					return temp_txt if (temp_txt and os.path.exists(temp_txt)) else None
-			except Exception:
-				pass
-			# 4) Pasted JSON string in settings -> convert
-			try:
-				pdata = getattr(self.settings, 'get_pasted_json_data', None)
-				if callable(pdata):
-					json_str = pdata() or ""
-					if json_str.strip().startswith('{') or json_str.strip().startswith('['):
-						from cookie_manager import CookieManager
-						cm = CookieManager()
-						temp_txt = cm.convert_json_string_to_yt_dlp_format(json_str)
-						import os
-						return temp_txt if (temp_txt and os.path.exists(temp_txt)) else None
-			except Exception:
-				pass
-		except Exception:
-			pass
-		return None
-
 	def _add_row(self, label: str, res_key: str, container: str, size_text: str):
-		row = self.table.rowCount()
-		self.table.insertRow(row)
-		self.table.setItem(row, 0, QTableWidgetItem(label))
-		self.table.setItem(row, 1, QTableWidgetItem(container))
-		self.table.setItem(row, 2, QTableWidgetItem(size_text))
-		self.available_rows.append((label, res_key, container, size_text))
+		# Record only; the table is written in one pass by _populate_bulk
 		if res_key == 'Audio':
-			self._audio_row_index = row
+			self._audio_row_index = len(self.available_rows)
+		self.available_rows.append((label, res_key, container, size_text))
+		self._available_res_keys.add(res_key)
 
-	def _accept(self):
+	def _populate_bulk(self, rows: list):
+		"""Write all Simple table rows at once with repaints and signals suspended."""
+		t = self.table
+		t.setUpdatesEnabled(False)
+		t.blockSignals(True)
 		try:
-			if hasattr(self, '_safety_timer') and self._safety_timer.isActive():
-				self._safety_timer.stop()
-		except Exception:
-			pass
+			t.setRowCount(len(rows))
+			for r, (label, _res_key, container, size_text) in enumerate(rows):
+				t.setItem(r, 0, QTableWidgetItem(label))
+				t.setItem(r, 1, QTableWidgetItem(container))
+				t.setItem(r, 2, QTableWidgetItem(size_text))
+		finally:
+			t.blockSignals(False)
+			t.setUpdatesEnabled(True)
+			t.viewport().update()
+
+	def _accept(self):
+		if self._safety_timer and self._safety_timer.isActive():
+			self._safety_timer.stop()
 		# If a loader is running, let it finish in background; we proceed now
 		# If Advanced tab is active, use advanced selection first
 		if getattr(self, 'tabs', None) and self.tabs.currentIndex() == 1:
-			arow = self.adv_table.currentRow()
-			if arow >= 0 and self.adv_table.rowCount() > 0:
+			arow = self._advanced_selected_row()
+			if arow is not None:
 				# Use advanced selection to set resolution/container
-				res = self.adv_table.item(arow, 0).text() if self.adv_table.item(arow, 0) else ""
-				fps = self.adv_table.item(arow, 1).text() if self.adv_table.item(arow, 1) else ""
-				ext = self.adv_table.item(arow, 2).text() if self.adv_table.item(arow, 2) else ""
+				res, fps, ext = arow[0], arow[1], arow[2]
 				# Map res to resolution key or Audio
 				if not res or res.lower() in ("audio", "none"):
 					self.selected_resolution = "Audio"
@@ -514,11 +780,8 @@ class FormatChooserDialog(QDialog):
 
 	def _use_defaults(self):
 		self.proceed_with_defaults = True
-		try:
-			if hasattr(self, '_safety_timer') and self._safety_timer.isActive():
-				self._safety_timer.stop()
-		except Exception:
-			pass
+		if self._safety_timer and self._safety_timer.isActive():
+			self._safety_timer.stop()
 		
 		# Try to get the current resolution from the parent UI if available
 		try:
@@ -562,78 +825,73 @@ class FormatChooserDialog(QDialog):
 					self._load_formats_async()
 			except Exception:
 				pass
-			self._refresh_advanced_table()
+			self._ensure_advanced_built()
 		else:
 			self.resize(720, 560)
 		# Smooth fade-in for current tab widget
 		try:
 			w = self.tabs.currentWidget()
-			effect = QGraphicsOpacityEffect(w)
-			w.setGraphicsEffect(effect)
-			anim = QPropertyAnimation(effect, b"opacity")
-			anim.setDuration(180)
+			anim = self._tab_anims.get(w)
+			if anim is None:
+				# One effect + animation per tab, created on first switch
+				effect = QGraphicsOpacityEffect(w)
+				w.setGraphicsEffect(effect)
+				anim = QPropertyAnimation(effect, b"opacity", self)
+				anim.setDuration(180)
+				anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
+				self._tab_anims[w] = anim
+			anim.stop()
 			anim.setStartValue(0.0)
 			anim.setEndValue(1.0)
-			anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
 			self._tab_anim = anim
-			anim.start(QPropertyAnimation.DeletionPolicy.DeleteWhenStopped)
+			anim.start()
 		except Exception:
 			pass
 
+	def _ensure_advanced_built(self):
+		"""Populate the Advanced model on first view of the current formats."""
+		if self._advanced_built:
+			return
+		if self._formats and not self._adv_rows:
+			self._build_advanced_rows()
+		self._refresh_advanced_table()
+		self._advanced_built = bool(self._formats)
+
+	def _build_advanced_rows(self):
+		"""Precompute Advanced tab rows and their search strings once per format list."""
+		self._adv_rows, self._adv_search = _build_advanced_rows(self._formats or [])
+
 	def _refresh_advanced_table(self):
 		# Only refresh when Advanced tab is active
 		if getattr(self, 'tabs', None) and self.tabs.currentIndex() != 1:
 			return
-		self.adv_table.setRowCount(0)
-		q = (self.adv_filter.text() or "").lower()
-		formats = self._formats or []
-		if not formats:
-			# Placeholder row
-			self.adv_table.setRowCount(1)
-			self.adv_table.setItem(0, 0, QTableWidgetItem(""))
-			self.adv_table.setItem(0, 1, QTableWidgetItem(""))
-			self.adv_table.setItem(0, 2, QTableWidgetItem(""))
-			self.adv_table.setItem(0, 3, QTableWidgetItem(""))
-			self.adv_table.setItem(0, 4, QTableWidgetItem("~"))
-			self.adv_table.setItem(0, 5, QTableWidgetItem("No formats yet"))
-			return
-		for f in formats:
-			ext = (f.get('ext') or '').lower()
-			vcodec = (f.get('vcodec') or '').lower()
-			acodec = (f.get('acodec') or '').lower()
-			fps = str(f.get('fps') or '')
-			height = f.get('height') or 0
-			width = f.get('width') or 0
-			res = f"{width}x{height}" if height and width else ("audio" if (not vcodec or vcodec=='none') and acodec else "")
-			note = (f.get('format_note') or '').lower()
-			size_val = f.get('filesize') or f.get('filesize_approx') or 0
-			size_text = self._format_size(size_val) if size_val else "~"
-			# Build concise tags
-			tags = []
-			if 'av1' in vcodec:
-				tags.append('AV1')
-			elif 'vp9' in vcodec:
-				tags.append('VP9')
-			elif '264' in vcodec or 'avc' in vcodec:
-				tags.append('H.264')
-			if 'hdr' in note:
-				tags.append('HDR')
-			if fps and fps.isdigit() and int(fps) >= 60:
-				tags.append('60fps')
-			codec_combo = (vcodec or '')
-			if acodec and acodec != 'none':
-				codec_combo = f"{codec_combo}+{acodec}"
-			row_text = " ".join([ext, res, fps, vcodec, acodec, size_text, note] + tags).lower()
-			if q and q not in row_text:
-				continue
-			row = self.adv_table.rowCount()
-			self.adv_table.insertRow(row)
-			self.adv_table.setItem(row, 0, QTableWidgetItem(res))
-			self.adv_table.setItem(row, 1, QTableWidgetItem(fps))
-			self.adv_table.setItem(row, 2, QTableWidgetItem(ext))
-			self.adv_table.setItem(row, 3, QTableWidgetItem(codec_combo))
-			self.adv_table.setItem(row, 4, QTableWidgetItem(size_text))
-			self.adv_table.setItem(row, 5, QTableWidgetItem(" ".join(tags)))
+		t = self.adv_table
+		selection = t.selectionModel()
+		# One model reset; keep the view from repainting or reporting
+		# selection changes until it is complete
+		t.setUpdatesEnabled(False)
+		selection.blockSignals(True)
+		try:
+			if not self._adv_rows:
+				# Placeholder row
+				self._adv_model.set_rows([("", "", "", "", "~", "No formats yet")])
+			else:
+				# Filtering is handled by the proxy model against the precomputed index
+				self._adv_model.set_rows(self._adv_rows, self._adv_search)
+		finally:
+			selection.blockSignals(False)
+			t.setUpdatesEnabled(True)
+			t.viewport().update()
+
+	def _apply_advanced_filter(self):
+		self._adv_proxy.set_needle(self.adv_filter.text())
+
+	def _advanced_selected_row(self) -> tuple | None:
+		"""Return the source row tuple for the current Advanced selection."""
+		idx = self.adv_table.currentIndex()
+		if not idx.isValid():
+			return None
+		return self._adv_model.row_at(self._adv_proxy.mapToSource(idx).row())
 
 	def _on_simple_selection_changed(self):
 		row = self.table.currentRow()
@@ -659,14 +917,12 @@ class FormatChooserDialog(QDialog):
 	def _on_advanced_selection_changed(self):
 		if not self.adv_table.isVisible():
 			return
-		row = self.adv_table.currentRow()
-		if row < 0:
+		row = self._advanced_selected_row()
+		if row is None:
 			return
 		# Columns: 0 Res, 1 FPS, 2 Ext, 3 Codec, 4 Size, 5 Tags
-		ext_item = self.adv_table.item(row, 2)
-		res_item = self.adv_table.item(row, 0)
-		res_text = res_item.text().lower() if res_item and res_item.text() else ""
-		ext_text = ext_item.text().lower() if (ext_item and ext_item.text()) else ""
+		res_text = (row[0] or "").lower()
+		ext_text = (row[2] or "").lower()
 		# Update container/audio combo based on selection
 		if not res_text or res_text in ("audio", "none"):
 			# Audio-only
@@ -681,11 +937,13 @@ class FormatChooserDialog(QDialog):
 	def _on_container_combo_changed(self, text: str):
 		# Update the simple table's container column to reflect the dropdown
 		container = (text or '').lower()
+		audio_row = self._audio_row_index
+		table_item = self.table.item
 		for row in range(self.table.rowCount()):
 			# Skip audio row to avoid overwriting its format
-			if self._audio_row_index is not None and row == self._audio_row_index:
+			if row == audio_row:
 				continue
-			item = self.table.item(row, 1)
+			item = table_item(row, 1)
 			if item:
 				item.setText(container)
 
@@ -711,12 +969,4 @@ class FormatChooserDialog(QDialog):
 
 	@staticmethod
 	def _format_size(size):
-		units = ['B', 'KB', 'MB', 'GB']
-		val = float(size)
-		for u in units:
-			if val < 1024.0 or u == units[-1]:
-				if u == 'B':
-					return f"{int(val)} {u}"
-				return f"{val:.1f} {u}"
-			val /= 1024.0
-		return f"{val:.1f} TB" 
\ No newline at end of file
+		return _human_size(size)
@@ -1,52 +1,163 @@
 import os
 import json
+import functools
+import platform
+import subprocess
+import queue
 import threading
+import time
 from datetime import datetime
 from collections import deque
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QTextEdit,
-    QTabWidget, QWidget, QLabel, QScrollArea, QFrame, QGraphicsDropShadowEffect,
+    QTabWidget, QWidget, QLabel, QScrollArea, QFrame,
     QStylePainter, QStyleOptionButton, QStyle
 )
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer, Qt
-from PyQt6.QtGui import QFont, QColor, QPalette
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer, Qt, QSignalBlocker, QSize, QEvent
+from PyQt6.QtGui import QFont, QColor, QPalette, QPainter, QTextCursor
+
+try:
+    from theme import get_palette, get_current_theme_key, Theme, button_style, load_svg_icon
+    THEME_AVAILABLE = True
+except ImportError:
+    get_palette = get_current_theme_key = Theme = button_style = load_svg_icon = None
+    THEME_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+_PLATFORM = platform.system().lower()
+
+# Folder opener for this platform, chosen once at import
+if _PLATFORM == 'darwin':
+    def _open_path(path):
+        subprocess.Popen(['open', path])
+elif _PLATFORM == 'windows':
+    _open_path = os.startfile
+else:
+    def _open_path(path):
+        subprocess.Popen(['xdg-open', path])
+
+# Shared forced text colors (FilterButton repaints would otherwise allocate one per paint)
+_TEXT_WHITE = QColor('#ffffff')
+_TEXT_BLACK = QColor('#000000')
+
+# Number of history entries rendered up front and per scroll step
+HISTORY_PAGE_SIZE = 10
+
+
+# History entry stylesheet templates, filled once per theme by LogDialog._entry_qss
+_ENTRY_TITLE_TPL = "font-weight: 600; color: {text}; font-size: 15px; padding: 2px 0px;"
+_ENTRY_DETAIL_TPL = "color: {text}; font-size: 12px; font-weight: 500;"
+_ENTRY_AUDIO_TEXT_TPL = "color: {text}; font-size: 10px; font-weight: 600;"
+_ENTRY_ERROR_TPL = "color: {color}; font-size: 12px; font-style: italic; font-weight: 500;"
+_ENTRY_TAG_TPL = """
+    background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
+                               stop: 0 {stop0}, stop: 1 {stop1});
+    color: {text};
+    padding: 3px 8px;
+    border-radius: 4px;
+    font-size: 10px;
+    font-weight: 600;
+"""
+_ENTRY_BADGE_PLAIN_TPL = "color: {color}; font-weight: 700; font-size: 13px; padding: 4px 8px;"
+_ENTRY_BADGE_DARK_TPL = (
+    "color: {text}; font-weight: 700; font-size: 13px; padding: 4px 8px; "
+    "background: {bg}; border-radius: 6px; border: 1px solid transparent;"
+)
+_ENTRY_BADGE_LIGHT_TPL = """
+    color: {text};
+    font-weight: 700;
+    font-size: 13px;
+    padding: 4px 8px;
+    background: rgba(255, 255, 255, 0.7);
+    border-radius: 6px;
+    border: 1px solid {color}40;
+"""
+# status -> (badge color, dark-theme badge background)
+_ENTRY_BADGE_COLORS = {
+    'completed': ('#22c55e', 'rgba(34, 197, 94, 0.18)'),
+    'failed': ('#ef4444', 'rgba(239, 68, 68, 0.18)'),
+    'other': ('#6366f1', 'rgba(99, 102, 241, 0.18)'),
+}
+_ENTRY_ACTIONS_LIGHT_TPL = """
+    QPushButton {{
+        background: transparent;
+        color: #000000;
+        border: 1px solid {border};
+        border-radius: 6px;
+        padding: 6px 12px;
+        font-weight: 600;
+    }}
+    QPushButton:hover {{
+        background: {hover_bg};
+        border-color: {hover_border};
+    }}
+    QPushButton:pressed {{
+        background: {pressed_bg};
+        border-color: {pressed_border};
+    }}
+"""
 
 
 class LogManager(QObject):
     """Manages all logging functionality including real-time logs and download history"""
 
     # Signals for real-time log updates
-    log_updated = pyqtSignal(str, str)  # message, level
+    log_updated = pyqtSignal(str, str, float)  # message, level, epoch timestamp
+    logs_appended = pyqtSignal(list)  # [(message, level, epoch timestamp), ...]
     download_completed = pyqtSignal(dict)  # download info
 
-    def __init__(self, max_realtime_logs=100, max_history_entries=10):
+    def __init__(self, max_realtime_logs=100, max_history_entries=10, debug_enabled=True):
         super().__init__()
         self.max_realtime_logs = max_realtime_logs
         self.max_history_entries = max_history_entries
+        # When off, DEBUG entries are dropped; callers check it to skip formatting them at all
+        self.debug_enabled = debug_enabled
 
         # Real-time logs storage (in memory)
         self.realtime_logs = deque(maxlen=max_realtime_logs)
+        # Set by LogDialog while it is shown; PROGRESS lines are not emitted otherwise
+        self._has_visible_listener = False
 
         # Download history storage (persistent)
         self.history_file = os.path.expanduser("~/Downloads/yt_downloader_history.json")
-        self.download_history = self.load_history()
-
-        # Thread lock for safe operations
+        self._history_mtime = None
+        self.download_history = deque(self.load_history(), maxlen=self.max_history_entries)
+        self._rebuild_status_index()
+
+        # History snapshots are queued and written by a background thread
+        self._write_queue = queue.Queue()
+        self._history_seq = 0
+        self._written_seq = 0
+        self._history_io_lock = threading.Lock()
+        self._history_writer = threading.Thread(
+            target=self._history_writer_loop, name="HistoryWriter", daemon=True
+        )
+        self._history_writer.start()
+
+        # Thread lock for session swaps; per-entry appends rely on atomic deque.append
         self.lock = threading.Lock()
 
         # Current download session info
+        self._session_logs = deque(maxlen=max_realtime_logs)
         self.current_session = {
             'start_time': None,
             'url': None,
             'title': None,
             'resolution': None,
             'status': 'idle',
-            'logs': []
+            'logs': self._session_logs
         }
 
     def start_download_session(self, url, resolution, download_subs=False, batch_mode=False):
         """Start a new download session"""
         with self.lock:
+            self._session_logs = deque(maxlen=self.max_realtime_logs)
             self.current_session = {
                 'start_time': datetime.now(),
                 'url': url,
@@ -55,7 +166,7 @@ class LogManager(QObject):
                 'download_subs': download_subs,
                 'batch_mode': batch_mode,
                 'status': 'downloading',
-                'logs': [],
+                'logs': self._session_logs,
                 'end_time': None,
                 'file_size': None,
                 'download_path': None
@@ -65,20 +176,48 @@ class LogManager(QObject):
 
     def log(self, level, message):
         """Add a log entry to real-time logs"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        if level == 'DEBUG' and not self.debug_enabled:
+            return
+        # Raw epoch float; HH:MM:SS is only formatted when a line is displayed
+        ts = time.time()
         log_entry = {
-            'timestamp': timestamp,
+            'ts': ts,
             'level': level,
             'message': message
         }
 
-        with self.lock:
-            self.realtime_logs.append(log_entry)
-            if self.current_session['status'] == 'downloading':
-                self.current_session['logs'].append(log_entry)
+        self.realtime_logs.append(log_entry)
+        if self.current_session['status'] == 'downloading':
+            self._session_logs.append(log_entry)
 
-        # Emit signal for real-time updates
-        self.log_updated.emit(f"[{timestamp}] {message}", level)
+        # Emit signal for real-time updates (progress ticks only matter to an open dialog)
+        if level == 'PROGRESS' and not self._has_visible_listener:
+            return
+        self.log_updated.emit(message, level, ts)
+
+    def log_many(self, entries):
+        """Add several (level, message) log entries with a single update signal"""
+        ts = time.time()
+        debug = self.debug_enabled
+        log_entries = [
+            {'ts': ts, 'level': level, 'message': message}
+            for level, message in entries if debug or level != 'DEBUG'
+        ]
+        if not log_entries:
+            return
+
+        self.realtime_logs.extend(log_entries)
+        if self.current_session['status'] == 'downloading':
+            self._session_logs.extend(log_entries)
+
+        visible = self._has_visible_listener
+        self.logs_appended.emit([
+            (e['message'], e['level'], ts) for e in log_entries if visible or e['level'] != 'PROGRESS'
+        ])
+
+    def set_listener_visible(self, visible):
+        """Record whether a log view is currently shown"""
+        self._has_visible_listener = bool(visible)
 
     def update_video_info(self, title, file_size=None):
         """Update current session with video information"""
@@ -146,32 +285,116 @@ class LogManager(QObject):
             'error': session_data.get('error'),
             'log_count': len(session_data.get('logs', []))
         }
-
+        _normalize_history_entry(history_entry)
+
+        # Bounded deque drops the oldest entry automatically; mirror that in the status index
+        if len(self.download_history) == self.download_history.maxlen:
+            evicted = self.download_history[0]
+            bucket = self._history_by_status.get(evicted.get('status'))
+            if bucket and bucket[0] is evicted:
+                bucket.popleft()
         self.download_history.append(history_entry)
+        bucket = self._history_by_status.get(history_entry['status'])
+        if bucket is not None:
+            bucket.append(history_entry)
+        self._publish_history_snapshots()
 
-        # Keep only the last N entries
-        if len(self.download_history) > self.max_history_entries:
-            self.download_history = self.download_history[-self.max_history_entries:]
-
-        # Save to file
+        # Save to file (off the calling thread)
         self.save_history()
 
     def load_history(self):
         """Load download history from file"""
         try:
             if os.path.exists(self.history_file):
+                self._history_mtime = os.path.getmtime(self.history_file)
+                if ORJSON_AVAILABLE:
+                    with open(self.history_file, 'rb') as f:
+                        return orjson.loads(f.read())
                 with open(self.history_file, 'r', encoding='utf-8') as f:
                     return json.load(f)
         except Exception as e:
             print(f"Error loading history: {e}")
         return []
 
+    def reload_history(self):
+        """Re-read download history from file if it changed since it was last read or written"""
+        try:
+            mtime = os.path.getmtime(self.history_file)
+        except OSError:
+            mtime = None
+        if mtime == self._history_mtime:
+            return
+        self.download_history = deque(self.load_history(), maxlen=self.max_history_entries)
+        self._rebuild_status_index()
+
+    def _rebuild_status_index(self):
+        """Group history entries by status so filtered views need no scan"""
+        self._history_by_status = {
+            'completed': deque(maxlen=self.max_history_entries),
+            'failed': deque(maxlen=self.max_history_entries),
+            'all': self.download_history,
+        }
+        for entry in self.download_history:
+            _normalize_history_entry(entry)
+            bucket = self._history_by_status.get(entry.get('status'))
+            if bucket is not None and bucket is not self.download_history:
+                bucket.append(entry)
+        self._publish_history_snapshots()
+
+    def _publish_history_snapshots(self):
+        # Readers get immutable tuples that are only rebuilt when history changes
+        self._history_snapshots = {
+            status: tuple(bucket) for status, bucket in self._history_by_status.items()
+        }
+
     def save_history(self):
-        """Save download history to file"""
+        """Queue a snapshot of the download history for the background writer"""
+        self._history_seq += 1
+        self._write_queue.put((self._history_seq, self._history_snapshots['all']))
+
+    def flush_history(self):
+        """Write any pending history snapshot immediately (e.g. on app exit)"""
+        # Write the current snapshot ourselves: the writer may have already dequeued it
+        # and then be killed at exit. The seq check skips it if that write went through.
+        self._drain_write_queue()
+        self._write_latest((self._history_seq, self._history_snapshots['all']))
+
+    def _drain_write_queue(self, item=None):
+        # Only the newest snapshot matters; older queued ones are stale
+        while True:
+            try:
+                item = self._write_queue.get_nowait()
+            except queue.Empty:
+                return item
+
+    def _write_latest(self, item):
+        # The lock also makes a flush wait for a write already in progress
+        with self._history_io_lock:
+            if item is None or item[0] <= self._written_seq:
+                return
+            self._written_seq = item[0]
+            self._write_history_file(item[1])
+
+    def _history_writer_loop(self):
+        while True:
+            self._write_latest(self._drain_write_queue(self._write_queue.get()))
+
+    def _write_history_file(self, snapshot):
         try:
             os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.download_history, f, indent=2, ensure_ascii=False)
+            tmp_path = self.history_file + '.tmp'
+            # Derived keys are rebuilt on load and stay out of the file
+            snapshot = [
+                {k: v for k, v in entry.items() if k != '_resolution_norm'} for entry in snapshot
+            ]
+            if ORJSON_AVAILABLE:
+                with open(tmp_path, 'wb') as f:
+                    f.write(orjson.dumps(snapshot, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.history_file)
+            self._history_mtime = os.path.getmtime(self.history_file)
         except Exception as e:
             print(f"Error saving history: {e}")
 
@@ -180,9 +403,9 @@ class LogManager(QObject):
         with self.lock:
             return list(self.realtime_logs)
 
-    def get_download_history(self):
-        """Get download history"""
-        return self.download_history.copy()
+    def get_download_history(self, status='all'):
+        """Get a read-only snapshot of download history, optionally filtered by status"""
+        return self._history_snapshots.get(status, ())
 
     def clear_realtime_logs(self):
         """Clear real-time logs"""
@@ -204,12 +427,28 @@ class FilterButton(QPushButton):
     def paintEvent(self, event):
         opt = QStyleOptionButton()
         self.initStyleOption(opt)
-        forced = QColor('#ffffff' if self._is_dark else '#000000')
+        forced = _TEXT_WHITE if self._is_dark else _TEXT_BLACK
         opt.palette.setColor(QPalette.ColorRole.ButtonText, forced)
         painter = QStylePainter(self)
         painter.drawControl(QStyle.ControlElement.CE_PushButton, opt)
 
 
+class ElidedLabel(QLabel):
+    """Single-line QLabel that elides its text to the available width when painted."""
+    def minimumSizeHint(self):
+        # Allow the layout to shrink the label below its full text width
+        hint = super().minimumSizeHint()
+        return QSize(0, hint.height())
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        rect = self.contentsRect()
+        elided = self.fontMetrics().elidedText(self.text(), Qt.TextElideMode.ElideRight, rect.width())
+        self.style().drawItemText(
+            painter, rect, int(self.alignment().value), self.palette(), self.isEnabled(), elided, self.foregroundRole()
+        )
+
+
 class LogDialog(QDialog):
     """Dialog window to display logs and download history"""
 
@@ -221,8 +460,25 @@ class LogDialog(QDialog):
         self.setModal(False)  # Allow interaction with main window
         self.resize(850, 650)  # Slightly larger for better content display
 
+        # Real-time lines are buffered and flushed to the text view in batches
+        self._pending_logs = deque(maxlen=500)
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setInterval(100)
+        self._log_flush_timer.setSingleShot(False)
+        self._log_flush_timer.timeout.connect(self._flush_pending_logs)
+        self._rebuild_log_template()
+
+        self._pending_refresh = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+
+        self._clock_sec = None
+        self._clock_str = ''
+
         # Connect to log manager signals
         self.log_manager.log_updated.connect(self.add_realtime_log)
+        self.log_manager.logs_appended.connect(self.add_realtime_logs)
         self.log_manager.download_completed.connect(lambda _: self.load_history())
 
         self.setup_ui()
@@ -237,21 +493,13 @@ class LogDialog(QDialog):
 
         # Apply palette-driven styling to match current theme (supports dark, default, YouTube)
         try:
-            self.setStyleSheet(self._build_styles())
+            self.setStyleSheet(self._build_dialog_qss())
         except Exception:
             pass
 
         # Tab widget for different views
         self.tabs = QTabWidget()
 
-        # Add shadow effect to tab widget
-        tab_shadow = QGraphicsDropShadowEffect()
-        tab_shadow.setBlurRadius(20)
-        tab_shadow.setXOffset(0)
-        tab_shadow.setYOffset(4)
-        tab_shadow.setColor(QColor(0, 0, 0, 30))
-        self.tabs.setGraphicsEffect(tab_shadow)
-
         # Real-time logs tab
         self.realtime_tab = QWidget()
         self.setup_realtime_tab()
@@ -264,7 +512,6 @@ class LogDialog(QDialog):
 
         # Set SVG icons for tabs if assets exist
         try:
-            from theme import load_svg_icon
             _rt_icon = load_svg_icon("assets/icons/logs-realtime.svg", None, 18)
             _hist_icon = load_svg_icon("assets/icons/logs-history.svg", None, 18)
             self.tabs.setTabIcon(0, _rt_icon)
@@ -283,7 +530,6 @@ class LogDialog(QDialog):
         self.clear_logs_btn.setObjectName("clear_logs_btn")
         self.clear_logs_btn.clicked.connect(self.clear_realtime_logs)
         try:
-            from theme import button_style
             self.clear_logs_btn.setStyleSheet(button_style('warn'))
         except Exception:
             pass
@@ -291,7 +537,6 @@ class LogDialog(QDialog):
         self.refresh_btn = QPushButton("Refresh")
         self.refresh_btn.clicked.connect(self.refresh_data)
         try:
-            from theme import button_style
             self.refresh_btn.setStyleSheet(button_style('primary'))
         except Exception:
             pass
@@ -300,7 +545,6 @@ class LogDialog(QDialog):
         self.close_btn.setObjectName("close_btn")
         self.close_btn.clicked.connect(self.close)
         try:
-            from theme import button_style
             self.close_btn.setStyleSheet(button_style('primary', radius=6, padding='10px 18px'))
         except Exception:
             pass
@@ -321,7 +565,6 @@ class LogDialog(QDialog):
         # Info label with enhanced styling
         self.realtime_info_label = QLabel("Real-time logs (last 100 entries)")
         try:
-            from theme import get_palette, get_current_theme_key, Theme
             _p = get_palette()
             _key = get_current_theme_key()
             if _key == Theme.DARK:
@@ -339,14 +582,12 @@ class LogDialog(QDialog):
         self.realtime_text = QTextEdit()
         self.realtime_text.setReadOnly(True)
         self.realtime_text.setFont(QFont("Consolas", 11))  # Slightly larger font
-
-        # Add shadow to text area
-        text_shadow = QGraphicsDropShadowEffect()
-        text_shadow.setBlurRadius(10)
-        text_shadow.setXOffset(0)
-        text_shadow.setYOffset(2)
-        text_shadow.setColor(QColor(0, 0, 0, 20))
-        self.realtime_text.setGraphicsEffect(text_shadow)
+        # Let Qt drop the oldest blocks so the document stays as bounded as the log deque;
+        # every log line is its own block (see _insert_log_lines), so the cap counts lines
+        doc = self.realtime_text.document()
+        doc.setMaximumBlockCount(self.log_manager.max_realtime_logs)
+        # Read-only view: don't keep an undo history of every inserted line
+        doc.setUndoRedoEnabled(False)
 
         layout.addWidget(self.realtime_text)
 
@@ -361,7 +602,6 @@ class LogDialog(QDialog):
         filter_row.setSpacing(10)
         self.filter_label = QLabel("Filter:")
         try:
-            from theme import get_palette, get_current_theme_key, Theme
             _p = get_palette()
             _key = get_current_theme_key()
             if _key in (Theme.DEFAULT, Theme.YOUTUBE):
@@ -381,7 +621,6 @@ class LogDialog(QDialog):
         for btn in (self.filter_all_btn, self.filter_success_btn, self.filter_failed_btn):
             btn.setFixedHeight(30)
             try:
-                from theme import get_current_theme_key, Theme
                 _key = get_current_theme_key()
                 _name = getattr(_key, 'name', str(_key))
                 if _name in ('DEFAULT', 'YOUTUBE'):
@@ -426,14 +665,13 @@ class LogDialog(QDialog):
                     # Reinforce via palette
                     try:
                         pal = btn.palette()
-                        pal.setColor(QPalette.ColorRole.ButtonText, QColor("#000000"))
+                        pal.setColor(QPalette.ColorRole.ButtonText, _TEXT_BLACK)
                         btn.setPalette(pal)
                     except Exception:
                         pass
                     # Append a final selector-scoped rule to ensure override
                     btn.setStyleSheet(btn.styleSheet() + f"\nQPushButton#{btn.objectName()} {{ color: #000000; }}\n")
                 else:
-                    from theme import button_style, get_palette
                     role = 'info'
                     if btn is self.filter_success_btn:
                         role = 'success'
@@ -479,7 +717,7 @@ class LogDialog(QDialog):
                     # Reinforce via palette at creation time
                     try:
                         pal = btn.palette()
-                        pal.setColor(QPalette.ColorRole.ButtonText, QColor("#ffffff"))
+                        pal.setColor(QPalette.ColorRole.ButtonText, _TEXT_WHITE)
                         btn.setPalette(pal)
                     except Exception:
                         pass
@@ -511,7 +749,6 @@ class LogDialog(QDialog):
         # Info label with enhanced styling
         self.history_info_label = QLabel("Download history (last 30 downloads)")
         try:
-            from theme import get_palette, get_current_theme_key, Theme
             _p = get_palette()
             _key = get_current_theme_key()
             if _key == Theme.DARK:
@@ -558,16 +795,28 @@ class LogDialog(QDialog):
         self.history_layout = QVBoxLayout(self.history_widget)
         self.history_layout.setSpacing(8)
         self.history_layout.setContentsMargins(5, 5, 5, 5)
+        self.history_layout.addStretch()
 
-        # Add shadow to scroll area
-        scroll_shadow = QGraphicsDropShadowEffect()
-        scroll_shadow.setBlurRadius(8)
-        scroll_shadow.setXOffset(0)
-        scroll_shadow.setYOffset(2)
-        scroll_shadow.setColor(QColor(0, 0, 0, 15))
-        scroll.setGraphicsEffect(scroll_shadow)
+        # Entry widgets are pooled and recycled across history reloads
+        self._history_widget_pool = []
+        self._no_history_frame = None
+        self._history_error_frame = None
+        self._qss_cache = None
+        # Entries for the current filter and how many of them have widgets filled in
+        self._history_visible = ()
+        self._history_rendered = 0
 
+        try:
+            self.history_widget.setStyleSheet(self._build_entry_qss())
+        except Exception:
+            pass
         scroll.setWidget(self.history_widget)
+        scroll.verticalScrollBar().valueChanged.connect(self._on_history_scrolled)
+        # Keep filling while the rendered entries do not yet overflow the viewport
+        scroll.verticalScrollBar().rangeChanged.connect(
+            lambda *_: self._on_history_scrolled(scroll.verticalScrollBar().value())
+        )
+        self.history_scroll = scroll
         layout.addWidget(scroll)
 
     def load_initial_data(self):
@@ -582,51 +831,103 @@ class LogDialog(QDialog):
         """Load existing real-time logs"""
         try:
             logs = self.log_manager.get_realtime_logs()
-            # Force all text color per theme (white in Dark, black in Default/YouTube)
-            from theme import get_current_theme_key, Theme
-            _key = get_current_theme_key()
-            forced_color = '#ffffff' if _key == Theme.DARK else '#000000'
-            self.realtime_text.clear()
-
-            for log_entry in logs:
-                level = log_entry.get('level', 'INFO')
-                timestamp = log_entry.get('timestamp', '')
-                message = log_entry.get('message', '')
-
-                # Force prefix and message to the same theme-driven color
-                formatted_log = f'<span style="color: {forced_color}; font-weight: 500;">[{timestamp}] [{level}]</span> <span style="color: {forced_color};">{message}</span>'
-                self.realtime_text.append(formatted_log)
-
-            # Scroll to bottom
-            cursor = self.realtime_text.textCursor()
-            cursor.movePosition(cursor.MoveOperation.End)
-            self.realtime_text.setTextCursor(cursor)
+            template = self._html_template
+            # Buffered lines are already part of the manager's logs
+            self._pending_logs.clear()
+
+            clock = self._clock_text
+            parts = [
+                template % (clock(log_entry.get('ts', 0.0)), log_entry.get('level', 'INFO'), log_entry.get('message', ''))
+                for log_entry in logs
+            ]
+            # One document edit instead of an append per line
+            self._insert_log_lines(parts, replace=True)
         except Exception as e:
             print(f"Error loading realtime logs: {e}")
             self.realtime_text.setText(f"Error loading logs: {str(e)}")
 
-    def add_realtime_log(self, formatted_message, level):
-        """Add new real-time log entry"""
+    @pyqtSlot(str, str, float)
+    def add_realtime_log(self, message, level, ts):
+        """Queue a new real-time log entry for the next batched flush"""
         try:
             if self.isVisible() and self.tabs.currentWidget() == self.realtime_tab:
-                # Force both prefix and message to the theme-driven color
-                from theme import get_current_theme_key, Theme
-                _key = get_current_theme_key()
-                forced_color = '#ffffff' if _key == Theme.DARK else '#000000'
-                # Extract the message part after the timestamp
-                message_parts = formatted_message.split("] ", 1)
-                message = message_parts[-1] if len(message_parts) > 1 else formatted_message
-                timestamp = datetime.now().strftime("%H:%M:%S")
-                formatted_log = f'<span style="color: {forced_color}; font-weight: 500;">[{timestamp}] [{level}]</span> <span style="color: {forced_color};">{message}</span>'
-                self.realtime_text.append(formatted_log)
-
-                # Auto-scroll to bottom
-                cursor = self.realtime_text.textCursor()
-                cursor.movePosition(cursor.MoveOperation.End)
-                self.realtime_text.setTextCursor(cursor)
+                timestamp = self._clock_text(ts)
+                formatted_log = self._html_template % (timestamp, level, message)
+                # Intermediate progress values are stale; keep only the latest
+                pending = self._pending_logs
+                if level == 'PROGRESS' and pending and pending[-1][0] == 'PROGRESS':
+                    pending.pop()
+                pending.append((level, formatted_log))
+                if not self._log_flush_timer.isActive():
+                    self._log_flush_timer.start()
         except Exception as e:
             print(f"Error adding realtime log: {e}")
 
+    @pyqtSlot(list)
+    def add_realtime_logs(self, entries):
+        """Queue a batch of real-time log entries emitted by LogManager.log_many"""
+        for message, level, ts in entries:
+            self.add_realtime_log(message, level, ts)
+
+    def _clock_text(self, ts):
+        """Format an epoch timestamp as HH:MM:SS, reusing the string within the same second."""
+        sec = int(ts)
+        if sec != self._clock_sec:
+            self._clock_sec = sec
+            self._clock_str = time.strftime("%H:%M:%S", time.localtime(ts))
+        return self._clock_str
+
+    def _rebuild_log_template(self):
+        """Bake the theme-driven text color into the real-time log line template."""
+        # Force prefix and message to the same color (white in Dark, black in Default/YouTube)
+        try:
+            self._is_dark = get_current_theme_key() == Theme.DARK
+        except Exception:
+            self._is_dark = False
+        forced_color = self._forced_color = '#ffffff' if self._is_dark else '#000000'
+        self._html_template = (
+            f'<span style="color: {forced_color}; font-weight: 500;">[%s] [%s]</span> '
+            f'<span style="color: {forced_color};">%s</span>'
+        )
+
+    def _flush_pending_logs(self):
+        """Append all buffered real-time lines in a single document update"""
+        pending = self._pending_logs
+        if not pending:
+            self._log_flush_timer.stop()
+            return
+        try:
+            lines = [html for _, html in pending]
+            pending.clear()
+            self._insert_log_lines(lines)
+        except Exception as e:
+            print(f"Error flushing realtime logs: {e}")
+
+    def _insert_log_lines(self, lines, replace=False):
+        """Write each line as its own block inside one edit block, then scroll to the end."""
+        doc = self.realtime_text.document()
+        cursor = QTextCursor(doc)
+        cursor.beginEditBlock()
+        try:
+            if replace:
+                cursor.select(QTextCursor.SelectionType.Document)
+                cursor.removeSelectedText()
+            else:
+                cursor.movePosition(QTextCursor.MoveOperation.End)
+            needs_block = not doc.isEmpty()
+            for html in lines:
+                if needs_block:
+                    cursor.insertBlock()
+                cursor.insertHtml(html)
+                needs_block = True
+        finally:
+            cursor.endEditBlock()
+
+        # Auto-scroll to bottom
+        view_cursor = self.realtime_text.textCursor()
+        view_cursor.movePosition(QTextCursor.MoveOperation.End)
+        self.realtime_text.setTextCursor(view_cursor)
+
     def get_log_color(self, level):
         """Get color for log level"""
         colors = {
@@ -641,57 +942,39 @@ class LogDialog(QDialog):
 
     def load_history(self):
         """Load download history"""
+        # Suspend painting and relayout the container once after all entries are filled
+        container = self.history_widget
+        container.setUpdatesEnabled(False)
+        container.hide()
+        blocker = QSignalBlocker(container)
         try:
-            # Clear existing history widgets safely
-            while self.history_layout.count():
-                child = self.history_layout.takeAt(0)
-                if child.widget():
-                    child.widget().setParent(None)
+            # Drop any error placeholder left by a previous failed load
+            if self._history_error_frame is not None:
+                self._history_error_frame.setParent(None)
+                self._history_error_frame = None
 
             history = self.log_manager.get_download_history()
 
-            if not history:
-                no_history_frame = QFrame()
-                no_history_frame.setStyleSheet("""
-                    QFrame {
-                        background: rgba(248, 250, 252, 0.8);
-                        border: 2px dashed #cbd5e1;
-                        border-radius: 12px;
-                        padding: 20px;
-                        margin: 10px;
-                    }
-                """)
-                no_history_layout = QVBoxLayout(no_history_frame)
-                no_history_label = QLabel("📂 No download history available")
-                no_history_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                try:
-                    from theme import get_current_theme_key, Theme
-                    _key = get_current_theme_key()
-                    forced = '#ffffff' if _key == Theme.DARK else '#000000'
-                    no_history_label.setStyleSheet(
-                        f"color: {forced}; font-style: italic; font-size: 16px; font-weight: 500;"
-                    )
-                except Exception:
-                    no_history_label.setStyleSheet(
-                        "color: #1e293b; font-style: italic; font-size: 16px; font-weight: 500;"
-                    )
-                no_history_layout.addWidget(no_history_label)
-                self.history_layout.addWidget(no_history_frame)
-                return
+            # Filtered entries come straight from the manager's per-status snapshot; most recent first
+            filtered = self.log_manager.get_download_history(self.current_filter)
 
-            # Apply filter and show most recent first
-            filtered = []
-            if self.current_filter == 'all':
-                filtered = history
-            else:
-                filtered = [e for e in history if e.get('status') == self.current_filter]
-            for entry in reversed(filtered):
-                self.create_history_entry_widget(entry)
+            # Render the first page now; further pages are filled in as the user scrolls
+            self._history_visible = tuple(reversed(filtered))
+            count = min(len(self._history_visible), max(self._history_rendered, HISTORY_PAGE_SIZE))
+            self._history_rendered = 0
+            self._render_history_until(count)
+            for frame in self._history_widget_pool[count:]:
+                frame.hide()
 
-            # Add stretch at the end
-            self.history_layout.addStretch()
+            if history:
+                if self._no_history_frame is not None:
+                    self._no_history_frame.hide()
+            else:
+                self._show_no_history_frame()
         except Exception as e:
             print(f"Error loading history: {e}")
+            for frame in self._history_widget_pool:
+                frame.hide()
             error_frame = QFrame()
             error_frame.setStyleSheet("""
                 QFrame {
@@ -707,332 +990,431 @@ class LogDialog(QDialog):
             error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             error_label.setStyleSheet("color: #dc2626; font-style: italic; font-size: 14px; font-weight: 500;")
             error_layout.addWidget(error_label)
-            self.history_layout.addWidget(error_frame)
+            self.history_layout.insertWidget(0, error_frame)
+            self._history_error_frame = error_frame
+        finally:
+            blocker.unblock()
+            container.show()
+            container.setUpdatesEnabled(True)
+            container.updateGeometry()
+
+    def _render_history_until(self, count):
+        """Fill pooled entry widgets up to `count` visible entries"""
+        # Recycle pooled entry widgets; only create new ones when the pool is too small
+        pool = self._history_widget_pool
+        while len(pool) < count:
+            frame = self.create_history_entry_widget()
+            # Keep the trailing stretch last
+            self.history_layout.insertWidget(self.history_layout.count() - 1, frame)
+            pool.append(frame)
+        for i in range(self._history_rendered, count):
+            self.update_history_entry_widget(pool[i], self._history_visible[i])
+            pool[i].show()
+        self._history_rendered = max(self._history_rendered, count)
+
+    def _on_history_scrolled(self, value):
+        """Render the next page of history entries when scrolled near the bottom"""
+        if self._history_rendered >= len(self._history_visible):
+            return
+        bar = self.history_scroll.verticalScrollBar()
+        if value >= bar.maximum() - bar.pageStep() // 2:
+            try:
+                self._render_history_until(
+                    min(len(self._history_visible), self._history_rendered + HISTORY_PAGE_SIZE)
+                )
+            except Exception as e:
+                print(f"Error loading more history: {e}")
+
+    def _show_no_history_frame(self):
+        """Show the empty-history placeholder, creating it on first use"""
+        if self._no_history_frame is None:
+            no_history_frame = QFrame()
+            no_history_frame.setStyleSheet("""
+                QFrame {
+                    background: rgba(248, 250, 252, 0.8);
+                    border: 2px dashed #cbd5e1;
+                    border-radius: 12px;
+                    padding: 20px;
+                    margin: 10px;
+                }
+            """)
+            no_history_layout = QVBoxLayout(no_history_frame)
+            self._no_history_label = QLabel("📂 No download history available")
+            self._no_history_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            no_history_layout.addWidget(self._no_history_label)
+            self.history_layout.insertWidget(self.history_layout.count() - 1, no_history_frame)
+            self._no_history_frame = no_history_frame
+        self._no_history_label.setStyleSheet(
+            f"color: {self._forced_color}; font-style: italic; font-size: 16px; font-weight: 500;"
+        )
+        self._no_history_frame.show()
+
+    def create_history_entry_widget(self):
+        """Create an empty, reusable widget for a history entry"""
+        frame = QFrame()
+        frame.setFrameStyle(QFrame.Shape.NoFrame)
+        # No repaints while the child widgets are being added
+        frame.setUpdatesEnabled(False)
+
+        layout = QVBoxLayout(frame)
+        layout.setSpacing(8)
+        layout.setContentsMargins(16, 12, 16, 12)
+
+        # Title and status row
+        title_layout = QHBoxLayout()
+        title_layout.setSpacing(12)
+        frame._title_label = ElidedLabel()
+        frame._status_label = QLabel()
+        frame._status_label.setFixedHeight(28)
+        title_layout.addWidget(frame._title_label, 1)
+        title_layout.addWidget(frame._status_label, 0)
+        layout.addLayout(title_layout)
+
+        # Details row 1 - Date and Resolution
+        details1_layout = QHBoxLayout()
+        details1_layout.setSpacing(20)
+
+        # Date row with calendar SVG icon
+        frame._date_icon_label = QLabel()
+        frame._date_icon_is_text = False
+        try:
+            frame._date_icon_label.setPixmap(_cached_pixmap("assets/icons/common-calendar.svg", 14))
+        except Exception:
+            frame._date_icon_label.setText("📅")
+            frame._date_icon_is_text = True
+        frame._date_label = QLabel()
+        frame._resolution_label = QLabel()
+        details1_layout.addWidget(frame._date_icon_label)
+        details1_layout.addWidget(frame._date_label)
+        details1_layout.addWidget(frame._resolution_label)
+        details1_layout.addStretch()
+        layout.addLayout(details1_layout)
+
+        # Details row 2 - Duration, Size, and Features
+        details2_layout = QHBoxLayout()
+        details2_layout.setSpacing(20)
+        frame._duration_label = QLabel()
+        frame._size_label = QLabel()
+        details2_layout.addWidget(frame._duration_label)
+        details2_layout.addWidget(frame._size_label)
+
+        # Feature tags
+        features_layout = QHBoxLayout()
+        features_layout.setSpacing(8)
+
+        # Audio-only indicator (icon) when resolution is 'Audio'
+        frame._audio_icon_label = QLabel()
+        frame._audio_icon_is_text = False
+        try:
+            frame._audio_icon_label.setPixmap(_cached_pixmap("assets/icons/common-audio.svg", 14))
+        except Exception:
+            frame._audio_icon_label.setText("Audio")
+            frame._audio_icon_is_text = True
+        frame._batch_tag = QLabel("Batch")
+        frame._subs_tag = QLabel("Subs")
+        features_layout.addWidget(frame._audio_icon_label)
+        features_layout.addWidget(frame._batch_tag)
+        features_layout.addWidget(frame._subs_tag)
+
+        details2_layout.addLayout(features_layout)
+        details2_layout.addStretch()
+        layout.addLayout(details2_layout)
+
+        # Error message if failed
+        frame._error_frame = QFrame()
+        frame._error_frame.setStyleSheet("""
+            QFrame {
+                background: rgba(254, 226, 226, 0.8);
+                border: 1px solid #fca5a5;
+                border-radius: 6px;
+                padding: 8px;
+                margin-top: 4px;
+            }
+        """)
+        error_layout = QVBoxLayout(frame._error_frame)
+        error_layout.setContentsMargins(8, 6, 8, 6)
+        frame._error_label = ElidedLabel()
+        error_layout.addWidget(frame._error_label)
+        layout.addWidget(frame._error_frame)
+
+        # Actions row; the buttons themselves are built on first hover or focus
+        frame._actions_row = QWidget()
+        frame._actions_row.setFixedHeight(28)
+        frame._actions_layout = QHBoxLayout(frame._actions_row)
+        frame._actions_layout.setContentsMargins(0, 0, 0, 0)
+        frame._actions_layout.setSpacing(10)
+        frame._open_folder_btn = None
+        frame._retry_btn = None
+        frame._action_state = None
+        layout.addWidget(frame._actions_row)
+        # Focusable so keyboard and touch users can reach the lazily built buttons
+        frame.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        frame.installEventFilter(self)
+
+        frame.setUpdatesEnabled(True)
+        return frame
+
+    def eventFilter(self, obj, event):
+        if (event.type() in (QEvent.Type.Enter, QEvent.Type.FocusIn)
+                and getattr(obj, '_actions_row', None) is not None
+                and obj._open_folder_btn is None):
+            self._build_entry_actions(obj)
+        return super().eventFilter(obj, event)
+
+    def _build_entry_actions(self, frame):
+        """Create the Open Folder / Retry buttons of a history entry."""
+        open_folder_btn = QPushButton("Open Folder")
+        open_folder_btn.setFixedHeight(28)
+        retry_btn = QPushButton("Retry")
+        retry_btn.setFixedHeight(28)
+
+        # Shared slots; each button carries the data of the entry it currently shows
+        open_folder_btn.clicked.connect(self._on_open_folder_clicked)
+        retry_btn.clicked.connect(self._on_retry_clicked)
+
+        frame._actions_layout.addWidget(open_folder_btn)
+        frame._actions_layout.addStretch()
+        frame._actions_layout.addWidget(retry_btn)
+        frame._open_folder_btn = open_folder_btn
+        frame._retry_btn = retry_btn
+        # New widgets join the end of the focus chain; Tab from the entry should reach its buttons
+        QWidget.setTabOrder(frame, open_folder_btn)
+        QWidget.setTabOrder(open_folder_btn, retry_btn)
+        self._apply_entry_actions(frame)
+
+    def _apply_entry_actions(self, frame):
+        """Push the entry's action state onto its buttons, if they exist yet."""
+        open_folder_btn = frame._open_folder_btn
+        retry_btn = frame._retry_btn
+        state = frame._action_state
+        if open_folder_btn is None or state is None:
+            return
+        status, dl_path, payload = state
+        qss = self._entry_qss()
+        open_folder_btn.setProperty('download_path', dl_path or '')
+        retry_btn._retry_payload = payload
+        _set_qss(open_folder_btn, qss['action_open'])
+        _set_qss(retry_btn, qss['action_retry'])
+
+        # Enable/disable actions based on status
+        if status == 'completed':
+            retry_btn.setEnabled(False)
+            retry_btn.setToolTip("Already downloaded successfully")
+        else:
+            # Not completed (failed or other): allow retry
+            retry_btn.setEnabled(True)
+            retry_btn.setToolTip("")
+        # Disable 'Open Folder' for failed entries or when path missing
+        if status == 'failed' or not dl_path:
+            open_folder_btn.setEnabled(False)
+            open_folder_btn.setToolTip("Unavailable for failed downloads or missing file path")
+        else:
+            open_folder_btn.setEnabled(True)
+            open_folder_btn.setToolTip("")
 
-    def create_history_entry_widget(self, entry):
-        """Create a widget for a history entry"""
+    def _entry_qss(self):
+        """Per-theme stylesheets shared by all history entries (rebuilt after a theme change)"""
+        if self._qss_cache is not None:
+            return self._qss_cache
         try:
-            try:
-                from theme import get_palette, get_current_theme_key, Theme
-                _p = get_palette()
-                _key = get_current_theme_key()
-                if _key == Theme.DARK:
-                    _text = '#ffffff'
-                elif _key in (Theme.DEFAULT, Theme.YOUTUBE):
-                    _text = '#000000'
-                else:
-                    _text = _p['text']
-            except Exception:
-                _p, _text = None, "#e5e7eb"
-            frame = QFrame()
-            frame.setFrameStyle(QFrame.Shape.NoFrame)
+            _p = get_palette()
+            _key = get_current_theme_key()
+            _is_dark = _key == Theme.DARK
+            if _is_dark:
+                _text = '#ffffff'
+            elif _key in (Theme.DEFAULT, Theme.YOUTUBE):
+                _text = '#000000'
+            else:
+                _text = _p['text']
+        except Exception:
+            _p, _is_dark, _text = None, False, "#e5e7eb"
+
+        # One substitution mapping per theme, shared by all entry templates
+        ctx = {'text': _text}
+        qss = {
+            'title': _ENTRY_TITLE_TPL.format_map(ctx),
+            'detail': _ENTRY_DETAIL_TPL.format_map(ctx),
+            'audio_text': _ENTRY_AUDIO_TEXT_TPL.format_map(ctx),
+            'batch_tag': _ENTRY_TAG_TPL.format_map({**ctx, 'stop0': '#ddd6fe', 'stop1': '#c4b5fd'}),
+            'subs_tag': _ENTRY_TAG_TPL.format_map({**ctx, 'stop0': '#fed7aa', 'stop1': '#fdba74'}),
+            'action_open': '',
+            'action_retry': '',
+        }
+
+        # Status badges: high-contrast text in dark; colored text in light themes
+        if _p is None:
+            badge_tpl = _ENTRY_BADGE_PLAIN_TPL
+        elif _is_dark:
+            # Dark: light text on a soft tinted badge
+            badge_tpl = _ENTRY_BADGE_DARK_TPL
+        else:
+            badge_tpl = _ENTRY_BADGE_LIGHT_TPL
+        for status, (status_color, dark_bg) in _ENTRY_BADGE_COLORS.items():
+            qss['badge_' + status] = badge_tpl.format_map({**ctx, 'color': status_color, 'bg': dark_bg})
+
+        if _p is not None:
+            qss['error'] = _ENTRY_ERROR_TPL.format_map({'color': '#ffffff' if _is_dark else '#000000'})
+        else:
+            qss['error'] = _ENTRY_ERROR_TPL.format_map({'color': '#1e293b'})
+
+        # Theme-aware contrast for action buttons
+        try:
+            if _is_dark:
+                # Use themed info button style in dark
+                qss['action_open'] = button_style('info', radius=6, padding='6px 12px')
+                qss['action_retry'] = button_style('primary', radius=6, padding='6px 12px')
+            else:
+                # Light/YouTube: neutral outline buttons with dark text
+                primary = _p['primary']
+                actions_qss = _ENTRY_ACTIONS_LIGHT_TPL.format_map({
+                    'border': _p['border'],
+                    'hover_bg': _rgba(primary, 0.10),
+                    'hover_border': _rgba(primary, 0.35),
+                    'pressed_bg': _rgba(primary, 0.16),
+                    'pressed_border': _rgba(primary, 0.45),
+                })
+                qss['action_open'] = actions_qss
+                qss['action_retry'] = actions_qss
+        except Exception:
+            pass
+
+        self._qss_cache = qss
+        return qss
+
+    def update_history_entry_widget(self, frame, entry):
+        """Fill a (possibly recycled) history entry widget with entry data"""
+        try:
+            qss = self._entry_qss()
+
+            # Read every field once up front
+            _g = entry.get
+            status = _g('status', 'unknown')
+            title = _g('title', 'Unknown Title')
+            timestamp_str = _g('timestamp')
+            resolution = _g('resolution', 'Unknown')
+            duration = _g('duration')
+            file_size = _g('file_size')
+            batch_mode = _g('batch_mode', False)
+            download_subs = _g('download_subs', False)
+            error = _g('error')
+            dl_path = _g('download_path')
 
             # Set object name based on status for styling
-            status = entry.get('status', 'unknown')
             if status == 'completed':
-                frame.setObjectName("history_entry_success")
+                object_name = "history_entry_success"
             elif status == 'failed':
-                frame.setObjectName("history_entry_failed")
+                object_name = "history_entry_failed"
             else:
-                frame.setObjectName("history_entry")
-
-            # Add shadow effect to each entry
-            entry_shadow = QGraphicsDropShadowEffect()
-            entry_shadow.setBlurRadius(8)
-            entry_shadow.setXOffset(0)
-            entry_shadow.setYOffset(2)
-            entry_shadow.setColor(QColor(0, 0, 0, 15))
-            frame.setGraphicsEffect(entry_shadow)
-
-            layout = QVBoxLayout(frame)
-            layout.setSpacing(8)
-            layout.setContentsMargins(16, 12, 16, 12)
-
-            # Title and status row
-            title_layout = QHBoxLayout()
-            title_layout.setSpacing(12)
-
-            title = entry.get('title', 'Unknown Title')
-            if len(title) > 65:  # Slightly more generous length
-                title = title[:62] + "..."
-
-            title_label = QLabel(f"{title}")
-            title_label.setStyleSheet(f"font-weight: 600; color: {_text}; font-size: 15px; padding: 2px 0px;")
-            title_label.setWordWrap(True)
-
-            status_color = '#22c55e' if status == 'completed' else '#ef4444' if status == 'failed' else '#6366f1'
-            status_label = QLabel(f"{status.upper()}")
-            try:
-                # Use high-contrast text in dark; colored text in light themes
-                from theme import get_current_theme_key, Theme
-                _key = get_current_theme_key()
-                if _key == Theme.DARK:
-                    # Dark: light text on a soft tinted badge
-                    if status == 'completed':
-                        badge_bg = 'rgba(34, 197, 94, 0.18)'
-                    elif status == 'failed':
-                        badge_bg = 'rgba(239, 68, 68, 0.18)'
-                    else:
-                        badge_bg = 'rgba(99, 102, 241, 0.18)'
-                    status_label.setStyleSheet(
-                        f"color: {_text}; font-weight: 700; font-size: 13px; padding: 4px 8px; "
-                        f"background: {badge_bg}; border-radius: 6px; border: 1px solid transparent;"
-                    )
-                else:
-                    status_label.setStyleSheet(f"""
-                        color: {_text};
-                font-weight: 700; 
-                font-size: 13px;
-                padding: 4px 8px;
-                background: rgba(255, 255, 255, 0.7);
-                border-radius: 6px;
-                border: 1px solid {status_color}40;
-            """)
-            except Exception:
-                status_label.setStyleSheet(f"color: {status_color}; font-weight: 700; font-size: 13px; padding: 4px 8px;")
-            status_label.setFixedHeight(28)
+                object_name = "history_entry"
+            if frame.objectName() != object_name:
+                frame.setObjectName(object_name)
+                # Re-resolve the objectName-based QSS rules for the recycled frame
+                frame.style().unpolish(frame)
+                frame.style().polish(frame)
 
-            title_layout.addWidget(title_label, 1)
-            title_layout.addWidget(status_label, 0)
-            layout.addLayout(title_layout)
+            # Long titles are elided by the label itself at paint time
+            frame._title_label.setText(title)
+            frame._title_label.setToolTip(title)
+            _set_qss(frame._title_label, qss['title'])
 
-            # Details row 1 - Date and Resolution
-            details1_layout = QHBoxLayout()
-            details1_layout.setSpacing(20)
+            frame._status_label.setText(f"{status.upper()}")
+            badge_key = status if status in ('completed', 'failed') else 'other'
+            _set_qss(frame._status_label, qss['badge_' + badge_key])
 
-            timestamp_str = entry.get('timestamp')
-            date_text = "Unknown Date"
-            if timestamp_str:
-                try:
-                    if 'T' in timestamp_str:
-                        dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                    else:
-                        dt = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-                    date_text = f"{dt.strftime('%Y-%m-%d %H:%M:%S')}"
-                except (ValueError, TypeError):
-                    date_text = f"{timestamp_str}"
+            date_text = _format_history_date(timestamp_str) if timestamp_str else "Unknown Date"
 
-            # Date row with calendar SVG icon
-            date_icon_label = QLabel()
-            try:
-                from theme import load_svg_icon
-                _cal_icon = load_svg_icon("assets/icons/common-calendar.svg", None, 14)
-                date_icon_label.setPixmap(_cal_icon.pixmap(14, 14))
-            except Exception:
-                date_icon_label.setText("📅")
-                date_icon_label.setStyleSheet(f"color: {_text}; font-size: 12px; font-weight: 500;")
-
-            date_label = QLabel(date_text)
-            date_label.setStyleSheet(f"color: {_text}; font-size: 12px; font-weight: 500;")
-
-            resolution_label = QLabel(f"{entry.get('resolution', 'Unknown')}")
-            resolution_label.setStyleSheet(f"color: {_text}; font-size: 12px; font-weight: 500;")
+            if frame._date_icon_is_text:
+                _set_qss(frame._date_icon_label, qss['detail'])
 
-            details1_layout.addWidget(date_icon_label)
-            details1_layout.addWidget(date_label)
-            details1_layout.addWidget(resolution_label)
-            details1_layout.addStretch()
-            layout.addLayout(details1_layout)
+            frame._date_label.setText(date_text)
+            _set_qss(frame._date_label, qss['detail'])
 
-            # Details row 2 - Duration, Size, and Features
-            details2_layout = QHBoxLayout()
-            details2_layout.setSpacing(20)
+            frame._resolution_label.setText(f"{resolution}")
+            _set_qss(frame._resolution_label, qss['detail'])
 
-            duration = entry.get('duration')
             if duration and duration != 'Unknown':
-                duration_label = QLabel(f"{duration}")
-                duration_label.setStyleSheet(f"color: {_text}; font-size: 12px; font-weight: 500;")
-                details2_layout.addWidget(duration_label)
+                frame._duration_label.setText(f"{duration}")
+                _set_qss(frame._duration_label, qss['detail'])
+                frame._duration_label.show()
+            else:
+                frame._duration_label.hide()
 
-            file_size = entry.get('file_size')
             if file_size:
-                size_label = QLabel(f"{file_size}")
-                size_label.setStyleSheet(f"color: {_text}; font-size: 12px; font-weight: 500;")
-                details2_layout.addWidget(size_label)
-
-            # Feature tags
-            features_layout = QHBoxLayout()
-            features_layout.setSpacing(8)
+                frame._size_label.setText(f"{file_size}")
+                _set_qss(frame._size_label, qss['detail'])
+                frame._size_label.show()
+            else:
+                frame._size_label.hide()
 
             # Audio-only indicator (icon) when resolution is 'Audio'
-            try:
-                res_text = str(entry.get('resolution', '') or '').strip().lower()
-                if res_text == 'audio':
-                    audio_icon_label = QLabel()
-                    try:
-                        from theme import load_svg_icon
-                        audio_icon = load_svg_icon("assets/icons/common-audio.svg", None, 14)
-                        audio_icon_label.setPixmap(audio_icon.pixmap(14, 14))
-                    except Exception:
-                        audio_icon_label.setText("Audio")
-                        audio_icon_label.setStyleSheet(f"color: {_text}; font-size: 10px; font-weight: 600;")
-                    features_layout.addWidget(audio_icon_label)
-            except Exception:
-                pass
-
-            if entry.get('batch_mode'):
-                batch_tag = QLabel("Batch")
-                batch_tag.setStyleSheet(f"""
-                    background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                                               stop: 0 #ddd6fe, stop: 1 #c4b5fd);
-                    color: {_text};
-                    padding: 3px 8px;
-                    border-radius: 4px;
-                    font-size: 10px;
-                    font-weight: 600;
-                """)
-                features_layout.addWidget(batch_tag)
-
-            if entry.get('download_subs'):
-                subs_tag = QLabel("Subs")
-                subs_tag.setStyleSheet(f"""
-                    background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                                               stop: 0 #fed7aa, stop: 1 #fdba74);
-                    color: {_text};
-                    padding: 3px 8px;
-                    border-radius: 4px;
-                    font-size: 10px;
-                    font-weight: 600;
-                """)
-                features_layout.addWidget(subs_tag)
+            is_audio = _g('_resolution_norm') == 'audio'
+            if is_audio and frame._audio_icon_is_text:
+                _set_qss(frame._audio_icon_label, qss['audio_text'])
+            frame._audio_icon_label.setVisible(is_audio)
+
+            if batch_mode:
+                _set_qss(frame._batch_tag, qss['batch_tag'])
+                frame._batch_tag.show()
+            else:
+                frame._batch_tag.hide()
 
-            details2_layout.addLayout(features_layout)
-            details2_layout.addStretch()
-            layout.addLayout(details2_layout)
+            if download_subs:
+                _set_qss(frame._subs_tag, qss['subs_tag'])
+                frame._subs_tag.show()
+            else:
+                frame._subs_tag.hide()
 
             # Error message if failed
-            if status == 'failed' and entry.get('error'):
-                error_msg = str(entry['error'])
-                if len(error_msg) > 120:  # More generous error message length
-                    error_msg = error_msg[:117] + "..."
-
-                error_frame = QFrame()
-                error_frame.setStyleSheet("""
-                    QFrame {
-                        background: rgba(254, 226, 226, 0.8);
-                        border: 1px solid #fca5a5;
-                        border-radius: 6px;
-                        padding: 8px;
-                        margin-top: 4px;
-                    }
-                """)
-                error_layout = QVBoxLayout(error_frame)
-                error_layout.setContentsMargins(8, 6, 8, 6)
-
-                error_label = QLabel(f"{error_msg}")
-                try:
-                    from theme import get_current_theme_key, Theme
-                    _key = get_current_theme_key()
-                    forced = '#ffffff' if _key == Theme.DARK else '#000000'
-                    error_label.setStyleSheet(f"color: {forced}; font-size: 12px; font-style: italic; font-weight: 500;")
-                except Exception:
-                    error_label.setStyleSheet("color: #1e293b; font-size: 12px; font-style: italic; font-weight: 500;")
-                error_label.setWordWrap(True)
-                error_layout.addWidget(error_label)
-                layout.addWidget(error_frame)
-
-            # Actions row
-            actions_layout = QHBoxLayout()
-            actions_layout.setSpacing(10)
-            open_folder_btn = QPushButton("Open Folder")
-            open_folder_btn.setFixedHeight(28)
-            retry_btn = QPushButton("Retry")
-            retry_btn.setFixedHeight(28)
-            # Theme-aware contrast for action buttons
-            try:
-                from theme import get_palette, get_current_theme_key, Theme
-                _p = get_palette()
-                _key = get_current_theme_key()
-                if _key == Theme.DARK:
-                    # Use themed info button style in dark
-                    from theme import button_style
-                    open_folder_btn.setStyleSheet(button_style('info', radius=6, padding='6px 12px'))
-                    retry_btn.setStyleSheet(button_style('primary', radius=6, padding='6px 12px'))
-                else:
-                    # Light/YouTube: neutral outline buttons with dark text
-                    actions_qss = f"""
-                        QPushButton {{
-                            background: transparent;
-                            color: #000000;
-                            border: 1px solid {_p['border']};
-                            border-radius: 6px;
-                            padding: 6px 12px;
-                            font-weight: 600;
-                        }}
-                        QPushButton:hover {{
-                            background: {_rgba(_p['primary'], 0.10)};
-                            border-color: {_rgba(_p['primary'], 0.35)};
-                        }}
-                        QPushButton:pressed {{
-                            background: {_rgba(_p['primary'], 0.16)};
-                            border-color: {_rgba(_p['primary'], 0.45)};
-                        }}
-                    """
-                    open_folder_btn.setStyleSheet(actions_qss)
-                    retry_btn.setStyleSheet(actions_qss)
-            except Exception:
-                pass
-
-            def _open_folder(path):
-                try:
-                    if not path:
-                        return
-                    import platform, subprocess
-                    if platform.system().lower() == 'darwin':
-                        subprocess.Popen(['open', path])
-                    elif platform.system().lower() == 'windows':
-                        os.startfile(path)
-                    else:
-                        subprocess.Popen(['xdg-open', path])
-                except Exception as e:
-                    print(f"Error opening folder: {e}")
+            if status == 'failed' and error:
+                error_msg = str(error)
+                frame._error_label.setText(error_msg)
+                frame._error_label.setToolTip(error_msg)
+                _set_qss(frame._error_label, qss['error'])
+                frame._error_frame.show()
+            else:
+                frame._error_frame.hide()
 
-            open_folder_btn.clicked.connect(lambda _, p=entry.get('download_path'): _open_folder(p))
+            frame._action_state = (status, dl_path, {
+                'url': _g('url'),
+                'resolution': _g('resolution'),
+                'download_subs': download_subs,
+                'download_path': dl_path,
+                'batch_mode': batch_mode
+            })
+            self._apply_entry_actions(frame)
+        except Exception as e:
+            print(f"Error creating history entry: {e}")
 
-            def _retry():
-                if callable(self.on_retry):
-                    self.on_retry({
-                        'url': entry.get('url'),
-                        'resolution': entry.get('resolution'),
-                        'download_subs': entry.get('download_subs', False),
-                        'download_path': entry.get('download_path'),
-                        'batch_mode': entry.get('batch_mode', False)
-                    })
+    def _on_open_folder_clicked(self):
+        self._open_folder(self.sender().property('download_path'))
 
-            retry_btn.clicked.connect(_retry)
+    def _on_retry_clicked(self):
+        payload = getattr(self.sender(), '_retry_payload', None)
+        if payload and callable(self.on_retry):
+            self.on_retry(payload)
 
-            # Enable/disable actions based on status
-            try:
-                if status == 'completed':
-                    retry_btn.setEnabled(False)
-                    retry_btn.setToolTip("Already downloaded successfully")
-                else:
-                    # Not completed (failed or other): allow retry
-                    retry_btn.setEnabled(True)
-                # Disable 'Open Folder' for failed entries or when path missing
-                dl_path = entry.get('download_path')
-                if status == 'failed' or not dl_path:
-                    open_folder_btn.setEnabled(False)
-                    open_folder_btn.setToolTip("Unavailable for failed downloads or missing file path")
-                else:
-                    open_folder_btn.setEnabled(True)
-            except Exception:
-                pass
-
-            actions_layout.addWidget(open_folder_btn)
-            actions_layout.addStretch()
-            actions_layout.addWidget(retry_btn)
-            layout.addLayout(actions_layout)
-
-            self.history_layout.addWidget(frame)
+    def _open_folder(self, path):
+        if not path:
+            return
+        try:
+            _open_path(path)
         except Exception as e:
-            print(f"Error creating history entry: {e}")
+            print(f"Error opening folder: {e}")
 
     def refresh_data(self):
+        """Schedule a refresh, coalescing rapid repeated requests into one"""
+        self._pending_refresh = True
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start(150)
+
+    def _do_refresh(self):
         """Refresh all data safely"""
+        if not self._pending_refresh:
+            return
+        self._pending_refresh = False
         try:
             # Reload history from file in case it was updated externally
-            self.log_manager.download_history = self.log_manager.load_history()
+            self.log_manager.reload_history()
 
             # Refresh both tabs
             self.load_realtime_logs()
@@ -1056,7 +1438,6 @@ class LogDialog(QDialog):
                 success_label = QLabel("Data refreshed successfully")
                 success_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 try:
-                    from theme import get_current_theme_key, Theme
                     _key = get_current_theme_key()
                     forced = '#ffffff' if _key == Theme.DARK else '#000000'
                     success_label.setStyleSheet(f"color: {forced}; font-weight: 600; font-size: 14px;")
@@ -1086,7 +1467,6 @@ class LogDialog(QDialog):
                 error_label = QLabel(f"Error refreshing data: {str(e)}")
                 error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 try:
-                    from theme import get_current_theme_key, Theme
                     _key = get_current_theme_key()
                     forced = '#ffffff' if _key == Theme.DARK else '#000000'
                     error_label.setStyleSheet(f"color: {forced}; font-weight: 600; font-size: 14px;")
@@ -1099,16 +1479,11 @@ class LogDialog(QDialog):
         """Clear real-time logs safely"""
         try:
             self.log_manager.clear_realtime_logs()
+            self._pending_logs.clear()
             self.realtime_text.clear()
 
             # Add a confirmation message
-            try:
-                from theme import get_current_theme_key, Theme
-                _key = get_current_theme_key()
-                forced = '#ffffff' if _key == Theme.DARK else '#000000'
-            except Exception:
-                forced = '#000000'
-            confirmation_msg = f'<span style="color: {forced}; font-weight: 600;">[SYSTEM] Real-time logs have been cleared</span>'
+            confirmation_msg = f'<span style="color: {self._forced_color}; font-weight: 600;">[SYSTEM] Real-time logs have been cleared</span>'
             self.realtime_text.append(confirmation_msg)
         except Exception as e:
             print(f"Error clearing logs: {e}")
@@ -1130,24 +1505,36 @@ class LogDialog(QDialog):
             self._update_filter_text_color_by_theme()
         except Exception:
             pass
+        self.log_manager.set_listener_visible(True)
         super().showEvent(event)
 
+    def hideEvent(self, event):
+        """Stop receiving PROGRESS lines while the dialog is hidden."""
+        self.log_manager.set_listener_visible(False)
+        super().hideEvent(event)
+
     def _set_filter(self, status_key: str):
         self.current_filter = status_key
+        # Start the new view from its first page
+        self._history_rendered = 0
         self.load_history()
 
     def apply_theme_styles(self):
         """Re-apply theme-driven styles for dialog buttons at runtime."""
-        try:
-            from theme import button_style
-        except Exception:
+        if not THEME_AVAILABLE:
             return
+        # Coalesce the re-polish of all restyled widgets into one update
+        self.setUpdatesEnabled(False)
         try:
-            # Re-apply palette-driven dialog stylesheet first
+            # Re-apply palette-driven dialog stylesheet first; entry rules live on the history container
             try:
-                self.setStyleSheet(self._build_styles())
+                self.setStyleSheet(self._build_dialog_qss())
+                self.history_widget.setStyleSheet(self._build_entry_qss())
             except Exception:
                 pass
+            self._rebuild_log_template()
+            # History entries pick up the new theme on their next render
+            self._qss_cache = None
             if hasattr(self, 'clear_logs_btn') and self.clear_logs_btn:
                 self.clear_logs_btn.setStyleSheet(button_style('warn'))
             if hasattr(self, 'refresh_btn') and self.refresh_btn:
@@ -1166,11 +1553,12 @@ class LogDialog(QDialog):
                 pass
         except Exception:
             pass
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _apply_header_label_colors(self):
         """Force header label colors: white in Dark, black in Default/YouTube."""
         try:
-            from theme import get_palette, get_current_theme_key, Theme
             _p = get_palette()
             _key = get_current_theme_key()
             if _key == Theme.DARK:
@@ -1192,19 +1580,36 @@ class LogDialog(QDialog):
     def _update_filter_text_color_by_theme(self):
         """Toggle FilterButton text color according to theme (white in dark, black otherwise)."""
         try:
-            from theme import get_current_theme_key, Theme
             key = get_current_theme_key()
             is_dark = (key == Theme.DARK) or (getattr(key, 'name', str(key)) == 'DARK')
+            self._rebuild_log_template()
             for btn in (self.filter_all_btn, self.filter_success_btn, self.filter_failed_btn):
                 if isinstance(btn, FilterButton):
                     btn.set_dark_mode(is_dark)
         except Exception:
             pass
 
-    def _build_styles(self) -> str:
+    def _build_entry_qss(self) -> str:
+        """Build the history entry frame rules, applied to the history container only."""
+        try:
+            p = get_palette()
+            key = get_current_theme_key()
+        except Exception:
+            return self.history_widget.styleSheet()
+        text = '#ffffff' if key == Theme.DARK else p['text']
+        border = p['border']
+        primary = p['primary']
+        return f"""
+            QFrame[objectName="history_entry"] {{ background: {_rgba(text, 0.02)}; border: 1px solid {border}; border-radius: 12px; margin: 6px; padding: 0px; }}
+            QFrame[objectName="history_entry"]:hover {{ border: 1px solid {_rgba(primary, 0.35)}; background: {_rgba(primary, 0.06)}; }}
+            QFrame[objectName="history_entry_success"] {{ background: {_rgba('#22c55e', 0.10)}; border: 1px solid {_rgba('#22c55e', 0.35)}; }}
+            QFrame[objectName="history_entry_failed"] {{ background: {_rgba('#ef4444', 0.10)}; border: 1px solid {_rgba('#ef4444', 0.35)}; }}
+            QFrame[objectName="history_entry"], QFrame[objectName="history_entry_success"], QFrame[objectName="history_entry_failed"] {{ border-bottom: 2px solid {_rgba('#000000', 0.12)}; }}
+        """
+
+    def _build_dialog_qss(self) -> str:
         """Build palette-driven stylesheet for the log dialog (light/dark compatible)."""
         try:
-            from theme import get_palette, get_current_theme_key, Theme
             p = get_palette()
             key = get_current_theme_key()
         except Exception:
@@ -1236,25 +1641,55 @@ class LogDialog(QDialog):
             }}
             QLabel {{ color: {header_text}; font-weight: 500; font-size: 14px; }}
             QTabWidget {{ background: transparent; border: none; }}
-            QTabWidget::pane {{ background: {surface}; border: 1px solid {border}; border-radius: 12px; margin-top: 8px; }}
+            QTabWidget::pane {{ background: {surface}; border: 1px solid {border}; border-bottom: 2px solid {_rgba('#000000', 0.12)}; border-radius: 12px; margin-top: 8px; }}
             QTabBar {{ background: transparent; }}
             QTabBar::tab {{ background: {surface}; color: {header_text}; border: 1px solid {border}; padding: 12px 24px; margin-right: 4px; margin-top: 4px; border-radius: 10px; font-weight: 600; font-size: 14px; min-width: 120px; text-align: center; }}
             QTabBar::tab:hover {{ background: {_rgba(primary, 0.10)}; border: 1px solid {_rgba(primaryHover, 0.35)}; }}
             QTabBar::tab:selected {{ background: {_rgba(primary, 0.18)}; color: {header_text}; border: 1px solid {_rgba(primaryHover, 0.45)}; margin-top: 0px; }}
-            QTextEdit {{ background: {qte_bg}; color: {qte_text}; border: 1px solid {border}; border-radius: 10px; padding: 12px; font-family: 'Consolas', 'Monaco', 'Courier New', monospace; font-size: 12px; selection-background-color: {primaryHover}; }}
+            QTextEdit {{ background: {qte_bg}; color: {qte_text}; border: 1px solid {border}; border-bottom: 2px solid {_rgba('#000000', 0.08)}; border-radius: 10px; padding: 12px; font-family: 'Consolas', 'Monaco', 'Courier New', monospace; font-size: 12px; selection-background-color: {primaryHover}; }}
             QTextEdit:focus {{ border: 1px solid {primary}; }}
             QScrollArea {{ background: transparent; border: none; border-radius: 10px; }}
             QScrollArea QWidget {{ background: transparent; }}
-            QFrame[objectName="history_entry"] {{ background: {_rgba(text, 0.02)}; border: 1px solid {border}; border-radius: 12px; margin: 6px; padding: 0px; }}
-            QFrame[objectName="history_entry"]:hover {{ border: 1px solid {_rgba(primary, 0.35)}; background: {_rgba(primary, 0.06)}; }}
-            QFrame[objectName="history_entry_success"] {{ background: {_rgba('#22c55e', 0.10)}; border: 1px solid {_rgba('#22c55e', 0.35)}; }}
-            QFrame[objectName="history_entry_failed"] {{ background: {_rgba('#ef4444', 0.10)}; border: 1px solid {_rgba('#ef4444', 0.35)}; }}
         """
 
+def _normalize_history_entry(entry):
+    # Resolved once per entry so rendering only compares strings
+    entry['_resolution_norm'] = str(entry.get('resolution', '') or '').strip().lower()
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_pixmap(path: str, size: int):
+    """Rasterize an uncolored SVG icon once and share the pixmap between labels."""
+    return load_svg_icon(path, None, size).pixmap(size, size)
+
+@functools.lru_cache(maxsize=256)
+def _format_history_date(timestamp_str: str) -> str:
+    """Format a stored ISO or 'YYYY-MM-DD HH:MM:SS' timestamp for display."""
+    ts = timestamp_str
+    # Fast path: both stored formats start with 'YYYY-MM-DD?HH:MM:SS'; just slice
+    if (len(ts) >= 19 and ts[4] == '-' and ts[7] == '-' and ts[10] in 'T '
+            and ts[13] == ':' and ts[16] == ':' and ts[:4].isdigit()):
+        return f"{ts[:10]} {ts[11:19]}"
+    try:
+        if 'T' in ts:
+            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
+        else:
+            dt = datetime.strptime(ts, '%Y-%m-%d %H:%M:%S')
+        return f"{dt.strftime('%Y-%m-%d %H:%M:%S')}"
+    except (ValueError, TypeError):
+        return f"{ts}"
+
+def _set_qss(widget, qss: str):
+    # Skip the re-polish when a recycled widget already has this stylesheet
+    if widget.styleSheet() != qss:
+        widget.setStyleSheet(qss)
+
+@functools.lru_cache(maxsize=256)
 def _hex_to_rgb(h: str):
     h = h.lstrip('#')
     return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
 
+@functools.lru_cache(maxsize=256)
 def _rgba(h: str, a: float) -> str:
     r, g, b = _hex_to_rgb(h)
     a = 0 if a < 0 else 1 if a > 1 else a
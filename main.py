@@ -1,53 +1,356 @@
 import sys
 import os
+import re
+import time
 import platform
 import random
+import functools
+import importlib
+import importlib.util
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from PyQt6.QtGui import QColor
-from PyQt6.QtWidgets import QApplication, QHBoxLayout, QPushButton, QCheckBox, QMessageBox, QLabel, \
+from PyQt6.QtWidgets import QApplication, QHBoxLayout, QPushButton, QMessageBox, QLabel, \
     QGraphicsDropShadowEffect
-from PyQt6.QtCore import Qt, QTimer, QStandardPaths, QPropertyAnimation, QEasingCurve, QSize
-from ui import MainUI
+from PyQt6.QtCore import Qt, QTimer, QStandardPaths, QPropertyAnimation, QEasingCurve, QSize, QThread, \
+    pyqtSignal, QSignalBlocker
+from ui import MainUI, apply_shadow
 from settings import SettingsDialog, AppSettings, InformationDialog
 from process import DownloadThread
 from batchmode import BatchModeManager, BatchModeUI
 from autopaste import AutoPasteManager
 from log import LogManager, LogDialog
-from cookie_manager import show_cookie_detection_dialog, show_cookie_help_dialog, auto_detect_cookies, test_cookies
-from format_dialog import FormatChooserDialog
-
-# Auto-updater import
-try:
-    from autoupdate import show_updater_dialog, check_and_install_dependencies, UpdaterDialog
-    UPDATER_AVAILABLE = True
-except ImportError:
-    UPDATER_AVAILABLE = False
+
+# Auto-updater probe; the module itself is only imported on first use
+UPDATER_AVAILABLE = importlib.util.find_spec('autoupdate') is not None
+if not UPDATER_AVAILABLE:
     print("Auto-updater not available. Please ensure autoupdate.py is in the same directory.")
 
 
+_AUTOUPDATE_LOCK = threading.Lock()
+_AUTOUPDATE_MODULE = None
+
+
+def _autoupdate():
+    """Import autoupdate and install its dependencies once.
+    The first call may pip-install, so it is made from UpdateCheckWorker, never the GUI thread.
+    """
+    global UPDATER_AVAILABLE, _AUTOUPDATE_MODULE
+    with _AUTOUPDATE_LOCK:
+        if _AUTOUPDATE_MODULE is None:
+            if not UPDATER_AVAILABLE:
+                raise ImportError("Auto-updater not available")
+            try:
+                module = importlib.import_module('autoupdate')
+                # Check and install dependencies for the updater
+                module.check_and_install_dependencies()
+            except Exception:
+                # Same outcome as a missing module: the updater stays disabled
+                UPDATER_AVAILABLE = False
+                raise
+            _AUTOUPDATE_MODULE = module
+        return _AUTOUPDATE_MODULE
+
+
+def _autoupdate_loaded():
+    return _AUTOUPDATE_MODULE is not None
+
+
+_IS_WINDOWS = platform.system().lower() == "windows"
+_FFMPEG_PATH = Path("./bin") / ("ffmpeg.exe" if _IS_WINDOWS else "ffmpeg")
+# Heights offered by the format chooser, e.g. "2160p" or "240p"
+_RES_RE = re.compile(r"^\d+p$")
+
+# Static stylesheets, parsed by Qt only when a widget first gets them
+_UPDATE_BUTTON_QSS = """
+QPushButton {
+    background: transparent;
+    color: inherit;
+    border: none;
+    border-radius: 8px;
+    padding: 0px;
+}
+QPushButton:hover {
+    background: transparent;
+}
+QPushButton:disabled {
+    background: transparent;
+    color: inherit;
+}
+"""
+
+_LIMIT_REACHED_QSS = """
+QMessageBox {
+    background-color: #f8fafc;
+    color: #1e293b;
+}
+QMessageBox QLabel {
+    color: #1e293b;
+    font-size: 12px;
+    line-height: 1.4;
+}
+QPushButton {
+    background-color: #3b82f6;
+    color: #ffffff;
+    border: none;
+    border-radius: 6px;
+    padding: 8px 16px;
+    font-size: 12px;
+    font-weight: bold;
+    min-width: 80px;
+}
+QPushButton:hover {
+    background-color: #2563eb;
+}
+"""
+
+_LIMIT_WARNING_QSS = """
+QMessageBox {
+    background-color: #f8fafc;
+    color: #1e293b;
+}
+QMessageBox QLabel {
+    color: #1e293b;
+    font-size: 12px;
+    line-height: 1.4;
+}
+QPushButton {
+    background-color: #10b981;
+    color: #ffffff;
+    border: none;
+    border-radius: 6px;
+    padding: 8px 16px;
+    font-size: 12px;
+    font-weight: bold;
+    min-width: 80px;
+}
+QPushButton:hover {
+    background-color: #059669;
+}
+"""
+
+# The latest yt-dlp release is fetched from GitHub at most this often
+UPDATE_CHECK_TTL = 600  # seconds
+
+
+_VERSION_CACHE = OrderedDict()  # probe key -> version string
+_VERSION_CACHE_LOCK = threading.Lock()
+_VERSION_CACHE_SIZE = 8
+
+
+def _new_updater():
+    return _autoupdate().UpdaterThread(install_dir="./bin")
+
+
+def _cached_version(key, probe, cache_empty=True):
+    """Return the cached result for key, running probe() on a miss."""
+    with _VERSION_CACHE_LOCK:
+        if key in _VERSION_CACHE:
+            _VERSION_CACHE.move_to_end(key)
+            return _VERSION_CACHE[key]
+    value = probe()
+    if value or cache_empty:
+        with _VERSION_CACHE_LOCK:
+            _VERSION_CACHE[key] = value
+            while len(_VERSION_CACHE) > _VERSION_CACHE_SIZE:
+                _VERSION_CACHE.popitem(last=False)
+    return value
+
+
+def get_latest_ytdlp_version(updater):
+    """Latest yt-dlp release tag, cached for UPDATE_CHECK_TTL seconds."""
+    # Failed lookups are not cached so the next check retries
+    bucket = int(time.time() // UPDATE_CHECK_TTL)
+    return _cached_version(("latest", bucket), updater.get_latest_ytdlp_version, cache_empty=False)
+
+
+def get_current_version(program, updater):
+    """Installed version of yt-dlp/ffmpeg; re-probed when the ./bin binary changes, else every UPDATE_CHECK_TTL seconds."""
+    # A stat is far cheaper than spawning the binary with --version
+    try:
+        st = os.stat(Path("./bin") / (program + ".exe" if _IS_WINDOWS else program))
+        stat_key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        # Not under ./bin (system binary or not installed yet): expire like the latest-version lookup
+        stat_key = ("ttl", int(time.time() // UPDATE_CHECK_TTL))
+    return _cached_version(("current", program, stat_key), lambda: updater.get_current_version(program))
+
+
+def clear_update_cache():
+    """Forget cached version probes (e.g. after an install)."""
+    with _VERSION_CACHE_LOCK:
+        _VERSION_CACHE.clear()
+
+
+def _prepend_to_path(bin_path):
+    """Put bin_path first on PATH unless it is already one of its entries."""
+    parts = os.environ.get("PATH", "").split(os.pathsep)
+    if bin_path not in parts:
+        os.environ["PATH"] = os.pathsep.join([bin_path, *parts])
+
+
+def qdebounced(timeout_ms):
+    """Collapse a burst of calls into one call with the latest arguments, timeout_ms after the last one."""
+    def decorator(func):
+        timer = QTimer()
+        timer.setSingleShot(True)
+        timer.setInterval(timeout_ms)
+        pending = []
+
+        def fire():
+            args, kwargs = pending.pop()
+            func(*args, **kwargs)
+
+        def flush():
+            # Run a call still waiting in the debounce window right away
+            if timer.isActive():
+                timer.stop()
+                fire()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            pending[:] = [(args, kwargs)]
+            timer.start()
+
+        timer.timeout.connect(fire)
+        wrapper.flush = flush
+        return wrapper
+    return decorator
+
+
+class UpdateCheckWorker(QThread):
+    """Compare installed yt-dlp/FFmpeg versions with the latest ones off the GUI thread."""
+    result = pyqtSignal(bool, list)  # updates_needed, update_details
+    failed = pyqtSignal(str)
+    unavailable = pyqtSignal(str)  # the autoupdate module could not be loaded
+
+    def __init__(self, log_manager):
+        super().__init__()
+        self.log_manager = log_manager
+
+    def run(self):
+        # First use of the updater module happens here, off the GUI thread
+        try:
+            _autoupdate()
+        except Exception as e:
+            self.unavailable.emit(str(e))
+            return
+
+        # Debug lines are handed to the log manager in one batch at the end
+        local_logs = []
+        debug = self.log_manager.debug_enabled
+        try:
+            updates_needed = False
+            update_details = []
+
+            # Load the updater module and build one updater here, not once per pool job
+            updater = _new_updater()
+
+            # The GitHub request and the two binary probes are independent; run them side by side
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                current_ytdlp_job = pool.submit(get_current_version, "yt-dlp", updater)
+                latest_ytdlp_job = pool.submit(get_latest_ytdlp_version, updater)
+                current_ffmpeg_job = pool.submit(get_current_version, "ffmpeg", updater)
+
+            # Check yt-dlp with better error handling
+            try:
+                current_ytdlp = current_ytdlp_job.result()
+                latest_ytdlp = latest_ytdlp_job.result()
+
+                if debug:
+                    local_logs.append(("DEBUG", f"yt-dlp versions - Current: {current_ytdlp}, Latest: {latest_ytdlp}"))
+
+                if latest_ytdlp:
+                    if not current_ytdlp:
+                        updates_needed = True
+                        update_details.append("yt-dlp: Not installed")
+                    elif current_ytdlp != latest_ytdlp:
+                        # Only warn when the installed version is actually older
+                        try:
+                            # packaging is optional; imported here so the app starts without it
+                            from packaging.version import Version
+                            newer = Version(current_ytdlp) < Version(latest_ytdlp)
+                        except (ImportError, ValueError):
+                            # No packaging or unparseable versions (InvalidVersion): any difference counts
+                            newer = True
+                        if newer:
+                            updates_needed = True
+                            update_details.append(f"yt-dlp: {current_ytdlp} → {latest_ytdlp}")
+                elif debug:
+                    local_logs.append(("DEBUG", "Could not fetch latest yt-dlp version"))
+            except Exception as e:
+                if debug:
+                    local_logs.append(("DEBUG", f"yt-dlp version check failed: {str(e)}"))
+
+            # Check ffmpeg with better handling
+            try:
+                current_ffmpeg = current_ffmpeg_job.result()
+                if debug:
+                    local_logs.append(("DEBUG", f"FFmpeg version check - Current: {current_ffmpeg}"))
+
+                if not current_ffmpeg:
+                    # Only show warning if FFmpeg executable doesn't exist
+                    if not _FFMPEG_PATH.exists():
+                        updates_needed = True
+                        update_details.append("FFmpeg: Not installed")
+                    elif debug:
+                        local_logs.append(("DEBUG", "FFmpeg exists but version check failed"))
+                elif debug:
+                    local_logs.append(("DEBUG", f"FFmpeg found: {current_ffmpeg}"))
+            except Exception as e:
+                if debug:
+                    local_logs.append(("DEBUG", f"FFmpeg version check failed: {str(e)}"))
+
+            self.log_manager.log_many(local_logs)
+            self.result.emit(updates_needed, update_details)
+        except Exception as e:
+            self.log_manager.log_many(local_logs)
+            self.failed.emit(str(e))
+
+
 class EnhancedController:
     def __init__(self):
         self.ui = MainUI()
         self.settings = AppSettings()
 
+        # Status bar text is applied once per event-loop turn; bursts only paint the last message
+        self._pending_status = None
+        self._status_before_flush = None
+        self._status_flush_timer = QTimer(self.ui)
+        self._status_flush_timer.setSingleShot(True)
+        self._status_flush_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._status_flush_timer.timeout.connect(self._flush_status)
+
+        # Autopaste bursts in batch mode are queued together after a short quiet window
+        self._pending_urls = []
+        self._url_flush_timer = QTimer(self.ui)
+        self._url_flush_timer.setSingleShot(True)
+        self._url_flush_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._url_flush_timer.setInterval(50)
+        self._url_flush_timer.timeout.connect(self._flush_pending_urls)
+
         # Dialog state guards
         self._format_dialog_active = False
         self._deferred_playlist_info_prompt = None
         self._block_batch_after_cancel = False
         self._updates_ready = False
         self._can_open_updater_manually = False
+        self._update_check_in_progress = False
+        self._update_check_arms_button = True
+        self._update_worker = None
+        self._update_check_pending = None  # arm flag of a check requested while one was running
+        self._playlist_prompt = None
+        self._limit_reached_box = None
+        self._limit_warning_box = None
+        self._shutdown_menu = None
+        self._theme_cache = {}
 
         # Add bin directory to PATH for yt-dlp/FFmpeg
-        try:
-            bin_dir = Path("./bin")
-            bin_dir.mkdir(exist_ok=True)
-            bin_path = str(bin_dir.resolve())
-            if bin_path not in os.environ.get("PATH", ""):
-                os.environ["PATH"] = f"{bin_path}{os.pathsep}{os.environ.get('PATH', '')}"
-        except Exception:
-            # Keep running even if PATH update fails
-            pass
+        self._bin_path_ready = False
+        self._ensure_bin_on_path()
 
         # Set default download path
         self.set_default_download_path()
@@ -57,13 +360,8 @@ class EnhancedController:
             try:
                 self.ui.update_button.clicked.connect(self.on_update_button_clicked)
                 self.ui.update_button.setToolTip("Check for updates")
-                
-                # Pre-create updater dialog
-                try:
-                    self._updater_dialog = UpdaterDialog(self.ui, install_dir="./bin")
-                    self._updater_dialog.hide()
-                except Exception:
-                    self._updater_dialog = None
+                # Updater dialog is built on first use
+                self._updater_dialog = None
             except Exception:
                 pass
         else:
@@ -72,10 +370,10 @@ class EnhancedController:
         
         # Initialize logging
         self.log_manager = LogManager(max_realtime_logs=200, max_history_entries=30)
+        # Pre-bound for hot paths; DEBUG messages are only formatted when they will be kept
+        self._log = self.log_manager.log
+        self._log_debug = self.log_manager.debug_enabled
         self.log_dialog = LogDialog(self.log_manager, self.ui, on_retry=self._retry_from_history)
-        
-        # Check for updates on startup
-        self.check_and_show_update_warning()
 
         # Connect UI buttons
         self.ui.logs_button.clicked.connect(self.show_logs)
@@ -124,12 +422,40 @@ class EnhancedController:
         self.is_downloading = False
         self.total_file_size = 0
         self.downloaded_size = 0
-        self._dl_glow_effect = None
-        self._dl_glow_anim = None
+        self._init_download_button_glow()
+
+        # Optional UI pieces are fixed once the window is built; resolve them once for hot paths
+        self._has_batch_cb = hasattr(self, 'batch_checkbox')
+        self._has_link_input = hasattr(self.ui, 'link_input')
+        self._has_activity_state = hasattr(self.ui, 'set_activity_state')
+        self._download_button = getattr(self.ui, 'download_button', None)
+        self._format_chooser_cb = getattr(self.ui, 'choose_format_checkbox', None)
+        self._format_box = getattr(self.ui, 'format_box', None)
+        self._audio_format_box = getattr(self.ui, 'audio_format_box', None)
+        # Controls that batch mode locks to the batch settings
+        self._batch_locked_widgets = [
+            w for w in (self._format_chooser_cb, self._format_box, self._audio_format_box,
+                        self.ui.resolution_box, self.ui.subtitle_checkbox,
+                        self.ui.path_input, self.ui.browse_button)
+            if w is not None
+        ]
 
         # Initialize logging
         self.log_manager.log("INFO", "YouTube Downloader started")
 
+    def _set_status(self, text):
+        """Show text in the status bar on the next event-loop turn."""
+        if self._pending_status is None:
+            # Remember what is shown so a direct write by MainUI in the meantime is not overwritten
+            self._status_before_flush = self.ui.status_label.text()
+            self._status_flush_timer.start(0)
+        self._pending_status = text
+
+    def _flush_status(self):
+        text, self._pending_status = self._pending_status, None
+        if text is not None and self.ui.status_label.text() == self._status_before_flush:
+            self.ui.status_label.setText(text)
+
     def set_default_download_path(self):
         """Set default download path to user's Downloads folder."""
         try:
@@ -151,115 +477,117 @@ class EnhancedController:
         """Check for updates on startup."""
         if UPDATER_AVAILABLE:
             # Check for updates after a short delay (reduced from 2000ms to 500ms)
-            QTimer.singleShot(500, lambda: self.check_and_show_update_warning(arm_button=True))
+            QTimer.singleShot(500, Qt.TimerType.CoarseTimer, lambda: self.check_and_show_update_warning(arm_button=True))
+            # Refresh silently every hour so the button state stays current while the app is open
+            self._recheck_timer = QTimer(self.ui)
+            self._recheck_timer.setInterval(3600_000)
+            self._recheck_timer.timeout.connect(lambda: self.check_and_show_update_warning(arm_button=False))
+            self._recheck_timer.start()
 
     def check_and_show_update_warning(self, arm_button: bool = True):
-        """Check for available updates and update button display."""
+        """Check for available updates in the background and update button display."""
+        if not UPDATER_AVAILABLE:
+            return
+        if self._update_check_in_progress:
+            # Run it once the current check ends; an arming request wins over a passive one
+            self._update_check_pending = bool(self._update_check_pending) or arm_button
+            return
+        self._update_check_in_progress = True
+        self._update_check_arms_button = arm_button
         try:
-            if UPDATER_AVAILABLE:
-                # Show checking state
-                self.ui.set_update_button_state("checking")
+            # Show checking state
+            self.ui.set_update_button_state("checking")
+            try:
+                self._apply_update_button_style('checking')
+            except Exception:
+                pass
+
+            # Version probes hit the network and spawn processes; keep them off the GUI thread
+            worker = UpdateCheckWorker(self.log_manager)
+            worker.result.connect(self._on_update_check_done)
+            worker.failed.connect(self._on_update_check_failed)
+            worker.unavailable.connect(self._on_updater_unavailable)
+            # The worker is only released once its thread has really ended
+            worker.finished.connect(self._on_update_worker_finished)
+            self._update_worker = worker
+            worker.start()
+        except Exception as e:
+            self._update_worker = None
+            self._update_check_in_progress = False
+            self._on_update_check_failed(str(e))
+
+    def _on_update_worker_finished(self):
+        worker, self._update_worker = self._update_worker, None
+        if worker is not None:
+            worker.deleteLater()
+        self._update_check_in_progress = False
+        pending, self._update_check_pending = self._update_check_pending, None
+        if pending is not None:
+            self.check_and_show_update_warning(arm_button=pending)
+
+    def _on_update_check_done(self, updates_needed, update_details):
+        """Apply the result of a background update check to the update button."""
+        arm_button = self._update_check_arms_button
+        try:
+            # Update UI based on results
+            # Only arm the button for starting updates if explicitly requested
+            if arm_button:
+                self._updates_ready = bool(updates_needed)
+            if updates_needed:
+                self.ui.set_update_button_state("update_available")
                 try:
-                    self._apply_update_button_style('checking')
+                    self._apply_update_button_style('update_available')
                 except Exception:
                     pass
+                detail_msg = "; ".join(update_details)
+                self._log("INFO", f"Updates needed: {detail_msg}")
 
-                # Create updater instance
-                from autoupdate import UpdaterThread
-                updater = UpdaterThread(install_dir="./bin")
-
-                updates_needed = False
-                update_details = []
-
-                # Check yt-dlp with better error handling
-                try:
-                    current_ytdlp = updater.get_current_version("yt-dlp")
-                    latest_ytdlp = updater.get_latest_ytdlp_version()
-
-                    self.log_manager.log("DEBUG", f"yt-dlp versions - Current: {current_ytdlp}, Latest: {latest_ytdlp}")
-
-                    if latest_ytdlp:
-                        if not current_ytdlp:
-                            updates_needed = True
-                            update_details.append("yt-dlp: Not installed")
-                        elif current_ytdlp != latest_ytdlp:
-                            # Additional check: only show warning if versions are significantly different
-                            try:
-                                from packaging import version
-                                if version.parse(current_ytdlp) < version.parse(latest_ytdlp):
-                                    updates_needed = True
-                                    update_details.append(f"yt-dlp: {current_ytdlp} → {latest_ytdlp}")
-                            except:
-                                # Fallback to string comparison if version parsing fails
-                                if current_ytdlp != latest_ytdlp:
-                                    updates_needed = True
-                                    update_details.append(f"yt-dlp: {current_ytdlp} → {latest_ytdlp}")
-                    else:
-                        self.log_manager.log("DEBUG", "Could not fetch latest yt-dlp version")
-                except Exception as e:
-                    self.log_manager.log("DEBUG", f"yt-dlp version check failed: {str(e)}")
-
-                # Check ffmpeg with better handling
+                # Set tooltip with details
+                self.ui.update_button.setToolTip(
+                    f"Updates available:\n{chr(10).join(update_details)}\n\nClick to update")
+                # Allow opening updater on second click only if armed
+                if arm_button:
+                    self._can_open_updater_manually = True
+            else:
+                # Keep same visuals as Default/YouTube regardless of theme
+                self.ui.set_update_button_state("up_to_date")
                 try:
-                    current_ffmpeg = updater.get_current_version("ffmpeg")
-                    self.log_manager.log("DEBUG", f"FFmpeg version check - Current: {current_ffmpeg}")
-
-                    if not current_ffmpeg:
-                        # Only show warning if FFmpeg executable doesn't exist
-                        ffmpeg_path = Path("./bin") / (
-                            "ffmpeg.exe" if platform.system().lower() == "windows" else "ffmpeg")
-                        if not ffmpeg_path.exists():
-                            updates_needed = True
-                            update_details.append("FFmpeg: Not installed")
-                        else:
-                            self.log_manager.log("DEBUG", "FFmpeg exists but version check failed")
-                    else:
-                        self.log_manager.log("DEBUG", f"FFmpeg found: {current_ffmpeg}")
-                except Exception as e:
-                    self.log_manager.log("DEBUG", f"FFmpeg version check failed: {str(e)}")
-
-                # Update UI based on results
-                # Only arm the button for starting updates if explicitly requested
+                    self._apply_update_button_style('up_to_date')
+                except Exception:
+                    pass
+                if self._log_debug:
+                    self._log("DEBUG", "All components up to date")
+                # When not arming, keep first click as a check; otherwise allow opening
                 if arm_button:
-                    self._updates_ready = bool(updates_needed)
-                if updates_needed:
-                    self.ui.set_update_button_state("update_available")
-                    try:
-                        self._apply_update_button_style('update_available')
-                    except Exception:
-                        pass
-                    detail_msg = "; ".join(update_details)
-                    self.log_manager.log("INFO", f"Updates needed: {detail_msg}")
-
-                    # Set tooltip with details
-                    self.ui.update_button.setToolTip(
-                        f"Updates available:\n{chr(10).join(update_details)}\n\nClick to update")
-                    # Allow opening updater on second click only if armed
-                    if arm_button:
-                        self._can_open_updater_manually = True
+                    self._can_open_updater_manually = True
+                    self.ui.update_button.setToolTip("All components are up to date — click again to open updater")
                 else:
-                    # Keep same visuals as Default/YouTube regardless of theme
-                    self.ui.set_update_button_state("up_to_date")
-                    try:
-                        self._apply_update_button_style('up_to_date')
-                    except Exception:
-                        pass
-                    self.log_manager.log("DEBUG", "All components up to date")
-                    # When not arming, keep first click as a check; otherwise allow opening
-                    if arm_button:
-                        self._can_open_updater_manually = True
-                        self.ui.update_button.setToolTip("All components are up to date — click again to open updater")
-                    else:
-                        self._can_open_updater_manually = False
-                        self.ui.update_button.setToolTip("All components are up to date — click to recheck")
-
+                    self._can_open_updater_manually = False
+                    self.ui.update_button.setToolTip("All components are up to date — click to recheck")
         except Exception as e:
-            self.log_manager.log("DEBUG", f"Update check failed: {str(e)}")
-            # On error, show default state but require a check on next click
-            self.ui.set_update_button_state("default")
-            self._updates_ready = False
-            self._can_open_updater_manually = False
-            self.ui.update_button.setToolTip("Update check failed — click to recheck")
+            self._on_update_check_failed(str(e))
+
+    def _on_update_check_failed(self, error):
+        if self._log_debug:
+            self._log("DEBUG", f"Update check failed: {error}")
+        # On error, show default state but require a check on next click
+        self.ui.set_update_button_state("default")
+        self._updates_ready = False
+        self._can_open_updater_manually = False
+        self.ui.update_button.setToolTip("Update check failed — click to recheck")
+
+    def _on_updater_unavailable(self, error):
+        """The updater module failed to import or set up; disable updates as when it is missing."""
+        self._log("WARNING", f"Auto-updater failed to load: {error}")
+        self._updates_ready = False
+        self._can_open_updater_manually = False
+        self._update_check_pending = None
+        recheck = getattr(self, '_recheck_timer', None)
+        if recheck is not None:
+            recheck.stop()
+        self.ui.set_update_button_state("default")
+        self.ui.update_button.setEnabled(False)
+        self.ui.update_button.setToolTip("Auto-updater not available")
 
     def on_update_button_clicked(self):
         """Single-button two-step updater: first click checks, second click starts updater if available."""
@@ -287,29 +615,12 @@ class EnhancedController:
     def _init_shutdown_menu(self):
         try:
             from PyQt6.QtWidgets import QMenu
-            from theme import get_palette
-            p = get_palette()
             menu = QMenu(self.ui)
             act_restart = menu.addAction("Restart App")
             act_force_kill = menu.addAction("Force Kill")
             # Themed menu styling
-            menu.setStyleSheet(f"""
-                QMenu {{
-                    background: {p['surface']};
-                    color: {p['text']};
-                    border: 1px solid {p['border']};
-                    padding: 6px;
-                    border-radius: 8px;
-                }}
-                QMenu::item {{
-                    padding: 6px 12px;
-                    border-radius: 6px;
-                    color: {p['text']};
-                }}
-                QMenu::item:selected {{
-                    background: rgba(67, 241, 250, 0.15);
-                }}
-            """)
+            menu.setStyleSheet(self._get_qss('menu'))
+            self._shutdown_menu = menu
             def _on_click():
                 pos = self.ui.shutdown_button.mapToGlobal(self.ui.shutdown_button.rect().bottomRight())
                 menu.exec(pos)
@@ -332,6 +643,56 @@ class EnhancedController:
         except Exception:
             pass
 
+    def _get_qss(self, kind):
+        """Themed stylesheet for controller-owned popups, built once per theme."""
+        qss = self._theme_cache.get(kind)
+        if qss is None:
+            from theme import get_palette
+            p = get_palette()
+            if kind == 'menu':
+                qss = f"""
+                    QMenu {{
+                        background: {p['surface']};
+                        color: {p['text']};
+                        border: 1px solid {p['border']};
+                        padding: 6px;
+                        border-radius: 8px;
+                    }}
+                    QMenu::item {{
+                        padding: 6px 12px;
+                        border-radius: 6px;
+                        color: {p['text']};
+                    }}
+                    QMenu::item:selected {{
+                        background: rgba(67, 241, 250, 0.15);
+                    }}
+                """
+            else:
+                qss = f"""
+                    QMessageBox {{
+                        background-color: {p['surface']};
+                        color: {p['text']};
+                    }}
+                    QMessageBox QLabel {{
+                        color: {p['text']};
+                        font-size: 12px;
+                        line-height: 1.4;
+                    }}
+                """
+            self._theme_cache[kind] = qss
+        return qss
+
+    def _apply_popup_theme(self):
+        """Drop cached popup stylesheets and restyle the popups that already exist."""
+        self._theme_cache.clear()
+        if self._shutdown_menu is not None:
+            try:
+                self._shutdown_menu.setStyleSheet(self._get_qss('menu'))
+            except Exception:
+                pass
+        if self._playlist_prompt is not None:
+            self._style_playlist_prompt(*self._playlist_prompt)
+
     def _retry_from_history(self, entry):
         try:
             url = entry.get('url')
@@ -344,7 +705,7 @@ class EnhancedController:
                 self.ui.link_input.setText(url)
                 # If batch entry, ensure batch mode and queue it
                 if is_batch:
-                    if hasattr(self, 'batch_checkbox') and not self.batch_checkbox.isChecked():
+                    if self._has_batch_cb and not self.batch_checkbox.isChecked():
                         self.batch_checkbox.setChecked(True)
                     queue_limit = self.settings.get_max_concurrent_downloads()
                     # Add to batch queue and start batch processing
@@ -362,20 +723,22 @@ class EnhancedController:
             # Settings were saved, refresh cookie status and other UI elements
             self.log_manager.log("INFO", "Settings updated")
             
-            # Sync main window resolution dropdown with settings
-            default_res = self.settings.get_default_resolution()
-            if hasattr(self.ui, 'resolution_box'):
+            # Sync main window controls with settings without firing their change handlers;
+            # batch settings are updated once below
+            with QSignalBlocker(self.ui.resolution_box), QSignalBlocker(self.ui.subtitle_checkbox), \
+                    QSignalBlocker(self.ui.path_input):
+                # Sync main window resolution dropdown with settings
+                default_res = self.settings.get_default_resolution()
                 self.ui.resolution_box.setCurrentText(default_res)
-            
-            # Sync main window subtitle checkbox with settings
-            auto_subs = self.settings.get_auto_download_subs()
-            if hasattr(self.ui, 'subtitle_checkbox'):
+
+                # Sync main window subtitle checkbox with settings
+                auto_subs = self.settings.get_auto_download_subs()
                 self.ui.subtitle_checkbox.setChecked(auto_subs)
-            
-            # Sync main window download path with settings
-            default_path = self.settings.get_default_download_path()
-            if hasattr(self.ui, 'path_input') and default_path:
-                self.ui.path_input.setText(default_path)
+
+                # Sync main window download path with settings
+                default_path = self.settings.get_default_download_path()
+                if default_path:
+                    self.ui.path_input.setText(default_path)
             
             # Update batch mode settings if active
             if self.batch_manager.is_batch_mode:
@@ -385,6 +748,7 @@ class EnhancedController:
             # Refresh cookie status after settings change
             self.refresh_cookie_status()
             # Re-apply themed styles on main UI and log dialog
+            self._apply_popup_theme()
             try:
                 if hasattr(self.ui, 'apply_theme_styles'):
                     self.ui.apply_theme_styles()
@@ -400,18 +764,12 @@ class EnhancedController:
     def on_playlist_detected(self, playlist_info):
         """Handle playlist detection and optionally prompt about limits"""
         # If batch checkbox is not enabled anymore, ignore late signals
-        try:
-            if hasattr(self, 'batch_checkbox') and not self.batch_checkbox.isChecked():
-                return
-        except Exception:
-            pass
+        if self._has_batch_cb and not self.batch_checkbox.isChecked():
+            return
         # Defer prompt if a format chooser is currently open
-        try:
-            if getattr(self, '_format_dialog_active', False):
-                self._deferred_playlist_info_prompt = playlist_info
-                return
-        except Exception:
-            pass
+        if self._format_dialog_active:
+            self._deferred_playlist_info_prompt = playlist_info
+            return
         try:
             title = playlist_info.get('title', 'Playlist')
             count = int(playlist_info.get('video_count', 0))
@@ -421,19 +779,13 @@ class EnhancedController:
             is_mix = False
         # Update status
         base_msg = f"Playlist detected: '{title}' ({count} videos)"
-        try:
-            if not self.is_downloading:
-                self.ui.status_label.setText(base_msg + " — Press Download to start")
-            else:
-                self.ui.status_label.setText(base_msg)
-        except Exception:
-            self.ui.status_label.setText(base_msg)
+        if not self.is_downloading:
+            self._set_status(base_msg + " — Press Download to start")
+        else:
+            self._set_status(base_msg)
         # Ensure batch mode is visually and functionally enabled
-        try:
-            if hasattr(self, 'batch_checkbox') and not self.batch_checkbox.isChecked():
-                self.batch_checkbox.setChecked(True)
-        except Exception:
-            pass
+        if self._has_batch_cb and not self.batch_checkbox.isChecked():
+            self.batch_checkbox.setChecked(True)
         # If a limit is set and exceeded, prompt the user
         try:
             limit = self.settings.get_max_concurrent_downloads()
@@ -452,54 +804,21 @@ class EnhancedController:
             elif not isinstance(count, int) or count <= 0:
                 should_prompt = True
         if should_prompt:
-            from PyQt6.QtWidgets import QMessageBox
-            msg = QMessageBox(self.ui)
-            msg.setIcon(QMessageBox.Icon.Warning)
-            msg.setWindowTitle("Batch Limit Exceeded")
+            msg, trim_btn, settings_btn, cancel_btn = self._get_playlist_prompt()
             msg.setText(
                 f"This playlist has {count} videos, but your batch limit is {limit}.\n\n"
                 f"Choose an option:\n"
                 f"• Trim queue to first {limit} videos\n"
                 f"• Open Settings to adjust the limit"
             )
-            trim_btn = msg.addButton(f"Trim to {limit}", QMessageBox.ButtonRole.AcceptRole)
-            settings_btn = msg.addButton("Open Settings", QMessageBox.ButtonRole.ActionRole)
-            cancel_btn = msg.addButton("Cancel", QMessageBox.ButtonRole.RejectRole)
-            # Theme-aware styling for dialog and buttons
-            try:
-                from theme import get_palette, button_style
-                _p = get_palette()
-                msg.setStyleSheet(f"""
-                    QMessageBox {{
-                        background-color: {_p['surface']};
-                        color: {_p['text']};
-                    }}
-                    QMessageBox QLabel {{
-                        color: {_p['text']};
-                        font-size: 12px;
-                        line-height: 1.4;
-                    }}
-                """)
-                # Style buttons by role for visibility
-                trim_btn.setStyleSheet(button_style('primary', radius=6, padding='8px 16px'))
-                settings_btn.setStyleSheet(button_style('info', radius=6, padding='8px 16px'))
-                cancel_btn.setStyleSheet(button_style('danger', radius=6, padding='8px 16px'))
-                trim_btn.setMinimumWidth(100)
-                settings_btn.setMinimumWidth(120)
-                cancel_btn.setMinimumWidth(90)
-            except Exception:
-                # Fallback light style
-                msg.setStyleSheet("""
-                    QMessageBox { background-color: #f8fafc; color: #1e293b; }
-                    QMessageBox QLabel { color: #1e293b; font-size: 12px; }
-                """)
+            trim_btn.setText(f"Trim to {limit}")
             msg.exec()
             clicked = msg.clickedButton()
             if clicked == trim_btn:
                 try:
                     # Persist and enforce the cap for this playlist and queue
                     self.batch_manager.enforce_playlist_limit(limit)
-                    self.ui.status_label.setText(f"Trimmed queue to {limit} items for '{title}' — Press Download to start")
+                    self._set_status(f"Trimmed queue to {limit} items for '{title}' — Press Download to start")
                 except Exception:
                     pass
             elif clicked == settings_btn:
@@ -513,13 +832,13 @@ class EnhancedController:
                     self.batch_manager.clear_batch_queue()
                     self.batch_manager.current_playlist_info = None
                     self.batch_manager.playlist_current_index = 0
-                    if hasattr(self, 'batch_checkbox') and self.batch_checkbox.isChecked():
+                    if self._has_batch_cb and self.batch_checkbox.isChecked():
                         self.batch_checkbox.setChecked(False)
-                    self.ui.status_label.setText("Playlist processing cancelled")
+                    self._set_status("Playlist processing cancelled")
                     self._block_batch_after_cancel = True
                     # Clear link box and reset video details immediately
                     try:
-                        if hasattr(self.ui, 'link_input'):
+                        if self._has_link_input:
                             self.ui.link_input.clear()
                     except Exception:
                         pass
@@ -532,89 +851,75 @@ class EnhancedController:
                 return
         # Clear the input to avoid re-adding the playlist URL later
         try:
-            if hasattr(self.ui, 'link_input'):
+            if self._has_link_input:
                 self.ui.link_input.clear()
         except Exception:
             pass
 
+    def _get_playlist_prompt(self):
+        """Build the batch-limit message box once; later prompts only change its text."""
+        if self._playlist_prompt is not None:
+            return self._playlist_prompt
+        msg = QMessageBox(self.ui)
+        msg.setIcon(QMessageBox.Icon.Warning)
+        msg.setWindowTitle("Batch Limit Exceeded")
+        trim_btn = msg.addButton("Trim", QMessageBox.ButtonRole.AcceptRole)
+        settings_btn = msg.addButton("Open Settings", QMessageBox.ButtonRole.ActionRole)
+        cancel_btn = msg.addButton("Cancel", QMessageBox.ButtonRole.RejectRole)
+        self._style_playlist_prompt(msg, trim_btn, settings_btn, cancel_btn)
+        self._playlist_prompt = (msg, trim_btn, settings_btn, cancel_btn)
+        return self._playlist_prompt
+
+    def _style_playlist_prompt(self, msg, trim_btn, settings_btn, cancel_btn):
+        # Theme-aware styling for dialog and buttons
+        try:
+            from theme import button_style
+            msg.setStyleSheet(self._get_qss('msgbox'))
+            # Style buttons by role for visibility
+            trim_btn.setStyleSheet(button_style('primary', radius=6, padding='8px 16px'))
+            settings_btn.setStyleSheet(button_style('info', radius=6, padding='8px 16px'))
+            cancel_btn.setStyleSheet(button_style('danger', radius=6, padding='8px 16px'))
+            trim_btn.setMinimumWidth(100)
+            settings_btn.setMinimumWidth(120)
+            cancel_btn.setMinimumWidth(90)
+        except Exception:
+            # Fallback light style
+            msg.setStyleSheet("""
+                QMessageBox { background-color: #f8fafc; color: #1e293b; }
+                QMessageBox QLabel { color: #1e293b; font-size: 12px; }
+            """)
+
     def on_playlist_loading(self, message):
         """Handle playlist loading status"""
         # If the user cancelled a playlist flow, ignore late updates from extractor
-        try:
-            if getattr(self, '_block_batch_after_cancel', False):
-                try:
-                    self.batch_manager.clear_batch_queue()
-                except Exception:
-                    pass
-                return
-        except Exception:
-            pass
+        if self._block_batch_after_cancel:
+            try:
+                self.batch_manager.clear_batch_queue()
+            except Exception:
+                pass
+            return
         # If batch checkbox is off, ignore late loading updates
-        try:
-            if hasattr(self, 'batch_checkbox') and not self.batch_checkbox.isChecked():
-                return
-        except Exception:
-            pass
-        # Include an action hint when ready
+        if self._has_batch_cb and not self.batch_checkbox.isChecked():
+            return
         try:
             status = self.batch_manager.get_batch_status()
-            if status.get('is_active') and status.get('queue_size', 0) > 0 and not self.is_downloading:
-                self.ui.status_label.setText(f"{message} — Press Download to start")
-            else:
-                self.ui.status_label.setText(f"{message}")
         except Exception:
-            self.ui.status_label.setText(f"{message}")
-        self.log_manager.log("INFO", f"Playlist loading: {message}")
+            status = {}
+        # Include an action hint when ready
+        ready = status.get('is_active') and status.get('queue_size', 0) > 0 and not self.is_downloading
+        if ready:
+            self._set_status(f"{message} — Press Download to start")
+        else:
+            self._set_status(f"{message}")
+        self._log("INFO", f"Playlist loading: {message}")
         # If playlist is ready and not currently downloading, highlight Download button
-        try:
-            status = self.batch_manager.get_batch_status()
-            if status.get('is_active') and status.get('queue_size', 0) > 0 and not self.is_downloading:
-                self._start_download_button_glow()
-        except Exception:
-            pass
+        if ready:
+            self._start_download_button_glow()
 
     def setup_enhanced_ui(self):
         """Add batch mode and autopaste controls to the existing UI"""
-        # Find the subtitle layout to add batch mode and autopaste checkboxes
-        subtitle_layout = None
-        buttons_layout = None
-
-        for i in range(self.ui.layout().count()):
-            item = self.ui.layout().itemAt(i)
-
-            if hasattr(item, 'widget') and item.widget():
-                widget = item.widget()
-                # Look for the splitter
-                if hasattr(widget, 'widget') and widget.widget(0):
-                    top_frame = widget.widget(0)
-                    if hasattr(top_frame, 'layout'):
-                        top_layout = top_frame.layout()
-
-                        # Find subtitle layout and buttons layout
-                        for j in range(top_layout.count()):
-                            layout_item = top_layout.itemAt(j)
-                            if hasattr(layout_item, 'layout') and layout_item.layout():
-                                layout = layout_item.layout()
-
-                                # Check for subtitle checkbox in this layout
-                                for k in range(layout.count()):
-                                    widget_item = layout.itemAt(k)
-                                    if hasattr(widget_item, 'widget') and isinstance(widget_item.widget(), QCheckBox):
-                                        if "English Subtitles" in widget_item.widget().text():
-                                            subtitle_layout = layout
-                                            break
-
-                                # Check for download button in this layout
-                                for k in range(layout.count()):
-                                    widget_item = layout.itemAt(k)
-                                    if hasattr(widget_item, 'widget') and isinstance(widget_item.widget(), QPushButton):
-                                        if widget_item.widget().text() == "Download":
-                                            buttons_layout = layout
-                                            break
-
-                                if subtitle_layout and buttons_layout:
-                                    break
-                        break
+        # MainUI keeps a handle on the Download/Cancel row
+        buttons_layout = getattr(self.ui, 'buttons_layout', None)
 
         # Connect to existing checkboxes in the UI
         if hasattr(self.ui, 'batch_checkbox'):
@@ -625,11 +930,15 @@ class EnhancedController:
             self.autopaste_checkbox = self.ui.autopaste_checkbox
             self.autopaste_checkbox.stateChanged.connect(self.toggle_autopaste)
 
+        # Typing or scrolling through values emits in bursts; only the last value matters
+        self.on_resolution_changed = qdebounced(200)(self.on_resolution_changed)
+        self.on_subtitle_changed = qdebounced(200)(self.on_subtitle_changed)
+        self.on_download_path_changed = qdebounced(200)(self.on_download_path_changed)
+
         # Connect resolution box changes to update batch mode settings
         if hasattr(self.ui, 'resolution_box'):
+            # currentTextChanged also covers picks from the dropdown
             self.ui.resolution_box.currentTextChanged.connect(self.on_resolution_changed)
-            # Also connect to the activated signal for when user selects from dropdown
-            self.ui.resolution_box.activated.connect(self.on_resolution_activated)
             
         # Connect subtitle checkbox changes to update batch mode settings
         if hasattr(self.ui, 'subtitle_checkbox'):
@@ -648,30 +957,35 @@ class EnhancedController:
             self.clear_queue_button.setFixedWidth(160)  # Wider to prevent text clipping with padding
             self.clear_queue_button.clicked.connect(self.clear_batch_queue)
 
-            # Apply the same shadow effect as download and cancel buttons
-            clear_queue_shadow = QGraphicsDropShadowEffect()
-            clear_queue_shadow.setBlurRadius(15)
-            clear_queue_shadow.setXOffset(0)
-            clear_queue_shadow.setYOffset(3)
-            clear_queue_shadow.setColor(QColor(245, 158, 11, 80))  # Amber color for queue button
-            self.clear_queue_button.setGraphicsEffect(clear_queue_shadow)
+            # Apply the same shadow effect as download and cancel buttons (amber for the queue button)
+            apply_shadow(self.clear_queue_button, QColor(245, 158, 11, 80))
 
             self.clear_queue_button.hide()  # Initially hidden - only show when batch mode is enabled
 
-            # Find the position of the cancel button and insert clear queue button before it
-            cancel_button_index = -1
-            for i in range(buttons_layout.count()):
-                item = buttons_layout.itemAt(i)
-                if hasattr(item, 'widget') and isinstance(item.widget(), QPushButton):
-                    if item.widget().text() == "Cancel":
-                        cancel_button_index = i
-                        break
-
+            # Insert clear queue button before the cancel button
+            cancel_button_index = buttons_layout.indexOf(self.ui.cancel_button)
             if cancel_button_index != -1:
                 buttons_layout.insertWidget(cancel_button_index, self.clear_queue_button)
 
+    def _ensure_bin_on_path(self):
+        """Create ./bin and put it on PATH; only the first successful call does any work."""
+        if self._bin_path_ready:
+            return
+        try:
+            bin_dir = Path("./bin")
+            bin_dir.mkdir(exist_ok=True)
+            _prepend_to_path(os.fspath(bin_dir.resolve()))
+            self._bin_path_ready = True
+        except Exception:
+            # Keep running even if PATH update fails; the next call retries
+            pass
+
     def manual_updater(self):
         """Manually launch the updater"""
+        if UPDATER_AVAILABLE and not _autoupdate_loaded():
+            # Loading may pip-install; let the background check do it first
+            self.check_and_show_update_warning()
+            return
         if UPDATER_AVAILABLE:
             try:
                 # Remove the problematic line that calls non-existent method
@@ -684,20 +998,15 @@ class EnhancedController:
                 except Exception:
                     pass
 
-                # Ensure bin directory exists
-                bin_dir = Path("./bin")
-                bin_dir.mkdir(exist_ok=True)
-
-                # Add bin directory to PATH
-                bin_path = str(bin_dir.absolute())
-                if bin_path not in os.environ.get("PATH", ""):
-                    os.environ["PATH"] = f"{bin_path}{os.pathsep}{os.environ.get('PATH', '')}"
+                # Ensure bin directory exists and is on PATH
+                self._ensure_bin_on_path()
 
-                result = show_updater_dialog(parent=self.ui, install_dir="./bin")
+                result = _autoupdate().show_updater_dialog(parent=self.ui, install_dir="./bin")
+                clear_update_cache()
                 if result:
                     self.log_manager.log("SUCCESS", "Manual update completed successfully")
                     # Check status again after successful update (reduced from 1000ms to 200ms)
-                    QTimer.singleShot(200, self.check_and_show_update_warning)
+                    QTimer.singleShot(200, Qt.TimerType.CoarseTimer, self.check_and_show_update_warning)
                 else:
                     self.log_manager.log("INFO", "Manual update cancelled")
                     # Check again for updates after cancellation
@@ -714,25 +1023,13 @@ class EnhancedController:
         """Force update button styling to be fully transparent (no background) across themes."""
         if not hasattr(self.ui, 'update_button') or not self.ui.update_button:
             return
-        # Transparent, icon-only button; no background in any state
-        qss = """
-        QPushButton {
-            background: transparent;
-            color: inherit;
-            border: none;
-            border-radius: 8px;
-            padding: 0px;
-        }
-        QPushButton:hover {
-            background: transparent;
-        }
-        QPushButton:disabled {
-            background: transparent;
-            color: inherit;
-        }
-        """
+        # Transparent, icon-only button; no background in any state.
+        # Re-setting an identical sheet still re-polishes the widget, so skip it
+        button = self.ui.update_button
         try:
-            self.ui.update_button.setStyleSheet(qss)
+            # Compared by value: theme changes restyle this button behind our back
+            if button.styleSheet() != _UPDATE_BUTTON_QSS:
+                button.setStyleSheet(_UPDATE_BUTTON_QSS)
         except Exception:
             pass
 
@@ -744,33 +1041,20 @@ class EnhancedController:
             download_subs = self.ui.subtitle_checkbox.isChecked()
             download_path = self.ui.path_input.text().strip()
 
-            # Disable any format selection controls in batch mode
-            try:
-                if hasattr(self.ui, 'choose_format_checkbox'):
-                    self.ui.choose_format_checkbox.setChecked(False)
-                    self.ui.choose_format_checkbox.setEnabled(False)
-                if hasattr(self.ui, 'format_box'):
-                    self.ui.format_box.setEnabled(False)
-                if hasattr(self.ui, 'audio_format_box'):
-                    self.ui.audio_format_box.setEnabled(False)
-            except Exception:
-                pass
+            # Format chooser is not used in batch mode
+            if self._format_chooser_cb is not None:
+                self._format_chooser_cb.setChecked(False)
 
             # Enable batch mode (no format chooser in batch)
             container_override = None
             audio_override = None
             self.batch_manager.enable_batch_mode(resolution, download_subs, download_path, container_override, audio_override)
             self.clear_queue_button.show()
-            
-            # Log the batch mode settings for debugging
+
             self.log_manager.log("INFO", f"Batch mode enabled with settings: resolution='{resolution}', subs={download_subs}, path='{download_path}'")
 
-            # Disable resolution and subtitle controls (use batch settings)
-            self.ui.resolution_box.setEnabled(False)
-            self.ui.subtitle_checkbox.setEnabled(False)
-            self.ui.path_input.setEnabled(False)
-            self.ui.browse_button.setEnabled(False)
-            self.log_manager.log("INFO", f"Batch mode enabled - Resolution: {resolution}, Subtitles: {download_subs}")
+            # Disable format, resolution and subtitle controls (use batch settings)
+            self._set_batch_locked_enabled(False)
 
             # If a playlist prompt was deferred while the dialog was open, show it now
             try:
@@ -784,21 +1068,8 @@ class EnhancedController:
         else:  # Unchecked
             self.batch_manager.disable_batch_mode()
             self.clear_queue_button.hide()
-            # Re-enable controls
-            self.ui.resolution_box.setEnabled(True)
-            self.ui.subtitle_checkbox.setEnabled(True)
-            self.ui.path_input.setEnabled(True)
-            self.ui.browse_button.setEnabled(True)
-            # Re-enable format selection controls for single downloads
-            try:
-                if hasattr(self.ui, 'choose_format_checkbox'):
-                    self.ui.choose_format_checkbox.setEnabled(True)
-                if hasattr(self.ui, 'format_box'):
-                    self.ui.format_box.setEnabled(True)
-                if hasattr(self.ui, 'audio_format_box'):
-                    self.ui.audio_format_box.setEnabled(True)
-            except Exception:
-                pass
+            # Re-enable controls for single downloads
+            self._set_batch_locked_enabled(True)
 
             # Stop readiness glow when batch mode is disabled
             try:
@@ -813,6 +1084,15 @@ class EnhancedController:
                 pass
             self.log_manager.log("INFO", "Batch mode disabled")
 
+    def _set_batch_locked_enabled(self, enabled):
+        # Toggle all locked controls with painting suspended so the window repaints once
+        self.ui.setUpdatesEnabled(False)
+        try:
+            for w in self._batch_locked_widgets:
+                w.setEnabled(enabled)
+        finally:
+            self.ui.setUpdatesEnabled(True)
+
     def toggle_autopaste(self, state):
         """Toggle autopaste on/off"""
         if state == 2:  # Checked
@@ -836,18 +1116,10 @@ class EnhancedController:
             status = self.batch_manager.get_batch_status()
             queue_limit = self.settings.get_max_concurrent_downloads()
             if status['queue_size'] > 0:
-                self.ui.status_label.setText(f"Resolution updated to {new_resolution} - Queue: {status['queue_size']}/{queue_limit} items")
+                self._set_status(f"Resolution updated to {new_resolution} - Queue: {status['queue_size']}/{queue_limit} items")
         else:
             self.log_manager.log("DEBUG", f"Resolution changed but batch mode not active")
 
-    def on_resolution_activated(self, index):
-        """Handle resolution selection from dropdown"""
-        new_resolution = self.ui.resolution_box.currentText()
-        self.log_manager.log("DEBUG", f"Resolution activated: '{new_resolution}' at index {index}")
-        
-        # Call the same handler as text change
-        self.on_resolution_changed(new_resolution)
-
     def on_subtitle_changed(self, state):
         """Handle subtitle checkbox changes and update batch mode settings if needed"""
         if self.batch_manager.is_batch_mode:
@@ -859,7 +1131,7 @@ class EnhancedController:
             status = self.batch_manager.get_batch_status()
             queue_limit = self.settings.get_max_concurrent_downloads()
             if status['queue_size'] > 0:
-                self.ui.status_label.setText(f"Subtitle preference updated - Queue: {status['queue_size']}/{queue_limit} items")
+                self._set_status(f"Subtitle preference updated - Queue: {status['queue_size']}/{queue_limit} items")
 
     def clear_batch_queue(self):
         """Clear the batch queue and show notification"""
@@ -884,29 +1156,28 @@ class EnhancedController:
             
             if 'playlist' in status:
                 playlist_title = status['playlist']['title']
-                self.ui.status_label.setText(f"Batch mode: {playlist_title} - Queue: {status['queue_size']}/{queue_limit} items")
+                self._set_status(f"Batch mode: {playlist_title} - Queue: {status['queue_size']}/{queue_limit} items")
             else:
-                self.ui.status_label.setText(f"Batch mode enabled - Queue: {status['queue_size']}/{queue_limit} items")
+                self._set_status(f"Batch mode enabled - Queue: {status['queue_size']}/{queue_limit} items")
         else:
             # Ensure we show non-batch ready state
             try:
                 self.reset_ui()
             except Exception:
-                self.ui.status_label.setText("Batch mode disabled")
+                self._set_status("Batch mode disabled")
 
     def on_batch_progress_updated(self, current, total):
         """Handle batch progress updates"""
-        self.ui.status_label.setText(f"Batch: Processing {current}/{total}")
+        self._set_status(f"Batch: Processing {current}/{total}")
         self.log_manager.log("PROGRESS", f"Batch progress: {current}/{total}")
 
     def on_queue_limit_reached(self, queue_size):
         """Handle queue limit reached with concise alert"""
         limit = self.settings.get_max_concurrent_downloads()
         
-        # Create concise message box
-        msg_box = QMessageBox()
-        msg_box.setIcon(QMessageBox.Icon.Warning)
-        msg_box.setWindowTitle("Queue Limit Reached")
+        # Concise message box, built once and reused
+        msg_box = self._queue_limit_box(
+            '_limit_reached_box', QMessageBox.Icon.Warning, "Queue Limit Reached", _LIMIT_REACHED_QSS)
         
         # Create short, informative message
         message = f"""<b>Queue Limit Reached!</b>
@@ -921,47 +1192,19 @@ You have reached the maximum number of items ({limit}) allowed in your batch que
 <b>Current: {queue_size}/{limit} items</b>"""
         
         msg_box.setText(message)
-        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-        
-        # Add custom styling
-        msg_box.setStyleSheet("""
-            QMessageBox {
-                background-color: #f8fafc;
-                color: #1e293b;
-            }
-            QMessageBox QLabel {
-                color: #1e293b;
-                font-size: 12px;
-                line-height: 1.4;
-            }
-            QPushButton {
-                background-color: #3b82f6;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 12px;
-                font-weight: bold;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #2563eb;
-            }
-        """)
         
         # Show the message box
         msg_box.exec()
         
         # Update status with specific information
-        self.ui.status_label.setText(f"Queue limit reached ({queue_size}/{limit}) - Check alert for options")
+        self._set_status(f"Queue limit reached ({queue_size}/{limit}) - Check alert for options")
         self.log_manager.log("WARNING", f"Queue limit reached ({queue_size}/{limit}). User notified with options.")
 
     def on_queue_limit_warning(self, queue_size, limit):
         """Handle queue limit warning with concise information"""
-        # Create concise warning message box
-        msg_box = QMessageBox()
-        msg_box.setIcon(QMessageBox.Icon.Information)
-        msg_box.setWindowTitle("Queue Limit Warning")
+        # Concise warning message box, built once and reused
+        msg_box = self._queue_limit_box(
+            '_limit_warning_box', QMessageBox.Icon.Information, "Queue Limit Warning", _LIMIT_WARNING_QSS)
         
         # Calculate remaining slots
         remaining = limit - queue_size
@@ -976,41 +1219,27 @@ You're getting close to your batch queue limit.
 <b>Tip:</b> You can increase the limit in Settings → Download Behavior if needed."""
         
         msg_box.setText(message)
-        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-        
-        # Add custom styling
-        msg_box.setStyleSheet("""
-            QMessageBox {
-                background-color: #f8fafc;
-                color: #1e293b;
-            }
-            QMessageBox QLabel {
-                color: #1e293b;
-                font-size: 12px;
-                line-height: 1.4;
-            }
-            QPushButton {
-                background-color: #10b981;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 12px;
-                font-weight: bold;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #059669;
-            }
-        """)
         
         # Show the message box
         msg_box.exec()
         
         # Update status with specific information
-        self.ui.status_label.setText(f"Queue limit approaching: {queue_size}/{limit} items ({remaining} slots remaining)")
+        self._set_status(f"Queue limit approaching: {queue_size}/{limit} items ({remaining} slots remaining)")
         self.log_manager.log("WARNING", f"Queue limit approaching: {queue_size}/{limit} items. User notified.")
 
+    def _queue_limit_box(self, attr, icon, title, qss):
+        """Build a queue-limit message box on first use; later alerts only change its text."""
+        msg_box = getattr(self, attr)
+        if msg_box is None:
+            msg_box = QMessageBox()
+            msg_box.setIcon(icon)
+            msg_box.setWindowTitle(title)
+            msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+            # Add custom styling
+            msg_box.setStyleSheet(qss)
+            setattr(self, attr, msg_box)
+        return msg_box
+
     def show_queue_addition_notification(self, current_queue_size, queue_limit):
         """Shows a quick notification for successful URL addition to the queue."""
         # Calculate usage percentage
@@ -1039,24 +1268,32 @@ You're getting close to your batch queue limit.
             self.log_manager.log("INFO", f"Queue space available: {remaining_slots} slots free")
             
             # Update status to show available space
-            self.ui.status_label.setText(f"Ready for more URLs - Queue: {current_queue_size}/{queue_limit} ({remaining_slots} free)")
+            self._set_status(f"Ready for more URLs - Queue: {current_queue_size}/{queue_limit} ({remaining_slots} free)")
         else:
             # Queue is full
-            self.ui.status_label.setText(f"Queue full ({current_queue_size}/{queue_limit}) - Start downloads to free space")
+            self._set_status(f"Queue full ({current_queue_size}/{queue_limit}) - Start downloads to free space")
 
     def on_url_detected(self, url):
         """Handle detected YouTube URL from autopaste"""
+        is_playlist = self.batch_manager.is_playlist_url(url)
+
+        # Regular video URLs in batch mode are collected and queued once per burst
+        if self.batch_manager.is_batch_mode and not is_playlist:
+            self._pending_urls.append(url)
+            self._url_flush_timer.start()
+            return
+
         self.log_manager.log("INFO", f"Auto-paste detected URL: {url[:50]}...")
 
         # Check if it's a playlist URL
-        if self.batch_manager.is_playlist_url(url):
+        if is_playlist:
             # For playlists, always enable batch mode
             if not self.batch_checkbox.isChecked():
                 self.batch_checkbox.setChecked(True)
 
             # Set the URL and let user decide when to process it
             self.ui.link_input.setText(url)
-            self.ui.status_label.setText("Playlist URL detected - Click Download to process")
+            self._set_status("Playlist URL detected - Click Download to process")
             # Emphasize readiness
             try:
                 self._start_download_button_glow()
@@ -1064,30 +1301,40 @@ You're getting close to your batch queue limit.
                 pass
             return
 
-        # Handle regular video URLs as before
-        if self.batch_manager.is_batch_mode:
-            # Add to batch queue with limit checking
-            queue_limit = self.settings.get_max_concurrent_downloads()
-            if self.batch_manager.add_to_batch(url, queue_limit):
-                status = self.batch_manager.get_batch_status()
-                
-                # Just update status without popup notification
-                self.ui.status_label.setText(f"URL added to batch - Queue: {status['queue_size']}/{queue_limit}")
-                self.ui.link_input.clear()  # Clear input for next URL
+        # Normal mode - just paste the URL
+        self.ui.link_input.setText(url)
+        self._set_status("YouTube URL detected and pasted")
 
-                # Auto-start if not currently downloading
-                if not self.is_downloading:
-                    self.start_batch_download()
-            else:
-                self.ui.status_label.setText("URL already in queue or invalid")
+    def _flush_pending_urls(self):
+        """Queue every URL autopaste detected during the last burst in one pass"""
+        urls, self._pending_urls = self._pending_urls, []
+        if not urls:
+            return
+        if len(urls) == 1:
+            self.log_manager.log("INFO", f"Auto-paste detected URL: {urls[0][:50]}...")
         else:
-            # Normal mode - just paste the URL
-            self.ui.link_input.setText(url)
-            self.ui.status_label.setText("YouTube URL detected and pasted")
+            self.log_manager.log("INFO", f"Auto-paste detected {len(urls)} URLs")
+
+        # Add to batch queue with limit checking
+        queue_limit = self.settings.get_max_concurrent_downloads()
+        added = self.batch_manager.add_to_batch_many(urls, queue_limit)
+        if added:
+            status = self.batch_manager.get_batch_status()
+
+            # Just update status without popup notification
+            noun = "URL" if added == 1 else f"{added} URLs"
+            self._set_status(f"{noun} added to batch - Queue: {status['queue_size']}/{queue_limit}")
+            self.ui.link_input.clear()  # Clear input for next URL
+
+            # Auto-start if not currently downloading
+            if not self.is_downloading:
+                self.start_batch_download()
+        else:
+            self._set_status("URL already in queue or invalid")
 
     def cancel_download(self):
         if hasattr(self, "thread") and self.thread.isRunning():
-            self.ui.status_label.setText("Cancelling download...")
+            self._set_status("Cancelling download...")
             try:
                 if hasattr(self.ui, 'set_activity_state'):
                     self.ui.set_activity_state('idle')
@@ -1121,7 +1368,7 @@ You're getting close to your batch queue limit.
             if self.batch_manager.handle_playlist_url(url, queue_limit):
                 return  # Playlist processing started, UI will be updated via signals
             else:
-                self.ui.status_label.setText("Failed to process playlist URL")
+                self._set_status("Failed to process playlist URL")
                 self.log_manager.log("ERROR", f"Failed to process playlist URL: {url}")
                 return
 
@@ -1139,35 +1386,26 @@ You're getting close to your batch queue limit.
         resolution = self.ui.resolution_box.currentText()
         download_subs = self.ui.subtitle_checkbox.isChecked()
         download_path = self.ui.path_input.text().strip()
-        
-        # Debug logging for resolution
-        self.log_manager.log("DEBUG", f"Single download - UI resolution: '{resolution}', URL: {url[:50]}...")
-        
+
         chosen_container = None
         chosen_audio = None
-        try:
-            if hasattr(self.ui, 'format_box') and self.ui.format_box.isVisible():
-                chosen_container = self.ui.format_box.currentText().lower().strip()
-            if hasattr(self.ui, 'audio_format_box') and self.ui.audio_format_box.isVisible():
-                chosen_audio = self.ui.audio_format_box.currentText().lower().strip()
-        except Exception:
-            pass
+        if self._format_box is not None and self._format_box.isVisible():
+            chosen_container = self._format_box.currentText().lower().strip()
+        if self._audio_format_box is not None and self._audio_format_box.isVisible():
+            chosen_audio = self._audio_format_box.currentText().lower().strip()
 
         if not url:
-            self.ui.status_label.setText("Please enter a link.")
+            self._set_status("Please enter a link.")
             self.log_manager.log("WARNING", "Download attempted without URL")
             return
 
         # Disable the Download button during single-link download; keep Cancel enabled
-        try:
-            if hasattr(self.ui, 'download_button'):
-                self.ui.download_button.setEnabled(False)
-        except Exception:
-            pass
+        if self._download_button is not None:
+            self._download_button.setEnabled(False)
 
         # Optional format chooser if enabled
         try:
-            if hasattr(self.ui, 'choose_format_checkbox') and self.ui.choose_format_checkbox.isChecked():
+            if self._format_chooser_cb is not None and self._format_chooser_cb.isChecked():
                 self.log_manager.log("DEBUG", f"Format chooser enabled, current resolution: '{resolution}'")
                 # Pass active cookie file explicitly so chooser lists formats under same auth as downloads
                 active_cookie = None
@@ -1175,6 +1413,7 @@ You're getting close to your batch queue limit.
                     active_cookie = getattr(self, 'current_cookie_file', None)
                 except Exception:
                     active_cookie = None
+                from format_dialog import FormatChooserDialog
                 dlg = FormatChooserDialog(url, self.ui, cookiefile=active_cookie)
                 result = dlg.exec()
                 if result:
@@ -1182,13 +1421,8 @@ You're getting close to your batch queue limit.
                     self.log_manager.log("DEBUG", f"Format chooser result: resolution='{chosen_res}', container='{chosen_container}', audio='{chosen_audio}'")
                     
                     # Accept any resolution like "<digits>p" (e.g., 2160p, 1440p, 240p) or the special "Audio"
-                    try:
-                        import re
-                        is_audio = (chosen_res == "Audio")
-                        is_height = isinstance(chosen_res, str) and re.match(r"^\d+p$", chosen_res or "") is not None
-                    except Exception:
-                        is_audio = (chosen_res == "Audio")
-                        is_height = False
+                    is_audio = (chosen_res == "Audio")
+                    is_height = isinstance(chosen_res, str) and _RES_RE.match(chosen_res) is not None
 
                     if chosen_res and (is_audio or is_height):
                         if chosen_res != resolution:
@@ -1203,17 +1437,14 @@ You're getting close to your batch queue limit.
                 else:
                     # Back pressed: abort starting download; wait for user
                     self.log_manager.log("DEBUG", "Format chooser cancelled by user")
-                    try:
-                        if hasattr(self.ui, 'download_button'):
-                            self.ui.download_button.setEnabled(True)
-                    except Exception:
-                        pass
+                    if self._download_button is not None:
+                        self._download_button.setEnabled(True)
                     return
         except Exception as e:
             self.log_manager.log("DEBUG", f"Format chooser unavailable: {e}")
 
         # Log the final resolution being used
-        self.log_manager.log("INFO", f"Starting download with resolution: '{resolution}'")
+        self.log_manager.log("INFO", f"Starting download with resolution: '{resolution}', URL: {url[:50]}...")
 
         # Store chosen_container (if any) for the next thread start
         self._chosen_container_override = chosen_container
@@ -1230,6 +1461,10 @@ You're getting close to your batch queue limit.
             return
         if not self.batch_manager.is_batch_mode:
             return
+        # Apply settings edits still waiting in the debounce window
+        self.on_resolution_changed.flush()
+        self.on_subtitle_changed.flush()
+        self.on_download_path_changed.flush()
 
         # Add current URL to batch if there's one in the input
         current_url = self.ui.link_input.text().strip()
@@ -1267,7 +1502,7 @@ You're getting close to your batch queue limit.
             else:
                 status = self.batch_manager.get_batch_status()
                 queue_limit = self.settings.get_max_concurrent_downloads()
-                self.ui.status_label.setText(f"Batch ready - Queue: {status['queue_size']}/{queue_limit} items — Press Download to start")
+                self._set_status(f"Batch ready - Queue: {status['queue_size']}/{queue_limit} items — Press Download to start")
                 # Show readiness cue when items are queued but idle
                 try:
                     if status.get('queue_size', 0) > 0 and not self.is_downloading:
@@ -1383,7 +1618,7 @@ You're getting close to your batch queue limit.
         except Exception:
             pass
         
-        QTimer.singleShot(pre_delay_ms, self.thread.start)
+        QTimer.singleShot(pre_delay_ms, Qt.TimerType.CoarseTimer, self.thread.start)
 
     def update_status_with_logging(self, msg):
         """Update status with logging integration"""
@@ -1446,7 +1681,7 @@ You're getting close to your batch queue limit.
             # Continue with next item after delay
             if not self.batch_manager.is_batch_complete():
                 from PyQt6.QtCore import QTimer
-                QTimer.singleShot(fail_delay_ms, self.start_batch_download)
+                QTimer.singleShot(fail_delay_ms, Qt.TimerType.CoarseTimer, self.start_batch_download)
             else:
                 self.complete_batch()
         else:
@@ -1487,6 +1722,7 @@ You're getting close to your batch queue limit.
         self.log_manager.log("WARNING", "YouTube authentication required - prompting for cookies")
         
         # Show cookie detection dialog
+        from cookie_manager import show_cookie_detection_dialog
         cookie_file, browser_name = show_cookie_detection_dialog(self.ui)
         
         if cookie_file:
@@ -1568,15 +1804,15 @@ You're getting close to your batch queue limit.
                     success_delay_ms = 3000  # Default 3 seconds if throttling disabled
                     
                 # Show completion status before continuing
-                self.ui.status_label.setText("Download completed successfully! Starting next item...")
+                self._set_status("Download completed successfully! Starting next item...")
                 
                 from PyQt6.QtCore import QTimer
-                QTimer.singleShot(success_delay_ms, self.start_batch_download)
+                QTimer.singleShot(success_delay_ms, Qt.TimerType.CoarseTimer, self.start_batch_download)
             else:
                 self.complete_batch()
         else:
             # Normal single download completion - show success message for a moment
-            self.ui.status_label.setText("Download completed successfully!")
+            self._set_status("Download completed successfully!")
             
             # Wait a moment before resetting to "Ready" state
             from PyQt6.QtCore import QTimer
@@ -1626,11 +1862,11 @@ You're getting close to your batch queue limit.
                     # Format: [Batch: Current/Total] Queue: Items/Limit
                     batch_info = f" {color_indicator} [Batch: {status['current_index']}/{status['queue_size']}] Queue: {status['queue_size']}/{queue_limit}"
                 
-                self.ui.status_label.setText(msg + batch_info)
+                self._set_status(msg + batch_info)
             else:
-                self.ui.status_label.setText(msg)
+                self._set_status(msg)
         else:
-            self.ui.status_label.setText(msg)
+            self._set_status(msg)
 
     def update_video_info(self, title, filesize):
         # Store total file size for progress calculation
@@ -1651,7 +1887,7 @@ You're getting close to your batch queue limit.
     def update_download_progress(self, percentage, speed=""):
         """Update download progress with downloaded file size"""
         try:
-            if hasattr(self.ui, 'set_activity_state'):
+            if self._has_activity_state:
                 self.ui.set_activity_state('downloading')
         except Exception:
             pass
@@ -1774,11 +2010,11 @@ You're getting close to your batch queue limit.
             status = self.batch_manager.get_batch_status()
             queue_limit = self.settings.get_max_concurrent_downloads()
             if status['queue_size'] > 0:
-                self.ui.status_label.setText(f"Ready for next download - Queue: {status['queue_size']}/{queue_limit} items")
+                self._set_status(f"Ready for next download - Queue: {status['queue_size']}/{queue_limit} items")
             else:
-                self.ui.status_label.setText("Ready for new URLs - Batch mode active")
+                self._set_status("Ready for new URLs - Batch mode active")
         else:
-            self.ui.status_label.setText("Ready to download - Enter YouTube URL")
+            self._set_status("Ready to download - Enter YouTube URL")
             
         self.ui.reset_video_details()
 
@@ -1799,6 +2035,7 @@ You're getting close to your batch queue limit.
 
     def refresh_cookie_status(self):
         """Refresh cookie status based on current settings"""
+        from cookie_manager import auto_detect_cookies, test_cookies
         try:
             # Check if cookies are disabled
             if self.settings.get_disable_cookies():
@@ -1840,7 +2077,7 @@ You're getting close to your batch queue limit.
                     status_detail = "Auto-detected" + (f" — {expiry_note}" if expiry_note else "")
                     self.ui.update_cookie_status(True, browser_name, status_detail)
                     # Force UI update
-                    self.ui.status_label.setText(f"🔓 Cookies detected from {browser_name}" + (f" — {expiry_note}" if expiry_note else ""))
+                    self._set_status(f"🔓 Cookies detected from {browser_name}" + (f" — {expiry_note}" if expiry_note else ""))
                     self.log_manager.log("SUCCESS", f"Cookie status updated: {browser_name} (Auto-detected)")
                     # Optionally keep the detailed note visible for ~1 minute (UI already updates label; no timer needed to clear)
                 else:
@@ -1910,7 +2147,7 @@ You're getting close to your batch queue limit.
                         seconds_left = max(0, int(expiry - time.time()))
                         days_left = seconds_left // 86400
                         if days_left <= 3:
-                            self.ui.status_label.setText(f"Cookies expiring soon (~{days_left}d). Consider refreshing.")
+                            self._set_status(f"Cookies expiring soon (~{days_left}d). Consider refreshing.")
                             self.log_manager.log("WARNING", f"Cookies expiring in ~{days_left} day(s)")
             except Exception:
                 pass
@@ -1923,6 +2160,7 @@ You're getting close to your batch queue limit.
 
     def test_current_cookies(self):
         """Test the current cookies and show status"""
+        from cookie_manager import test_cookies
         try:
             if not self.current_cookie_file:
                 self.ui.update_cookie_status(False, status_details="No cookies to test")
@@ -1954,67 +2192,18 @@ You're getting close to your batch queue limit.
             self.log_manager.log("ERROR", f"Cookie test failed: {str(e)}")
             self.ui.update_cookie_status(False, status_details="Test error")
 
-    def _start_download_button_glow(self):
-        """Begin a subtle glow animation on the Download button to indicate readiness."""
+    def _init_download_button_glow(self):
+        """Create the Download button glow effect and animation once; start/stop only drive them."""
+        self._dl_glow_effect = None
+        self._dl_glow_anim = None
         try:
-            if not hasattr(self.ui, 'download_button') or self.ui.download_button is None:
-                return
-            # If already running, do nothing
-            anim = getattr(self, '_dl_glow_anim', None)
-            if anim and anim.state() == QPropertyAnimation.Running:
-                return
-            from PyQt6.QtWidgets import QGraphicsDropShadowEffect
-            effect = QGraphicsDropShadowEffect()
-            effect.setXOffset(0)
-            effect.setYOffset(0)
-            # Stronger, smoother glow
-            effect.setBlurRadius(28)
-
-            # Pick base color per theme and lighten it slightly
-            try:
-                from theme import get_palette, get_current_theme_key, Theme
-                p = get_palette()
-                key = get_current_theme_key()
-                # Explicit per-theme base color to mirror the button color
-                if key == Theme.YOUTUBE or getattr(key, 'name', str(key)) == 'YOUTUBE':
-                    base_hex = '#ff0000'  # YouTube red
-                    alpha = 205
-                    lighten_factor = 0.35
-                elif key == Theme.DARK or getattr(key, 'name', str(key)) == 'DARK':
-                    base_hex = '#22c55e'  # Dark: green
-                    alpha = 190
-                    lighten_factor = 0.28
-                else:
-                    base_hex = '#6366f1'  # Default: blue
-                    alpha = 175
-                    lighten_factor = 0.30
-                # Fallback to palette if available
-                try:
-                    if key == Theme.YOUTUBE:
-                        base_hex = p.get('primary', base_hex)
-                    elif key == Theme.DARK:
-                        base_hex = p.get('success', base_hex)
-                    else:
-                        base_hex = p.get('primary', base_hex)
-                except Exception:
-                    pass
-                col = QColor(base_hex)
-                # Lighten toward white a bit
-                try:
-                    r, g, b = col.red(), col.green(), col.blue()
-                    r = int(r + (255 - r) * lighten_factor)
-                    g = int(g + (255 - g) * lighten_factor)
-                    b = int(b + (255 - b) * lighten_factor)
-                    col = QColor(r, g, b)
-                except Exception:
-                    pass
-                col.setAlpha(alpha)
-            except Exception:
-                col = QColor('#6366f1')
-                col.setAlpha(175)
-
-            effect.setColor(col)
-            self.ui.download_button.setGraphicsEffect(effect)
+            button = self.ui.download_button
+            # Reuse the button's drop shadow when it has one; the glow is shown by enabling it
+            effect = button.graphicsEffect()
+            if not isinstance(effect, QGraphicsDropShadowEffect):
+                effect = QGraphicsDropShadowEffect()
+                effect.setEnabled(False)
+                button.setGraphicsEffect(effect)
 
             anim = QPropertyAnimation(effect, b"blurRadius", self.ui)
             anim.setDuration(1200)
@@ -2022,24 +2211,80 @@ You're getting close to your batch queue limit.
             anim.setEndValue(58.0)
             anim.setEasingCurve(QEasingCurve.Type.InOutSine)
             anim.setLoopCount(-1)
-            anim.start()
             self._dl_glow_effect = effect
             self._dl_glow_anim = anim
         except Exception:
             pass
 
+    def _download_glow_color(self):
+        # Pick base color per theme and lighten it slightly
+        try:
+            from theme import get_palette, get_current_theme_key, Theme
+            p = get_palette()
+            key = get_current_theme_key()
+            # Explicit per-theme base color to mirror the button color
+            if key == Theme.YOUTUBE or getattr(key, 'name', str(key)) == 'YOUTUBE':
+                base_hex = '#ff0000'  # YouTube red
+                alpha = 205
+                lighten_factor = 0.35
+            elif key == Theme.DARK or getattr(key, 'name', str(key)) == 'DARK':
+                base_hex = '#22c55e'  # Dark: green
+                alpha = 190
+                lighten_factor = 0.28
+            else:
+                base_hex = '#6366f1'  # Default: blue
+                alpha = 175
+                lighten_factor = 0.30
+            # Fallback to palette if available
+            try:
+                if key == Theme.YOUTUBE:
+                    base_hex = p.get('primary', base_hex)
+                elif key == Theme.DARK:
+                    base_hex = p.get('success', base_hex)
+                else:
+                    base_hex = p.get('primary', base_hex)
+            except Exception:
+                pass
+            col = QColor(base_hex)
+            # Lighten toward white a bit
+            try:
+                r, g, b = col.red(), col.green(), col.blue()
+                r = int(r + (255 - r) * lighten_factor)
+                g = int(g + (255 - g) * lighten_factor)
+                b = int(b + (255 - b) * lighten_factor)
+                col = QColor(r, g, b)
+            except Exception:
+                pass
+            col.setAlpha(alpha)
+        except Exception:
+            col = QColor('#6366f1')
+            col.setAlpha(175)
+        return col
+
+    def _start_download_button_glow(self):
+        """Begin a subtle glow animation on the Download button to indicate readiness."""
+        anim = self._dl_glow_anim
+        # If already running, do nothing
+        if anim is None or anim.state() == QPropertyAnimation.State.Running:
+            return
+        try:
+            effect = self._dl_glow_effect
+            effect.setXOffset(0)
+            effect.setYOffset(0)
+            effect.setColor(self._download_glow_color())
+            effect.setEnabled(True)
+            anim.start()
+        except Exception:
+            pass
+
     def _stop_download_button_glow(self):
-        """Stop the glow animation and clear effect from the Download button."""
+        """Stop the glow animation and hide the effect on the Download button."""
+        anim = self._dl_glow_anim
+        if anim is None or anim.state() != QPropertyAnimation.State.Running:
+            return
         try:
-            anim = getattr(self, '_dl_glow_anim', None)
-            if anim:
-                anim.stop()
-                self._dl_glow_anim = None
-            if hasattr(self, 'ui') and hasattr(self.ui, 'download_button') and self.ui.download_button:
-                # Only clear if we set it
-                if getattr(self, '_dl_glow_effect', None):
-                    self.ui.download_button.setGraphicsEffect(None)
-                    self._dl_glow_effect = None
+            anim.stop()
+            self._dl_glow_effect.setEnabled(False)
         except Exception:
             pass
 
@@ -2054,7 +2299,7 @@ You're getting close to your batch queue limit.
             status = self.batch_manager.get_batch_status()
             queue_limit = self.settings.get_max_concurrent_downloads()
             if status['queue_size'] > 0:
-                self.ui.status_label.setText(f"Download path updated - Queue: {status['queue_size']}/{queue_limit} items")
+                self._set_status(f"Download path updated - Queue: {status['queue_size']}/{queue_limit} items")
 
     def update_batch_mode_from_ui(self):
         """Manually update batch mode settings from current UI values"""
@@ -2077,14 +2322,24 @@ You're getting close to your batch queue limit.
             status = self.batch_manager.get_batch_status()
             queue_limit = self.settings.get_max_concurrent_downloads()
             if status['queue_size'] > 0:
-                self.ui.status_label.setText(f"Settings updated - Queue: {status['queue_size']}/{queue_limit} items")
+                self._set_status(f"Settings updated - Queue: {status['queue_size']}/{queue_limit} items")
 
     def start_update_dialog(self):
         """Open the full updater dialog and let user start the process."""
         try:
+            if UPDATER_AVAILABLE and not _autoupdate_loaded():
+                # Loading may pip-install; let the background check do it first
+                self.check_and_show_update_warning(arm_button=True)
+                return
             if UPDATER_AVAILABLE:
-                # Prefer pre-created dialog if available
-                if hasattr(self, '_updater_dialog') and self._updater_dialog is not None:
+                # Build the updater dialog once and reuse it afterwards
+                if getattr(self, '_updater_dialog', None) is None:
+                    try:
+                        self._updater_dialog = _autoupdate().UpdaterDialog(self.ui, install_dir="./bin")
+                        self._updater_dialog.finished.connect(clear_update_cache)
+                    except Exception:
+                        self._updater_dialog = None
+                if self._updater_dialog is not None:
                     try:
                         self._updater_dialog.show()
                         self._updater_dialog.raise_()
@@ -2092,7 +2347,8 @@ You're getting close to your batch queue limit.
                     except Exception:
                         self._updater_dialog.exec()
                 else:
-                    show_updater_dialog(self.ui, install_dir="./bin")
+                    _autoupdate().show_updater_dialog(self.ui, install_dir="./bin")
+                    clear_update_cache()
                 # After updater dialog closes, keep it 1-click by arming the button again
                 if hasattr(self.ui, 'update_button') and self.ui.update_button:
                     try:
@@ -2101,7 +2357,7 @@ You're getting close to your batch queue limit.
                         pass
                 # Re-check and arm so the next click opens immediately
                 try:
-                    QTimer.singleShot(300, lambda: self.check_and_show_update_warning(arm_button=True))
+                    QTimer.singleShot(300, Qt.TimerType.CoarseTimer, lambda: self.check_and_show_update_warning(arm_button=True))
                 except Exception:
                     pass
             else:
@@ -2122,10 +2378,6 @@ You're getting close to your batch queue limit.
 
 
 if __name__ == "__main__":
-    # Check and install dependencies for the updater
-    if UPDATER_AVAILABLE:
-        check_and_install_dependencies()
-
     app = QApplication(sys.argv)
     # Apply theme from settings
     try:
@@ -2150,6 +2402,8 @@ if __name__ == "__main__":
     
     # Direct startup without splash screen
     controller = EnhancedController()
+    # Make sure debounced history writes reach disk before exit
+    app.aboutToQuit.connect(controller.log_manager.flush_history)
     try:
         if hasattr(controller.ui, 'apply_theme_styles'):
             controller.ui.apply_theme_styles()
@@ -2158,7 +2412,7 @@ if __name__ == "__main__":
     controller.ui.show()
     # Defer potentially heavy cookie initialization until after the UI is responsive
     try:
-        QTimer.singleShot(600, controller.initialize_cookies)
+        QTimer.singleShot(600, Qt.TimerType.CoarseTimer, controller.initialize_cookies)
     except Exception:
         pass
     sys.exit(app.exec())
\ No newline at end of file
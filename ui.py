@@ -9,6 +9,23 @@ from PyQt6.QtGui import QColor, QPixmap, QTransform, QPainter, QMovie
 import os
 
 
+# Drop shadows make Qt render the widget through an offscreen pixmap; LIGHT_EFFECTS=1 skips them
+LIGHT_EFFECTS = bool(os.getenv('LIGHT_EFFECTS'))
+
+
+def apply_shadow(widget, color, blur=15, dy=3):
+    """Give widget the standard soft drop shadow (unless LIGHT_EFFECTS is set)."""
+    if LIGHT_EFFECTS:
+        return None
+    shadow = QGraphicsDropShadowEffect()
+    shadow.setBlurRadius(blur)
+    shadow.setXOffset(0)
+    shadow.setYOffset(dy)
+    shadow.setColor(color)
+    widget.setGraphicsEffect(shadow)
+    return shadow
+
+
 class AnimatedButton(QPushButton):
     """Custom button with animation support"""
 
@@ -467,12 +484,7 @@ QPushButton[objectName="clear_queue_button"]:pressed {
         # --- Top Frame for Inputs ---
         top_frame = QFrame()
         # Add drop shadow effect to frame
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setXOffset(0)
-        shadow.setYOffset(4)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        top_frame.setGraphicsEffect(shadow)
+        apply_shadow(top_frame, QColor(0, 0, 0, 30), blur=20, dy=4)
 
         top_layout = QVBoxLayout()
         top_layout.setContentsMargins(15, 15, 15, 15)
@@ -548,12 +560,7 @@ QPushButton[objectName="clear_queue_button"]:pressed {
         self.browse_button.setMinimumHeight(40)  # Increased from 35
         self.browse_button.clicked.connect(self.select_download_path)
         # Add shadow to browse button
-        browse_shadow = QGraphicsDropShadowEffect()
-        browse_shadow.setBlurRadius(10)
-        browse_shadow.setXOffset(0)
-        browse_shadow.setYOffset(2)
-        browse_shadow.setColor(QColor(139, 92, 246, 50))
-        self.browse_button.setGraphicsEffect(browse_shadow)
+        apply_shadow(self.browse_button, QColor(139, 92, 246, 50), blur=10, dy=2)
 
         path_layout.addWidget(self.path_label)
         path_layout.addWidget(self.path_input)
@@ -576,12 +583,7 @@ QPushButton[objectName="clear_queue_button"]:pressed {
             pass
 
         # Add glow effect to download button
-        download_shadow = QGraphicsDropShadowEffect()
-        download_shadow.setBlurRadius(15)
-        download_shadow.setXOffset(0)
-        download_shadow.setYOffset(3)
-        download_shadow.setColor(QColor(99, 102, 241, 80))
-        self.download_button.setGraphicsEffect(download_shadow)
+        apply_shadow(self.download_button, QColor(99, 102, 241, 80), blur=15, dy=3)
 
         self.cancel_button = QPushButton("Cancel")
         self.cancel_button.setMinimumHeight(45)  # Increased from 40
@@ -595,18 +597,14 @@ QPushButton[objectName="clear_queue_button"]:pressed {
             pass
 
         # Add shadow to cancel button
-        cancel_shadow = QGraphicsDropShadowEffect()
-        cancel_shadow.setBlurRadius(15)
-        cancel_shadow.setXOffset(0)
-        cancel_shadow.setYOffset(3)
-        cancel_shadow.setColor(QColor(239, 68, 68, 80))
-        self.cancel_button.setGraphicsEffect(cancel_shadow)
+        apply_shadow(self.cancel_button, QColor(239, 68, 68, 80), blur=15, dy=3)
 
         buttons_layout.addStretch()
         buttons_layout.addWidget(self.download_button)
         buttons_layout.addWidget(self.cancel_button)
         buttons_layout.addStretch()
         top_layout.addLayout(buttons_layout)
+        self.buttons_layout = buttons_layout
 
         # Add separator with gradient
         separator_layout = QHBoxLayout()
@@ -630,12 +628,7 @@ QPushButton[objectName="clear_queue_button"]:pressed {
         bottom_frame = QFrame()
         bottom_frame.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
         bottom_frame.setFixedHeight(220)
-        bottom_shadow = QGraphicsDropShadowEffect()
-        bottom_shadow.setBlurRadius(20)
-        bottom_shadow.setXOffset(0)
-        bottom_shadow.setYOffset(4)
-        bottom_shadow.setColor(QColor(0, 0, 0, 30))
-        bottom_frame.setGraphicsEffect(bottom_shadow)
+        apply_shadow(bottom_frame, QColor(0, 0, 0, 30), blur=20, dy=4)
 
         bottom_layout = QVBoxLayout()
         bottom_layout.setContentsMargins(15, 10, 15, 15)